@@ -6,26 +6,177 @@ multiple pipelines and datasets for algorithm comparison.
 
 Usage:
     python -m benchmarks.run_all configs/batch/classical_vs_ml.yaml
+    python -m benchmarks.run_all configs/batch/classical_vs_ml.yaml --workers 4
     
     or programmatically:
     
     from benchmarks.run_all import run_benchmark
     results = run_benchmark("configs/batch/classical_vs_ml.yaml")
 """
+import argparse
+import copy
+import csv
+import importlib
 import json
+import math
 import os
-import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
+from multiprocessing.shared_memory import SharedMemory
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # libyaml bindings not available
+    from yaml import SafeLoader
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+
+def _all_finite(obj: Any) -> bool:
+    """Whether no float in ``obj`` (nested dicts, lists, NumPy values) is NaN or inf."""
+    if isinstance(obj, dict):
+        return all(_all_finite(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return all(_all_finite(v) for v in obj)
+    if isinstance(obj, float):
+        return math.isfinite(obj)
+    if hasattr(obj, "tolist"):  # NumPy scalar or array
+        return _all_finite(obj.tolist())
+    return True
+
+
+def _to_builtin(obj: Any) -> Any:
+    """``json.dumps`` hook for NumPy scalars and arrays."""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize ``obj`` to JSON bytes, with orjson when it is installed.
+    
+    orjson writes NaN and inf as null, so results holding them (an inf SNR
+    for a perfect reconstruction) go through the stdlib, which writes
+    NaN/Infinity and reads them back as floats.
+    """
+    if orjson is not None and _all_finite(obj):
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, default=_to_builtin).encode()
+
+CSV_BASE_FIELDS = ["dataset", "pipeline", "status", "duration_seconds"]
+
+# Heavy modules needed by run_single_pipeline, imported once per process
+PIPELINE_MODULES = (
+    "numpy",
+    "promethium.io.readers",
+    "promethium.pipelines.recovery",
+    "promethium.evaluation.metrics",
+)
+
+_module_cache: Dict[str, ModuleType] = {}
+
+# A benchmark job: (dataset_id, pipeline_config, dataset_path, reference_path, output_dir)
+BenchmarkJob = Tuple[str, Dict[str, Any], str, Optional[str], Path]
+
+# Shared-memory dataset handle passed to workers: (segment name, shape, dtype)
+SharedArraySpec = Tuple[str, Tuple[int, ...], str]
+
+# What a worker needs to rebuild a dataset around its sample array:
+# ("array", None), ("traces", container with traces=None) or
+# ("xarray", (dims, coords, name, attrs))
+DatasetShell = Tuple[str, Any]
+
 
 def load_benchmark_config(config_path: Path) -> Dict[str, Any]:
-    """Load benchmark configuration from YAML file."""
+    """
+    Load benchmark configuration from YAML file.
+    
+    The parsed configuration is cached in a JSON sidecar
+    (``<config>.yaml.cache.json``) keyed on the YAML file's mtime and size,
+    so repeated runs against an unchanged config skip YAML parsing.
+    """
+    config_path = Path(config_path)
+    stat = config_path.stat()
+    key = [stat.st_mtime_ns, stat.st_size]
+    cache_path = config_path.with_suffix(config_path.suffix + ".cache.json")
+    
+    if cache_path.exists():
+        try:
+            with open(cache_path, "r") as f:
+                cached = json.load(f)
+            if cached.get("_key") == key:
+                return cached["data"]
+        except (OSError, ValueError):
+            pass
+    
     with open(config_path, "r") as f:
-        return yaml.safe_load(f)
+        config = yaml.load(f, Loader=SafeLoader)
+    
+    # The cache is an optimization only; unwritable locations are ignored
+    try:
+        with open(cache_path, "w") as f:
+            json.dump({"_key": key, "data": config}, f)
+    except (OSError, TypeError):
+        pass
+    
+    return config
+
+
+def _lazy_import(name: str) -> ModuleType:
+    """Import a module once and serve later lookups from a module-level cache."""
+    module = _module_cache.get(name)
+    if module is None:
+        module = importlib.import_module(name)
+        _module_cache[name] = module
+    return module
+
+
+def _init_worker() -> None:
+    """Process pool initializer: pay the promethium/torch import cost up front."""
+    for name in PIPELINE_MODULES:
+        try:
+            _lazy_import(name)
+        except ImportError:
+            # Leave the error to surface from the job itself; a failing
+            # initializer would break the whole pool.
+            pass
+
+
+def _fused_error_metrics(reference: Any, recon: Any) -> Dict[str, float]:
+    """
+    Compute SNR and MSE from a single residual pass.
+    
+    Matches promethium.evaluation.metrics.signal_to_noise_ratio and
+    mean_squared_error, but reads ``reference`` and ``recon`` once instead of
+    once per metric. SSIM is windowed and stays a separate call.
+    """
+    np = _lazy_import("numpy")
+    
+    reference = np.asarray(reference, dtype=np.float64)
+    diff = reference - np.asarray(recon, dtype=np.float64)
+    
+    mse = float(np.vdot(diff, diff).real / diff.size)
+    signal_power = float(np.vdot(reference, reference).real / reference.size)
+    
+    if mse < 1e-10:
+        snr = float("inf")
+    else:
+        snr = float(10 * np.log10(signal_power / (mse + 1e-10)))
+    
+    return {"snr": snr, "mse": mse}
 
 
 def run_single_pipeline(
@@ -33,6 +184,7 @@ def run_single_pipeline(
     dataset_path: str,
     reference_path: Optional[str] = None,
     output_dir: Path = Path("results"),
+    dataset: Optional[Any] = None,
 ) -> Dict[str, Any]:
     """
     Run a single pipeline and collect metrics.
@@ -42,25 +194,25 @@ def run_single_pipeline(
         dataset_path: Path to input dataset.
         reference_path: Optional path to reference data.
         output_dir: Directory for outputs.
+        dataset: Optional preloaded dataset; skips loading ``dataset_path``.
         
     Returns:
         Dictionary with run results and metrics.
     """
-    from promethium.io.readers import load_seismic_data
-    from promethium.pipelines.recovery import SeismicRecoveryPipeline
-    from promethium.evaluation.metrics import (
-        signal_to_noise_ratio,
-        mean_squared_error,
-        structural_similarity_index,
-    )
-    import numpy as np
+    np = _lazy_import("numpy")
+    load_seismic_data = _lazy_import("promethium.io.readers").load_seismic_data
+    SeismicRecoveryPipeline = _lazy_import("promethium.pipelines.recovery").SeismicRecoveryPipeline
+    structural_similarity_index = _lazy_import(
+        "promethium.evaluation.metrics"
+    ).structural_similarity_index
     
     pipeline_name = pipeline_config["name"]
-    start_time = datetime.now()
+    start_ns = time.perf_counter_ns()
     
     try:
         # Load data
-        dataset = load_seismic_data(dataset_path)
+        if dataset is None:
+            dataset = load_seismic_data(dataset_path)
         
         # Create and run pipeline
         pipe = SeismicRecoveryPipeline(pipeline_name, {
@@ -69,18 +221,20 @@ def run_single_pipeline(
         
         reconstructed = pipe.run(dataset)
         
-        end_time = datetime.now()
-        duration = (end_time - start_time).total_seconds()
+        duration = (time.perf_counter_ns() - start_ns) / 1e9
         
         # Compute metrics if reference available
         metrics = {}
         if reference_path and Path(reference_path).exists():
-            reference = np.load(reference_path)
+            # Memory-map .npy references so parallel workers share the page cache
+            if str(reference_path).endswith(".npy"):
+                reference = np.load(reference_path, mmap_mode="r")
+            else:
+                reference = np.load(reference_path)
             recon_data = reconstructed.traces if hasattr(reconstructed, "traces") else np.array(reconstructed)
             
             metrics = {
-                "snr": float(signal_to_noise_ratio(reference, recon_data)),
-                "mse": float(mean_squared_error(reference, recon_data)),
+                **_fused_error_metrics(reference, recon_data),
                 "ssim": float(structural_similarity_index(reference, recon_data)),
             }
         
@@ -100,10 +254,185 @@ def run_single_pipeline(
         }
 
 
+def _preload_dataset(dataset_path: str) -> Optional[Any]:
+    """
+    Load a dataset once so it can be reused by every pipeline.
+    
+    Returns None on failure; each job then loads (and reports) on its own.
+    """
+    try:
+        return _lazy_import("promethium.io.readers").load_seismic_data(dataset_path)
+    except Exception:
+        return None
+
+
+def _share_array(array: Any) -> Tuple[SharedMemory, SharedArraySpec]:
+    """Copy an array into a new shared-memory segment."""
+    np = _lazy_import("numpy")
+    
+    array = np.ascontiguousarray(array)
+    shm = SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+    
+    return shm, (shm.name, array.shape, array.dtype.str)
+
+
+def _split_dataset(dataset: Any) -> Tuple[Any, DatasetShell]:
+    """Separate a dataset's sample array from the container around it."""
+    if hasattr(dataset, "traces"):
+        shell = copy.copy(dataset)
+        shell.traces = None
+        return dataset.traces, ("traces", shell)
+    
+    if hasattr(dataset, "dims") and hasattr(dataset, "coords"):  # xarray DataArray
+        meta = (dataset.dims, dataset.coords.to_dataset(), dataset.name, dict(dataset.attrs))
+        return dataset.values, ("xarray", meta)
+    
+    return dataset, ("array", None)
+
+
+def _join_dataset(array: Any, shell: DatasetShell) -> Any:
+    """Rebuild the dataset split by ``_split_dataset`` around ``array``."""
+    kind, meta = shell
+    
+    if kind == "traces":
+        dataset = copy.copy(meta)
+        dataset.traces = array
+        return dataset
+    
+    if kind == "xarray":
+        dims, coords, name, attrs = meta
+        return _lazy_import("xarray").DataArray(
+            array, coords=coords.coords, dims=dims, name=name, attrs=attrs,
+        )
+    
+    return array
+
+
+def _attach_array(shared: SharedArraySpec) -> Any:
+    """
+    Give a worker a private, writable view of a shared-memory array.
+    
+    Where the segment is visible as a file (/dev/shm on Linux) it is mapped
+    copy-on-write: pages are shared until the job writes to them, and
+    writes never reach the segment. Elsewhere the array is copied.
+    """
+    np = _lazy_import("numpy")
+    name, shape, dtype = shared
+    
+    segment_path = Path("/dev/shm") / name.lstrip("/")
+    if segment_path.exists() and np.prod(shape, dtype=np.int64) > 0:
+        return np.memmap(segment_path, dtype=dtype, mode="c", shape=shape).view(np.ndarray)
+    
+    shm = SharedMemory(name=name)
+    try:
+        return np.ndarray(shape, dtype=dtype, buffer=shm.buf).copy()
+    finally:
+        shm.close()
+
+
+def _run_job(
+    job: BenchmarkJob,
+    dataset: Optional[Any] = None,
+    shared: Optional[SharedArraySpec] = None,
+    shell: DatasetShell = ("array", None),
+) -> Dict[str, Any]:
+    """
+    Run one dataset/pipeline combination.
+    
+    Defined at module level so it can be pickled and dispatched to
+    worker processes. ``shared`` names a dataset array placed in shared
+    memory by the parent process; the worker rebuilds the dataset from it
+    and ``shell``, so pipelines see the same type as in a sequential run.
+    """
+    dataset_id, pipeline_config, dataset_path, reference_path, output_dir = job
+    
+    if shared is not None:
+        dataset = _join_dataset(_attach_array(shared), shell)
+    
+    result = run_single_pipeline(
+        pipeline_config,
+        dataset_path,
+        reference_path,
+        output_dir,
+        dataset=dataset,
+    )
+    
+    result["dataset"] = dataset_id
+    result["timestamp"] = datetime.now().isoformat()
+    
+    return result
+
+
+def _resolve_workers(workers: Optional[int], n_jobs: int) -> int:
+    """
+    Determine the number of worker processes for a sweep.
+    
+    Falls back to sequential execution when the VALIDATE environment
+    variable is set so that output ordering and timing stay deterministic.
+    """
+    if os.environ.get("VALIDATE"):
+        return 1
+    
+    if workers is None:
+        env_workers = os.environ.get("PARALLEL_WORKERS")
+        if env_workers:
+            workers = int(env_workers)
+        else:
+            workers = min(os.cpu_count() or 1, n_jobs)
+    
+    return max(1, min(workers, n_jobs))
+
+
+def _print_job_status(result: Dict[str, Any]) -> None:
+    """Print a one-line status for a finished job."""
+    if result["status"] == "success":
+        metrics = result.get("metrics", {})
+        snr = metrics.get("snr", "N/A")
+        print(f"OK (SNR: {snr:.2f} dB)" if isinstance(snr, float) else "OK")
+    else:
+        print(f"FAILED: {result.get('error', 'Unknown error')}")
+
+
+class _ResultStream:
+    """
+    Append benchmark results to a JSONL file as they finish.
+    
+    Each result is flushed immediately, so memory stays bounded by a single
+    result and a crashed sweep keeps everything completed so far. The CSV
+    is written from these results once the sweep ends, when the full set
+    of computed metrics is known.
+    """
+    
+    def __init__(self, jsonl_path: Path):
+        self.jsonl_path = jsonl_path
+        self._jsonl_file = open(jsonl_path, "wb")
+    
+    def write(self, result: Dict[str, Any]) -> None:
+        self._jsonl_file.write(_dumps(result) + b"\n")
+        self._jsonl_file.flush()
+    
+    def close(self) -> None:
+        self._jsonl_file.close()
+    
+    def __enter__(self) -> "_ResultStream":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def load_results_jsonl(path: Path) -> List[Dict[str, Any]]:
+    """Read back results streamed by a benchmark run."""
+    with open(path, "rb") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
 def run_benchmark(
     config_path: str,
     output_dir: Optional[str] = None,
     verbose: bool = True,
+    workers: Optional[int] = None,
 ) -> Dict[str, Any]:
     """
     Run a complete benchmark suite.
@@ -112,6 +441,8 @@ def run_benchmark(
         config_path: Path to benchmark configuration file.
         output_dir: Optional output directory override.
         verbose: Whether to print progress.
+        workers: Number of worker processes. Defaults to the PARALLEL_WORKERS
+            environment variable, or min(cpu_count, number of jobs).
         
     Returns:
         Benchmark results dictionary.
@@ -130,69 +461,128 @@ def run_benchmark(
     output_base = Path(output_dir) if output_dir else Path(config["output"]["results_dir"])
     output_base.mkdir(parents=True, exist_ok=True)
     
-    # Collect results
-    all_results = []
-    
     datasets = config.get("datasets", [])
     pipelines = config.get("pipelines", [])
     
-    for dataset_info in datasets:
-        dataset_id = dataset_info["id"]
-        dataset_path = dataset_info["path"]
-        reference_path = dataset_info.get("reference")
-        
-        if verbose:
-            print(f"\nDataset: {dataset_id}")
-            print("-" * 40)
-        
-        for pipeline_config in pipelines:
-            pipeline_name = pipeline_config["name"]
-            
+    jobs: List[BenchmarkJob] = [
+        (
+            dataset_info["id"],
+            pipeline_config,
+            dataset_info["path"],
+            dataset_info.get("reference"),
+            output_base,
+        )
+        for dataset_info in datasets
+        for pipeline_config in pipelines
+    ]
+    n_workers = _resolve_workers(workers, len(jobs))
+    
+    results_file = output_base / f"benchmark_{benchmark_name}_{timestamp}.json"
+    jsonl_file = results_file.with_suffix(".jsonl")
+    csv_file = None
+    if config["output"].get("save_csv", True):
+        csv_file = output_base / f"benchmark_{benchmark_name}_{timestamp}.csv"
+    
+    with _ResultStream(jsonl_file) as stream:
+        if n_workers == 1:
+            current_dataset = None
+            dataset = None
+            for job in jobs:
+                dataset_id, pipeline_config = job[0], job[1]
+                
+                if dataset_id != current_dataset:
+                    # Load each dataset once and reuse it across pipelines
+                    current_dataset = dataset_id
+                    dataset = _preload_dataset(job[2])
+                    
+                    if verbose:
+                        print(f"\nDataset: {dataset_id}")
+                        print("-" * 40)
+                
+                if verbose:
+                    print(f"  Running: {pipeline_config['name']}...", end=" ")
+                
+                # Each job gets its own copy, as each parallel worker does
+                result = _run_job(job, dataset=copy.deepcopy(dataset))
+                stream.write(result)
+                
+                if verbose:
+                    _print_job_status(result)
+        else:
             if verbose:
-                print(f"  Running: {pipeline_name}...", end=" ")
-            
-            result = run_single_pipeline(
-                pipeline_config,
-                dataset_path,
-                reference_path,
-                output_base,
-            )
-            
-            result["dataset"] = dataset_id
-            result["timestamp"] = datetime.now().isoformat()
+                print(f"\nRunning {len(jobs)} jobs on {n_workers} workers")
+                print("-" * 40)
             
-            all_results.append(result)
-            
-            if verbose:
-                if result["status"] == "success":
-                    metrics = result.get("metrics", {})
-                    snr = metrics.get("snr", "N/A")
-                    print(f"OK (SNR: {snr:.2f} dB)" if isinstance(snr, float) else "OK")
-                else:
-                    print(f"FAILED: {result.get('error', 'Unknown error')}")
+            # Load each dataset once in the parent and hand workers a
+            # shared-memory handle instead of having every job re-read it
+            segments: List[SharedMemory] = []
+            shared_specs: Dict[str, Tuple[SharedArraySpec, DatasetShell]] = {}
+            try:
+                for dataset_info in datasets:
+                    dataset = _preload_dataset(dataset_info["path"])
+                    if dataset is None:
+                        continue
+                    traces, shell = _split_dataset(dataset)
+                    if traces is None:
+                        continue
+                    shm, spec = _share_array(traces)
+                    segments.append(shm)
+                    shared_specs[dataset_info["id"]] = (spec, shell)
+                    del dataset, traces
+                
+                with ProcessPoolExecutor(
+                    max_workers=n_workers,
+                    initializer=_init_worker,
+                ) as executor:
+                    futures = []
+                    for job in jobs:
+                        spec, shell = shared_specs.get(job[0], (None, ("array", None)))
+                        futures.append(
+                            executor.submit(_run_job, job, shared=spec, shell=shell)
+                        )
+                    for future in as_completed(futures):
+                        result = future.result()
+                        stream.write(result)
+                        
+                        if verbose:
+                            print(f"  {result['dataset']} / {result['pipeline']}...", end=" ")
+                            _print_job_status(result)
+            finally:
+                for shm in segments:
+                    shm.close()
+                    shm.unlink()
+    
+    # Read the streamed results back for aggregation and the final JSON
+    all_results = load_results_jsonl(jsonl_file)
+    
+    if n_workers > 1:
+        # Restore submission order so output matches the sequential run
+        order = {}
+        for index, job in enumerate(jobs):
+            order.setdefault((job[0], job[1]["name"]), index)
+        all_results.sort(
+            key=lambda r: order.get((r.get("dataset"), r.get("pipeline")), len(jobs))
+        )
     
     # Aggregate results
     summary = generate_summary(all_results, config)
     
     # Save results
-    results_file = output_base / f"benchmark_{benchmark_name}_{timestamp}.json"
-    with open(results_file, "w") as f:
-        json.dump({
+    with open(results_file, "wb") as f:
+        f.write(_dumps({
             "benchmark": benchmark_name,
             "timestamp": timestamp,
             "config_path": str(config_path),
             "summary": summary,
             "results": all_results,
-        }, f, indent=2)
+        }, indent=True))
+    
+    if csv_file is not None:
+        save_results_csv(all_results, csv_file)
     
     if verbose:
         print(f"\nResults saved to: {results_file}")
-    
-    # Generate CSV
-    if config["output"].get("save_csv", True):
-        csv_file = output_base / f"benchmark_{benchmark_name}_{timestamp}.csv"
-        save_results_csv(all_results, csv_file)
-        if verbose:
+        if csv_file is not None:
             print(f"CSV saved to: {csv_file}")
     
     return {
@@ -205,34 +595,33 @@ def run_benchmark(
 
 def generate_summary(results: List[Dict], config: Dict) -> Dict[str, Any]:
     """Generate summary statistics from results."""
-    import statistics
+    from array import array
+    import numpy as np
     
-    # Group by pipeline
+    # Group by pipeline, accumulating metric values into packed double arrays
     by_pipeline = {}
     for result in results:
         if result["status"] != "success":
             continue
         
-        name = result["pipeline"]
-        if name not in by_pipeline:
-            by_pipeline[name] = {"metrics": {}}
-        
+        metrics = by_pipeline.setdefault(result["pipeline"], {})
         for metric, value in result.get("metrics", {}).items():
-            if metric not in by_pipeline[name]["metrics"]:
-                by_pipeline[name]["metrics"][metric] = []
-            by_pipeline[name]["metrics"][metric].append(value)
+            # Older result files hold null where a metric was NaN or inf
+            if isinstance(value, (int, float)):
+                metrics.setdefault(metric, array("d")).append(value)
     
     # Compute statistics
     summary = {}
-    for pipeline, data in by_pipeline.items():
+    for pipeline, metrics in by_pipeline.items():
         summary[pipeline] = {}
-        for metric, values in data["metrics"].items():
+        for metric, values in metrics.items():
             if values:
+                arr = np.frombuffer(values, dtype=np.float64)
                 summary[pipeline][metric] = {
-                    "mean": statistics.mean(values),
-                    "std": statistics.stdev(values) if len(values) > 1 else 0.0,
-                    "min": min(values),
-                    "max": max(values),
+                    "mean": float(arr.mean()),
+                    "std": float(arr.std(ddof=1)) if arr.size > 1 else 0.0,
+                    "min": float(arr.min()),
+                    "max": float(arr.max()),
                 }
     
     return summary
@@ -240,7 +629,7 @@ def generate_summary(results: List[Dict], config: Dict) -> Dict[str, Any]:
 
 def save_results_csv(results: List[Dict], output_path: Path) -> None:
     """Save results to CSV format."""
-    import csv
+    import io
     
     if not results:
         return
@@ -249,27 +638,36 @@ def save_results_csv(results: List[Dict], output_path: Path) -> None:
     all_metrics = set()
     for r in results:
         all_metrics.update(r.get("metrics", {}).keys())
+    metric_names = sorted(all_metrics)
+    
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_BASE_FIELDS + metric_names)
     
-    fieldnames = ["dataset", "pipeline", "status", "duration_seconds"] + sorted(all_metrics)
+    for result in results:
+        metrics = result.get("metrics", {})
+        writer.writerow([
+            result.get("dataset", ""),
+            result.get("pipeline", ""),
+            result.get("status", ""),
+            result.get("duration_seconds", ""),
+            *[metrics.get(metric, "") for metric in metric_names],
+        ])
     
     with open(output_path, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        
-        for result in results:
-            row = {
-                "dataset": result.get("dataset", ""),
-                "pipeline": result.get("pipeline", ""),
-                "status": result.get("status", ""),
-                "duration_seconds": result.get("duration_seconds", ""),
-            }
-            for metric in all_metrics:
-                row[metric] = result.get("metrics", {}).get(metric, "")
-            writer.writerow(row)
+        f.write(buffer.getvalue())
 
 
 def print_comparison_table(summary: Dict[str, Any]) -> None:
     """Print a formatted comparison table."""
+    missing = "N/A"
+    
+    # Get all metrics, sorted once for every row
+    all_metrics = set()
+    for data in summary.values():
+        all_metrics.update(data.keys())
+    sorted_metrics = sorted(all_metrics)
+    
     try:
         from rich.console import Console
         from rich.table import Table
@@ -280,49 +678,62 @@ def print_comparison_table(summary: Dict[str, Any]) -> None:
         # Add columns
         table.add_column("Pipeline", style="cyan")
         
-        # Get all metrics
-        all_metrics = set()
-        for data in summary.values():
-            all_metrics.update(data.keys())
-        
-        for metric in sorted(all_metrics):
+        for metric in sorted_metrics:
             table.add_column(metric.upper(), style="green")
         
         # Add rows
         for pipeline, metrics in summary.items():
             row = [pipeline]
-            for metric in sorted(all_metrics):
-                if metric in metrics:
-                    val = metrics[metric]["mean"]
-                    std = metrics[metric]["std"]
-                    row.append(f"{val:.4f} +/- {std:.4f}")
+            for metric in sorted_metrics:
+                stats = metrics.get(metric)
+                if stats is None:
+                    row.append(missing)
                 else:
-                    row.append("N/A")
+                    row.append(f"{stats['mean']:.4f} +/- {stats['std']:.4f}")
             table.add_row(*row)
         
         console.print(table)
         
     except ImportError:
-        # Fallback without rich
-        print("\nBenchmark Summary:")
-        print("-" * 60)
+        # Fallback without rich; build the whole block and print once
+        lines = ["\nBenchmark Summary:", "-" * 60]
         for pipeline, metrics in summary.items():
-            print(f"\n{pipeline}:")
+            lines.append(f"\n{pipeline}:")
             for metric, stats in metrics.items():
-                print(f"  {metric}: {stats['mean']:.4f} +/- {stats['std']:.4f}")
+                lines.append(f"  {metric}: {stats['mean']:.4f} +/- {stats['std']:.4f}")
+        print("\n".join(lines))
 
 
-if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python run_all.py <benchmark_config.yaml>")
-        print("\nExample:")
-        print("  python run_all.py configs/batch/classical_vs_ml.yaml")
-        sys.exit(1)
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(
+        description="Run a Promethium benchmark suite",
+        epilog="Example: python run_all.py configs/batch/classical_vs_ml.yaml",
+    )
+    parser.add_argument(
+        "config_path",
+        help="Path to benchmark configuration YAML"
+    )
+    parser.add_argument(
+        "output_dir",
+        nargs="?",
+        default=None,
+        help="Optional output directory override"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: PARALLEL_WORKERS or min(cpu_count, jobs))"
+    )
     
-    config_path = sys.argv[1]
-    output_dir = sys.argv[2] if len(sys.argv) > 2 else None
+    args = parser.parse_args()
     
-    results = run_benchmark(config_path, output_dir)
+    results = run_benchmark(args.config_path, args.output_dir, workers=args.workers)
     
     print("\n" + "=" * 60)
     print_comparison_table(results["summary"])
+
+
+if __name__ == "__main__":
+    main()
@@ -63,8 +63,12 @@ def main():
     # Load additional config if provided
     if args.config:
         import yaml
+        try:
+            from yaml import CSafeLoader as SafeLoader
+        except ImportError:
+            from yaml import SafeLoader
         with open(args.config, "r") as f:
-            user_config = yaml.safe_load(f)
+            user_config = yaml.load(f, Loader=SafeLoader)
             pipeline_config.update(user_config)
     
     # Create and run pipeline
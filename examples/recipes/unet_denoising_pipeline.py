@@ -13,6 +13,7 @@ Usage:
     python unet_denoising_pipeline.py train --data-dir data/training --epochs 100
 """
 import argparse
+import os
 from pathlib import Path
 
 import numpy as np
@@ -45,6 +46,28 @@ def run_inference(args):
     print(f"Saved: {args.output}")
 
 
+def prefetch_to_device(loader, device):
+    """
+    Yield (noisy, clean) batches already on ``device``.
+    
+    The next batch's host-to-device copy is issued before the current batch
+    is handed to the caller, so with pinned memory the DMA overlaps compute.
+    """
+    batches = iter(loader)
+    try:
+        noisy, clean = next(batches)
+    except StopIteration:
+        return
+    pending = (noisy.to(device, non_blocking=True), clean.to(device, non_blocking=True))
+    
+    for noisy, clean in batches:
+        current = pending
+        pending = (noisy.to(device, non_blocking=True), clean.to(device, non_blocking=True))
+        yield current
+    
+    yield pending
+
+
 def run_training(args):
     """Train U-Net model from scratch."""
     from promethium.ml.data import SeismicDataLoader
@@ -53,13 +76,25 @@ def run_training(args):
     print("U-Net Training Mode")
     print("-" * 40)
     
+    import torch
+    
     # Setup data loaders
     print(f"Loading training data from: {args.data_dir}")
     
+    num_workers = args.num_workers
+    if num_workers is None:
+        num_workers = (os.cpu_count() or 2) // 2
+    loader_kwargs = {
+        "num_workers": num_workers,
+        "pin_memory": torch.cuda.is_available(),
+        "persistent_workers": num_workers > 0,
+    }
+    
     train_loader = SeismicDataLoader(
         args.data_dir / "train",
         batch_size=args.batch_size,
         shuffle=True,
+        **loader_kwargs,
     )
     
     val_loader = None
@@ -68,6 +103,7 @@ def run_training(args):
             args.data_dir / "val",
             batch_size=args.batch_size,
             shuffle=False,
+            **loader_kwargs,
         )
     
     # Create model
@@ -79,7 +115,6 @@ def run_training(args):
     )
     
     # Training configuration
-    import torch
     import torch.nn as nn
     import torch.optim as optim
     
@@ -87,10 +122,23 @@ def run_training(args):
                           "cuda" if torch.cuda.is_available() else "cpu")
     model = model.to(device)
     
+    # Fuse conv/activation kernels with TorchInductor. Keep a handle on the
+    # eager module so checkpoints are saved without the compile wrapper prefix.
+    net = model
+    if hasattr(torch, "compile") and device.type == "cuda":
+        model = torch.compile(model, mode="reduce-overhead", fullgraph=False)
+    
     criterion = nn.MSELoss()
     optimizer = optim.Adam(model.parameters(), lr=args.learning_rate)
     scheduler = optim.lr_scheduler.CosineAnnealingLR(optimizer, T_max=args.epochs)
     
+    # Mixed precision on CUDA: FP16 autocast for forward/loss, scaled backward
+    use_amp = device.type == "cuda"
+    scaler = torch.cuda.amp.GradScaler(enabled=use_amp)
+    if use_amp:
+        # Shot-gather shapes are fixed, so let cuDNN pick the fastest kernels
+        torch.backends.cudnn.benchmark = True
+    
     # Training loop
     print(f"Training for {args.epochs} epochs on {device}")
     
@@ -99,14 +147,14 @@ def run_training(args):
         model.train()
         train_loss = 0.0
         
-        for batch_idx, (noisy, clean) in enumerate(train_loader):
-            noisy, clean = noisy.to(device), clean.to(device)
-            
+        for batch_idx, (noisy, clean) in enumerate(prefetch_to_device(train_loader, device)):
             optimizer.zero_grad()
-            output = model(noisy)
-            loss = criterion(output, clean)
-            loss.backward()
-            optimizer.step()
+            with torch.autocast(device_type=device.type, dtype=torch.float16, enabled=use_amp):
+                output = model(noisy)
+                loss = criterion(output, clean)
+            scaler.scale(loss).backward()
+            scaler.step(optimizer)
+            scaler.update()
             
             train_loss += loss.item()
         
@@ -118,10 +166,10 @@ def run_training(args):
         if val_loader:
             model.eval()
             with torch.no_grad():
-                for noisy, clean in val_loader:
-                    noisy, clean = noisy.to(device), clean.to(device)
-                    output = model(noisy)
-                    val_loss += criterion(output, clean).item()
+                for noisy, clean in prefetch_to_device(val_loader, device):
+                    with torch.autocast(device_type=device.type, dtype=torch.float16, enabled=use_amp):
+                        output = model(noisy)
+                        val_loss += criterion(output, clean).item()
             val_loss /= len(val_loader)
         
         # Print progress
@@ -136,10 +184,10 @@ def run_training(args):
         if current_loss < best_loss:
             best_loss = current_loss
             args.output_dir.mkdir(parents=True, exist_ok=True)
-            torch.save(model.state_dict(), args.output_dir / "unet_best.pt")
+            torch.save(net.state_dict(), args.output_dir / "unet_best.pt")
     
     # Save final model
-    torch.save(model.state_dict(), args.output_dir / "unet_final.pt")
+    torch.save(net.state_dict(), args.output_dir / "unet_final.pt")
     print(f"\nTraining complete. Models saved to: {args.output_dir}")
 
 
@@ -164,6 +212,8 @@ def main():
     train_parser.add_argument("--batch-size", type=int, default=16, help="Batch size")
     train_parser.add_argument("--learning-rate", type=float, default=0.001, help="Learning rate")
     train_parser.add_argument("--device", type=str, default="auto", help="Device")
+    train_parser.add_argument("--num-workers", type=int, default=None,
+                              help="Data loader workers (default: half the CPU count)")
     
     args = parser.parse_args()
     
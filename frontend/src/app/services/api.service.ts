@@ -15,6 +15,11 @@ export interface Dataset {
     metadata_json: Record<string, unknown>;
 }
 
+export interface Page<T> {
+    items: T[];
+    next_cursor: string | null;
+}
+
 export interface DatasetCreate {
     name: string;
     format: string;
@@ -250,12 +255,12 @@ export class ApiService {
 
     // === DATASETS ===
     getDatasets(): Observable<Dataset[]> {
-        return this.http.get<Dataset[]>(`${this.apiUrl}/datasets/`).pipe(
+        return this.http.get<Page<Dataset>>(`${this.apiUrl}/datasets/`).pipe(
             timeout(5000),
             retry(1),
-            map(datasets => {
+            map(page => {
                 this.backendAvailable = true;
-                return datasets;
+                return page.items;
             }),
             catchError(() => {
                 this.backendAvailable = false;
@@ -296,12 +301,12 @@ export class ApiService {
 
     // === JOBS ===
     getJobs(): Observable<Job[]> {
-        return this.http.get<Job[]>(`${this.apiUrl}/jobs/`).pipe(
+        return this.http.get<Page<Job>>(`${this.apiUrl}/jobs/`).pipe(
             timeout(5000),
             retry(1),
-            map(jobs => {
+            map(page => {
                 this.backendAvailable = true;
-                return jobs;
+                return page.items;
             }),
             catchError(() => {
                 this.backendAvailable = false;
@@ -4,11 +4,18 @@ Generate cross-language test data for Promethium validation.
 This script creates synthetic seismic data and reference outputs
 that all language implementations use for consistency testing.
 """
+import argparse
 import numpy as np
 import json
+import math
 import os
 from pathlib import Path
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; fall back to NumPy broadcasting
+    njit = None
+
 # Ensure reproducibility
 np.random.seed(42)
 
@@ -17,19 +24,49 @@ def generate_ricker_wavelet(t, f0=30):
     tau = t
     return (1 - 2 * (np.pi * f0 * tau)**2) * np.exp(-(np.pi * f0 * tau)**2)
 
-def generate_synthetic_traces(n_traces=100, n_samples=500, dt=0.004, noise_level=0.1):
+if njit is not None:
+    # No fastmath: reassociated sums would make the reference data depend
+    # on numba and the CPU
+    @njit(parallel=True, cache=True)
+    def _synthesize_traces(t, event_times, event_amps, n_events, f0=30.0):
+        """Sum Ricker wavelets per trace in place, one trace per thread."""
+        n_traces = event_times.shape[0]
+        n_samples = t.shape[0]
+        traces = np.zeros((n_traces, n_samples))
+        for i in prange(n_traces):
+            for k in range(n_events[i]):
+                te = event_times[i, k]
+                ae = event_amps[i, k]
+                for j in range(n_samples):
+                    x = (math.pi * f0 * (t[j] - te)) ** 2
+                    traces[i, j] += ae * (1.0 - 2.0 * x) * math.exp(-x)
+        return traces
+else:
+    _synthesize_traces = None
+
+def generate_synthetic_traces(n_traces=100, n_samples=500, dt=0.004, noise_level=0.1,
+                              min_events=3, max_events=7):
     """Generate synthetic seismic traces."""
     t = np.arange(n_samples) * dt
-    traces = np.zeros((n_traces, n_samples))
     
-    for i in range(n_traces):
-        n_events = np.random.randint(3, 8)
-        event_times = np.sort(np.random.uniform(0.1, t[-1] - 0.1, n_events))
-        event_amps = np.random.uniform(0.5, 1.5, n_events) * np.random.choice([-1, 1], n_events)
-        
-        for te, ae in zip(event_times, event_amps):
-            wavelet = generate_ricker_wavelet(t - te)
-            traces[i] += ae * wavelet
+    # Draw every trace's events at once, padded to max_events and masked.
+    # Event order does not affect the summed trace, so times are left unsorted.
+    n_events = np.random.randint(min_events, max_events + 1, size=n_traces)
+    valid = np.arange(max_events)[None, :] < n_events[:, None]
+    event_times = np.random.uniform(0.1, t[-1] - 0.1, (n_traces, max_events))
+    event_amps = (
+        np.random.uniform(0.5, 1.5, (n_traces, max_events))
+        * np.random.choice([-1, 1], (n_traces, max_events))
+        * valid
+    )
+    
+    if _synthesize_traces is not None:
+        # Avoids the (n_traces, max_events, n_samples) temporary below
+        traces = _synthesize_traces(t, event_times, event_amps, n_events)
+    else:
+        # (n_traces, max_events, n_samples) wavelets summed over events
+        wavelets = generate_ricker_wavelet(t[None, None, :] - event_times[:, :, None])
+        traces = np.einsum("ij,ijk->ik", event_amps, wavelets)
     
     # Add noise
     if noise_level > 0:
@@ -49,7 +86,26 @@ def compute_mse(reference, estimate):
     """Compute MSE."""
     return np.mean((reference - estimate)**2)
 
+def write_json(path, obj):
+    """Write a JSON file, using orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        with open(path, "w") as f:
+            json.dump(obj, f, indent=2)
+        return
+    with open(path, "wb") as f:
+        f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+
 def main():
+    parser = argparse.ArgumentParser(description="Generate cross-language test data")
+    parser.add_argument(
+        "--npz",
+        action="store_true",
+        help="Also write every array to a single testdata.npz archive"
+    )
+    args = parser.parse_args()
+    
     output_dir = Path(__file__).parent.parent / "testdata"
     output_dir.mkdir(exist_ok=True)
     
@@ -66,11 +122,6 @@ def main():
     print(f"  SNR: {snr:.2f} dB")
     print(f"  MSE: {mse:.6f}")
     
-    # Save as numpy
-    np.save(output_dir / "clean_traces.npy", clean_traces)
-    np.save(output_dir / "noisy_traces.npy", noisy_traces)
-    np.save(output_dir / "time_axis.npy", t)
-    
     # Generate low-rank matrix for completion test
     print("Generating matrix completion test data...")
     n = 50
@@ -84,9 +135,19 @@ def main():
     observed = full_matrix.copy()
     observed[~mask] = np.nan
     
-    np.save(output_dir / "full_matrix.npy", full_matrix)
-    np.save(output_dir / "observed_matrix.npy", observed)
-    np.save(output_dir / "mask.npy", mask)
+    arrays = {
+        "clean_traces": clean_traces,
+        "noisy_traces": noisy_traces,
+        "time_axis": t,
+        "full_matrix": full_matrix,
+        "observed_matrix": observed,
+        "mask": mask,
+    }
+    for name, array in arrays.items():
+        np.save(output_dir / f"{name}.npy", array)
+    
+    if args.npz:
+        np.savez(output_dir / "testdata.npz", **arrays)
     
     # Update expected values
     expected = {
@@ -99,8 +160,7 @@ def main():
         "observation_ratio": float(np.mean(mask))
     }
     
-    with open(output_dir / "expected.json", "w") as f:
-        json.dump(expected, f, indent=2)
+    write_json(output_dir / "expected.json", expected)
     
     print(f"Test data saved to {output_dir}")
     print("Done!")
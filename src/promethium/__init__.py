@@ -35,6 +35,8 @@ __version__ = "1.0.4"
 __author__ = "Olaf Yunus Laitinen Imanov"
 __license__ = "CC BY-NC 4.0"
 
+import importlib
+
 # -----------------------------------------------------------------------------
 # Core utilities
 # -----------------------------------------------------------------------------
@@ -42,12 +44,72 @@ from promethium.core.config import settings, get_settings
 from promethium.core.logging import get_logger
 
 # -----------------------------------------------------------------------------
-# I/O functions - reading and writing seismic data formats
+# Lazily imported API
 # -----------------------------------------------------------------------------
-from promethium.io import read_segy, write_segy
+# The I/O, signal, ML, pipeline, evaluation and utility exports pull in
+# torch, scipy and friends. They are imported on first attribute access
+# (PEP 562) so that ``import promethium.<submodule>`` -- the CLI, the API
+# server -- doesn't pay for the whole stack. ``from promethium import X``
+# works as before.
+#
+# public name -> (module, attribute)
+_LAZY_ATTRS = {
+    # I/O
+    "read_segy": ("promethium.io", "read_segy"),
+    "write_segy": ("promethium.io", "write_segy"),
+    # Alias for consistency with common naming conventions
+    "load_segy": ("promethium.io", "read_segy"),
+    # Signal processing
+    "bandpass_filter": ("promethium.signal", "bandpass_filter"),
+    "lowpass_filter": ("promethium.signal", "lowpass_filter"),
+    "highpass_filter": ("promethium.signal", "highpass_filter"),
+    "notch_filter": ("promethium.signal", "notch_filter"),
+    # ML
+    "InferenceEngine": ("promethium.ml", "InferenceEngine"),
+    "load_model": ("promethium.ml", "load_model"),
+    "reconstruct": ("promethium.ml", "reconstruct"),
+    "compute_snr": ("promethium.ml", "compute_snr"),
+    "compute_ssim": ("promethium.ml", "compute_ssim"),
+    # Pipelines
+    "SeismicRecoveryPipeline": ("promethium.pipelines", "SeismicRecoveryPipeline"),
+    # Evaluation
+    "signal_to_noise_ratio": ("promethium.evaluation", "signal_to_noise_ratio"),
+    "mean_squared_error": ("promethium.evaluation", "mean_squared_error"),
+    "peak_signal_to_noise_ratio": ("promethium.evaluation", "peak_signal_to_noise_ratio"),
+    "error_metrics": ("promethium.evaluation", "error_metrics"),
+    "structural_similarity_index": ("promethium.evaluation", "structural_similarity_index"),
+    "frequency_domain_correlation": ("promethium.evaluation", "frequency_domain_correlation"),
+    "phase_coherence": ("promethium.evaluation", "phase_coherence"),
+    "evaluate_reconstruction": ("promethium.evaluation", "evaluate_reconstruction"),
+    # Utils
+    "set_seed": ("promethium.utils", "set_seed"),
+    "get_device": ("promethium.utils", "get_device"),
+    "generate_synthetic_traces": ("promethium.utils", "generate_synthetic_traces"),
+    "add_noise": ("promethium.utils", "add_noise"),
+    "plot_traces": ("promethium.utils", "plot_traces"),
+    "plot_comparison": ("promethium.utils", "plot_comparison"),
+}
 
-# Aliases for consistency with common naming conventions
-load_segy = read_segy
+# Subpackages that used to be loaded as a side effect of the imports above,
+# so ``import promethium; promethium.io.write_segy(...)`` keeps working
+_LAZY_SUBMODULES = {"io", "signal", "ml", "pipelines", "evaluation", "utils"}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), attr)
+    # Cache so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
 
 def load_miniseed(path: str, **kwargs):
@@ -122,28 +184,9 @@ def load_sac(path: str, **kwargs):
     )
 
 
-# -----------------------------------------------------------------------------
-# Signal processing utilities
-# -----------------------------------------------------------------------------
-from promethium.signal import (
-    bandpass_filter,
-    lowpass_filter,
-    highpass_filter,
-    notch_filter,
-)
-
 # -----------------------------------------------------------------------------
 # ML components
 # -----------------------------------------------------------------------------
-from promethium.ml import (
-    InferenceEngine,
-    load_model,
-    reconstruct,
-    compute_snr,
-    compute_ssim,
-)
-
-
 def get_model(name: str, *, device: str = None):
     """
     Get a pre-defined seismic reconstruction model by name.
@@ -179,9 +222,6 @@ def get_model(name: str, *, device: str = None):
 # -----------------------------------------------------------------------------
 # High-level pipelines
 # -----------------------------------------------------------------------------
-from promethium.pipelines import SeismicRecoveryPipeline
-
-
 def run_recovery(data, pipeline=None, preset: str = None, **kwargs):
     """
     Run seismic data recovery using a pipeline.
@@ -201,6 +241,8 @@ def run_recovery(data, pipeline=None, preset: str = None, **kwargs):
         >>> result = promethium.run_recovery(noisy_data, preset='unet_denoise_v1')
     """
     if pipeline is None:
+        from promethium.pipelines import SeismicRecoveryPipeline
+
         if preset is None:
             preset = "unet_denoise_v1"
         pipeline = SeismicRecoveryPipeline.from_preset(preset)
@@ -208,31 +250,6 @@ def run_recovery(data, pipeline=None, preset: str = None, **kwargs):
     return pipeline.run(data, **kwargs)
 
 
-# -----------------------------------------------------------------------------
-# Evaluation metrics
-# -----------------------------------------------------------------------------
-from promethium.evaluation import (
-    signal_to_noise_ratio,
-    mean_squared_error,
-    peak_signal_to_noise_ratio,
-    structural_similarity_index,
-    frequency_domain_correlation,
-    phase_coherence,
-    evaluate_reconstruction,
-)
-
-# -----------------------------------------------------------------------------
-# Utility functions
-# -----------------------------------------------------------------------------
-from promethium.utils import (
-    set_seed,
-    get_device,
-    generate_synthetic_traces,
-    add_noise,
-    plot_traces,
-    plot_comparison,
-)
-
 # -----------------------------------------------------------------------------
 # Public API
 # -----------------------------------------------------------------------------
@@ -270,6 +287,7 @@ __all__ = [
     "signal_to_noise_ratio",
     "mean_squared_error",
     "peak_signal_to_noise_ratio",
+    "error_metrics",
     "structural_similarity_index",
     "frequency_domain_correlation",
     "phase_coherence",
@@ -0,0 +1,132 @@
+"""
+Redis-backed response cache for read-only endpoints.
+
+Responses are stored as their final JSON bytes, so a hit skips the database
+query, ORM hydration and Pydantic serialization entirely. Redis being
+unavailable degrades to a cache miss rather than an error.
+"""
+import functools
+import hashlib
+import time
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import Response
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from promethium.core.config import get_settings
+from promethium.core.logging import logger
+from promethium.api.models.user import User
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+settings = get_settings()
+
+KEY_PREFIX = "promethium:cache"
+# After a failed Redis call, bypass the cache for this long instead of paying
+# the connect timeout on every request
+REDIS_RETRY_SECONDS = 5.0
+
+_client = None
+_down_until = 0.0
+
+
+def get_client():
+    """Return the shared Redis client, or None when caching is off or Redis is down."""
+    global _client
+    if not settings.RESPONSE_CACHE_ENABLED or aioredis is None:
+        return None
+    if time.monotonic() < _down_until:
+        return None
+    if _client is None:
+        _client = aioredis.from_url(
+            settings.REDIS_URL, socket_timeout=0.25, socket_connect_timeout=0.25
+        )
+    return _client
+
+
+def _mark_down(exc: Exception) -> None:
+    global _down_until
+    _down_until = time.monotonic() + REDIS_RETRY_SECONDS
+    logger.debug(f"Response cache unavailable: {exc}")
+
+
+async def close_client() -> None:
+    """Close the Redis connection pool (called on app shutdown)."""
+    global _client
+    if _client is not None:
+        # redis-py < 5.0.1 only has close()
+        await getattr(_client, "aclose", _client.close)()
+        _client = None
+
+
+def _cache_key(namespace: str, endpoint: str, params: Dict[str, Any]) -> str:
+    """Namespace plus an 8-byte digest of the endpoint name and its arguments."""
+    parts = [endpoint]
+    for name in sorted(params):
+        value = params[name]
+        if isinstance(value, AsyncSession):
+            continue
+        if isinstance(value, User):
+            value = value.id
+        parts.append(f"{name}={value!r}")
+    digest = hashlib.blake2b("|".join(parts).encode(), digest_size=8).hexdigest()
+    return f"{KEY_PREFIX}:{namespace}:{digest}"
+
+
+def cached(namespace: str, response_model: Any, expire: Optional[int] = None) -> Callable:
+    """
+    Cache an endpoint's serialized response in Redis.
+
+    Apply below the router decorator. ``response_model`` should match the
+    route's; it is used to serialize the result once, and both hits and misses
+    return the JSON bytes directly. The current user is part of the key, so
+    per-user permission checks in the endpoint body still hold. Writes must
+    call :func:`invalidate` for the namespace.
+    """
+    adapter = TypeAdapter(response_model)
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            client = get_client()
+            if client is None:
+                return await func(*args, **kwargs)
+
+            key = _cache_key(namespace, func.__name__, kwargs)
+            try:
+                body = await client.get(key)
+            except Exception as e:
+                _mark_down(e)
+                return await func(*args, **kwargs)
+            if body is not None:
+                return Response(content=body, media_type="application/json")
+
+            result = await func(*args, **kwargs)
+            body = adapter.dump_json(adapter.validate_python(result, from_attributes=True))
+            try:
+                await client.set(key, body, ex=expire or settings.RESPONSE_CACHE_TTL_SECONDS)
+            except Exception as e:
+                _mark_down(e)
+            return Response(content=body, media_type="application/json")
+
+        return wrapper
+
+    return decorator
+
+
+async def invalidate(*namespaces: str) -> None:
+    """Drop every cached response in the given namespaces."""
+    client = get_client()
+    if client is None:
+        return
+    try:
+        for namespace in namespaces:
+            keys = [key async for key in client.scan_iter(match=f"{KEY_PREFIX}:{namespace}:*", count=500)]
+            if keys:
+                await client.unlink(*keys)
+    except Exception as e:
+        _mark_down(e)
@@ -1,51 +1,120 @@
 """
 Authentication dependencies.
 """
-from typing import Optional
+import hashlib
+import time
+from typing import Any, Dict, Optional, Tuple
+from cachetools import TLRUCache
 from fastapi import Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+import jwt
+from sqlalchemy import bindparam, inspect
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import make_transient_to_detached
 
 from promethium.core.config import get_settings
 from promethium.core.database import get_db
 from promethium.api.models.user import User
-from promethium.api.schemas.auth import TokenPayload
 
 settings = get_settings()
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_PREFIX}/auth/login")
+# Use a default secret key if not set in settings (SAFEGUARD for dev)
+_SECRET_KEY = getattr(settings, "SECRET_KEY", "dev_secret_key_change_me")
+_ALGORITHMS = [getattr(settings, "ALGORITHM", "HS256")]
+
+bearer_scheme = HTTPBearer(auto_error=True)
+
+# Built once; only the bound user id changes per request. The user's
+# collections are lazy="raise" and have no consumer here, so none are
+# eager-loaded.
+_USER_BY_ID_STMT = select(User).where(User.id == bindparam("user_id"))
+
+# Upper bound on how long a validated token is trusted without re-checking,
+# which also bounds how stale a cached user (role, is_active) can get. The
+# cache is per process: invalidate_cached_user only reaches the worker that
+# made the change, so other workers can serve the old user this long.
+TOKEN_CACHE_TTL_SECONDS = 10
+TOKEN_CACHE_MAXSIZE = 10_000
+
+
+def _token_cache_ttu(key: bytes, value: Tuple[Dict[str, Any], float], now: float) -> float:
+    """Expire entries after the cache TTL or at token expiry, whichever is first."""
+    _, exp = value
+    return now + min(exp - time.time(), TOKEN_CACHE_TTL_SECONDS)
+
+
+# sha256(token) -> (user column values, token exp as a unix timestamp)
+_token_cache: TLRUCache = TLRUCache(maxsize=TOKEN_CACHE_MAXSIZE, ttu=_token_cache_ttu)
+
+
+def _token_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
+
+
+def _user_snapshot(user: User) -> Dict[str, Any]:
+    """Capture a user's column values for caching outside any session."""
+    return {attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+
+
+def invalidate_cached_user(user_id: int) -> None:
+    """
+    Drop cached tokens for a user.
+    
+    Call after changing a user's password, role or active flag so the change
+    applies to their next request rather than after the cache TTL. Only
+    this process's cache is cleared; other API workers pick the change up
+    within ``TOKEN_CACHE_TTL_SECONDS``.
+    """
+    stale = [key for key, (values, _) in _token_cache.items() if values["id"] == user_id]
+    for key in stale:
+        _token_cache.pop(key, None)
+
+
+def clear_token_cache() -> None:
+    """Drop all cached token validations."""
+    _token_cache.clear()
 
 
 async def get_current_user(
-    token: str = Depends(oauth2_scheme),
+    creds: HTTPAuthorizationCredentials = Depends(bearer_scheme),
     db: AsyncSession = Depends(get_db)
 ) -> User:
     """
     Validate access token and return current user.
     """
+    token = creds.credentials
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
     
+    key = _token_key(token)
+    cached = _token_cache.get(key)
+    if cached is not None:
+        # Rebuild the user as a detached instance and attach it to this
+        # session without a SELECT
+        user = User(**cached[0])
+        make_transient_to_detached(user)
+        return await db.merge(user, load=False)
+    
     try:
-        # Use a default secret key if not set in settings (SAFEGUARD for dev)
-        secret_key = getattr(settings, "SECRET_KEY", "dev_secret_key_change_me")
-        algorithm = getattr(settings, "ALGORITHM", "HS256")
-        
-        payload = jwt.decode(token, secret_key, algorithms=[algorithm])
+        payload = jwt.decode(token, _SECRET_KEY, algorithms=_ALGORITHMS)
         user_id: str = payload.get("sub")
         if user_id is None:
             raise credentials_exception
-        token_data = TokenPayload(sub=int(user_id))
-    except (JWTError, ValueError):
+        sub_id = int(user_id)
+    except (jwt.InvalidTokenError, ValueError):
         raise credentials_exception
         
-    user = await db.get(User, token_data.sub)
+    result = await db.execute(_USER_BY_ID_STMT, {"user_id": sub_id})
+    user = result.scalar_one_or_none()
     if user is None:
         raise credentials_exception
+    
+    exp = payload.get("exp")
+    if exp is not None:
+        _token_cache[key] = (_user_snapshot(user), float(exp))
         
     return user
 
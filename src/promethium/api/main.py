@@ -1,43 +1,55 @@
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 from contextlib import asynccontextmanager
 
-from promethium.core.config import get_settings
 from promethium.core.config import get_settings
 from promethium.core.logging import logger
-from promethium.core.database import engine, Base
+from promethium.core.database import engine, Base, warm_pool
+from promethium.core.security import shutdown_hash_pool
+from promethium.api.middleware import FastCORSMiddleware, FastPathsMiddleware
+from promethium.api.cache import close_client as close_cache_client
 from promethium.api.routers import datasets, jobs, ml, auth, users, pipelines, experiments, results, system, websockets, benchmarks
 
 settings = get_settings()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup: Create DB tables if not exist (dev mode)
-    # In production, recommend using Alembic migrations
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    logger.info("Database initialized.")
+    # Startup: Create DB tables if not exist (dev mode only).
+    # Otherwise the schema is managed with `promethium db upgrade` so workers
+    # don't race each other on DDL at boot.
+    if settings.AUTO_CREATE_SCHEMA:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        logger.info("Database initialized.")
+    await warm_pool()
+    # Build the OpenAPI schema now rather than on the first /openapi.json hit
+    if app.openapi_url:
+        app.openapi()
     yield
     # Shutdown
+    await close_cache_client()
+    shutdown_hash_pool()
     logger.info("Shutting down.")
 
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     lifespan=lifespan,
-    docs_url="/docs",
-    redoc_url="/redoc"
+    openapi_url="/openapi.json" if settings.API_DOCS_ENABLED else None,
+    docs_url="/docs" if settings.API_DOCS_ENABLED else None,
+    redoc_url="/redoc" if settings.API_DOCS_ENABLED else None,
 )
 
+# Compression for large JSON payloads. Added before CORS so CORS wraps it
+# and preflights never reach it.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # CORS
 origins = ["http://localhost:3000", "http://localhost:8000", "*"] # Configure appropriately for production
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+app.add_middleware(FastCORSMiddleware, origins=origins, allow_credentials=True)
+
+# Health probe and OpenAPI document, served ahead of every other middleware
+app.add_middleware(FastPathsMiddleware, openapi=app.openapi, openapi_url=app.openapi_url)
 
 # Include Routers
 app.include_router(auth.router, prefix=settings.API_PREFIX)
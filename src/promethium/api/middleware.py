@@ -0,0 +1,159 @@
+"""
+ASGI middleware for the Promethium API.
+
+Implemented as plain ASGI callables rather than BaseHTTPMiddleware subclasses
+so no Request/Response objects are built on the per-request path.
+"""
+import json
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+Headers = List[Tuple[bytes, bytes]]
+
+CORS_ALLOW_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+CORS_MAX_AGE = b"600"
+
+HEALTH_PATH = "/health"
+HEALTH_BODY = b'{"status":"ok"}'
+JSON_HEADERS: Headers = [(b"content-type", b"application/json")]
+
+
+def _get_header(scope: Scope, name: bytes) -> bytes:
+    """Return a request header from the raw ASGI header list (b"" if absent)."""
+    for key, value in scope["headers"]:
+        if key == name:
+            return value
+    return b""
+
+
+class FastCORSMiddleware:
+    """
+    Minimal CORS middleware.
+
+    Preflight requests are answered directly with a precomputed header set;
+    all other requests get the allow-origin headers appended to the
+    ``http.response.start`` message. Requests without an Origin header pass
+    straight through.
+
+    Origins are echoed back rather than sent as ``*`` because credentials are
+    allowed, which browsers reject in combination with a wildcard origin.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        origins: Iterable[str] = ("*",),
+        allow_credentials: bool = True,
+    ):
+        self.app = app
+        origins = list(origins)
+        self.allow_all_origins = "*" in origins
+        self.allowed_origins = {origin.encode("latin-1") for origin in origins}
+
+        self._simple_headers: Headers = [(b"vary", b"Origin")]
+        if allow_credentials:
+            self._simple_headers.append((b"access-control-allow-credentials", b"true"))
+
+        self._preflight_headers: Headers = self._simple_headers + [
+            (b"access-control-allow-methods", CORS_ALLOW_METHODS),
+            (b"access-control-max-age", CORS_MAX_AGE),
+        ]
+
+    def _is_allowed(self, origin: bytes) -> bool:
+        return self.allow_all_origins or origin in self.allowed_origins
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = _get_header(scope, b"origin")
+        if not origin:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and _get_header(scope, b"access-control-request-method"):
+            await self._preflight(scope, origin, send)
+            return
+
+        if not self._is_allowed(origin):
+            await self.app(scope, receive, send)
+            return
+
+        cors_headers = [(b"access-control-allow-origin", origin)] + self._simple_headers
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + cors_headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    async def _preflight(self, scope: Scope, origin: bytes, send: Send) -> None:
+        if not self._is_allowed(origin):
+            await send({
+                "type": "http.response.start",
+                "status": 400,
+                "headers": [(b"content-type", b"text/plain; charset=utf-8")],
+            })
+            await send({"type": "http.response.body", "body": b"Disallowed CORS origin"})
+            return
+
+        headers = [(b"access-control-allow-origin", origin)] + self._preflight_headers
+        requested_headers = _get_header(scope, b"access-control-request-headers")
+        if requested_headers:
+            headers.append((b"access-control-allow-headers", requested_headers))
+
+        await send({"type": "http.response.start", "status": 204, "headers": headers})
+        await send({"type": "http.response.body", "body": b""})
+
+
+class FastPathsMiddleware:
+    """
+    Answer liveness probes and the OpenAPI document before the rest of the stack.
+
+    ``/health`` returns a static body without touching the database (the
+    detailed check stays at ``/system/health``). The OpenAPI schema is
+    serialized once on first request and served from bytes afterwards.
+    Installed outermost so neither path goes through CORS, compression or
+    routing.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        openapi: Optional[Callable[[], Dict[str, Any]]] = None,
+        openapi_url: Optional[str] = None,
+    ):
+        self.app = app
+        self.openapi = openapi
+        self.openapi_url = openapi_url if openapi is not None else None
+        self._openapi_body: Optional[bytes] = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            path = scope["path"]
+            if path == HEALTH_PATH:
+                await self._send_json(send, HEALTH_BODY)
+                return
+            if path == self.openapi_url:
+                if self._openapi_body is None:
+                    # Same encoding as FastAPI's own openapi.json endpoint
+                    self._openapi_body = json.dumps(
+                        self.openapi(), ensure_ascii=False, allow_nan=False,
+                        indent=None, separators=(",", ":"),
+                    ).encode("utf-8")
+                await self._send_json(send, self._openapi_body)
+                return
+
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    async def _send_json(send: Send, body: bytes) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": JSON_HEADERS + [(b"content-length", str(len(body)).encode())],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -1,9 +1,38 @@
 """
 Base model class for SQLAlchemy ORM.
 """
+from sqlalchemy import DDL, JSON, String, event, text
+from sqlalchemy.dialects.postgresql import CITEXT, JSONB
 from sqlalchemy.orm import DeclarativeBase
 
+# Binary JSONB on PostgreSQL, plain JSON elsewhere (SQLite for local dev).
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+# Server-side defaults for non-nullable JSON columns. The bare literals are
+# valid for both jsonb (implicit cast) and SQLite's text-backed JSON.
+EMPTY_JSON_OBJECT = text("'{}'")
+EMPTY_JSON_ARRAY = text("'[]'")
+
+# Case-insensitive email: CITEXT on PostgreSQL, NOCASE collation on SQLite, so
+# equality lookups hit the unique index without lower() on either side.
+EmailType = (
+    String(255)
+    .with_variant(CITEXT(), "postgresql")
+    .with_variant(String(255, collation="NOCASE"), "sqlite")
+)
+
 
 class Base(DeclarativeBase):
     """Base class for all ORM models."""
-    pass
+    # Fetch server-generated values (ids, now() timestamps, JSON defaults) in
+    # the INSERT/UPDATE itself via RETURNING, so a committed object is
+    # complete without a follow-up refresh SELECT.
+    __mapper_args__ = {"eager_defaults": True}
+
+
+# CITEXT lives in an extension that has to exist before any table uses it
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS citext").execute_if(dialect="postgresql"),
+)
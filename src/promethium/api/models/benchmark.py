@@ -1,8 +1,8 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Float, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, Float, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
-from promethium.api.models.base import Base
+from promethium.api.models.base import Base, JSONType
 
 
 class Benchmark(Base):
@@ -10,13 +10,17 @@ class Benchmark(Base):
     Benchmark model for storing benchmark run configurations and results.
     """
     __tablename__ = "benchmarks"
+    __table_args__ = (
+        Index("ix_benchmarks_status_created", "status", "created_at"),
+        Index("ix_benchmarks_created_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
     
     # Benchmark configuration
-    config_json = Column(JSON, nullable=True)
+    config_json = Column(JSONType, nullable=True)
     
     # Execution metrics
     status = Column(String(50), default="pending")
@@ -25,11 +29,11 @@ class Benchmark(Base):
     duration_seconds = Column(Float, nullable=True)
     
     # Results
-    metrics_json = Column(JSON, nullable=True)
+    metrics_json = Column(JSONType, nullable=True)
     
     # Foreign keys
     dataset_id = Column(Integer, ForeignKey("datasets.id"), nullable=True)
-    model_id = Column(Integer, ForeignKey("ml_models.id"), nullable=True)
+    model_id = Column(Integer, ForeignKey("models.id"), nullable=True)
     experiment_id = Column(Integer, ForeignKey("experiments.id"), nullable=True)
     
     # Audit fields
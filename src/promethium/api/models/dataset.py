@@ -3,10 +3,11 @@ Dataset model for seismic data registry.
 """
 from datetime import datetime
 from typing import Optional, Dict, Any, List
-from sqlalchemy import String, Integer, DateTime, JSON, ForeignKey
+from sqlalchemy import String, Integer, DateTime, ForeignKey, Text, Index
+from sqlalchemy.sql import func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from promethium.api.models.base import Base
+from promethium.api.models.base import Base, JSONType, EMPTY_JSON_OBJECT
 
 
 class Dataset(Base):
@@ -27,23 +28,26 @@ class Dataset(Base):
         created_at: Upload timestamp.
     """
     __tablename__ = "datasets"
+    __table_args__ = (
+        Index("ix_datasets_created_id", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(255), index=True, nullable=False)
-    description: Mapped[Optional[str]] = mapped_column(String(1024), nullable=True)
-    file_path: Mapped[str] = mapped_column(String(1024), nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    file_path: Mapped[str] = mapped_column(Text, nullable=False)
     format: Mapped[str] = mapped_column(String(50), nullable=False)
     size_bytes: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     sample_rate: Mapped[Optional[float]] = mapped_column(nullable=True)
     channels: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
-    metadata_json: Mapped[Dict[str, Any]] = mapped_column(JSON, default=dict, nullable=False)
+    metadata_json: Mapped[Dict[str, Any]] = mapped_column(JSONType, server_default=EMPTY_JSON_OBJECT, nullable=False)
     owner_id: Mapped[Optional[int]] = mapped_column(ForeignKey("users.id"), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # Relationships
-    owner: Mapped[Optional["User"]] = relationship("User", back_populates="datasets")
-    jobs: Mapped[List["Job"]] = relationship("Job", back_populates="dataset")
-    results: Mapped[List["Result"]] = relationship("Result", back_populates="dataset")
+    owner: Mapped[Optional["User"]] = relationship("User", back_populates="datasets", lazy="raise")
+    jobs: Mapped[List["Job"]] = relationship("Job", back_populates="dataset", lazy="raise")
+    results: Mapped[List["Result"]] = relationship("Result", back_populates="dataset", lazy="raise")
 
     def __repr__(self) -> str:
         return f"<Dataset(id={self.id}, name='{self.name}', format='{self.format}')>"
@@ -3,10 +3,11 @@ Experiment model for grouping related jobs.
 """
 from datetime import datetime
 from typing import Optional, Dict, Any, List
-from sqlalchemy import String, DateTime, JSON, ForeignKey, Text
+from sqlalchemy import String, DateTime, ForeignKey, Text, Index
+from sqlalchemy.sql import func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from promethium.api.models.base import Base
+from promethium.api.models.base import Base, JSONType, EMPTY_JSON_OBJECT, EMPTY_JSON_ARRAY
 
 
 class Experiment(Base):
@@ -23,18 +24,21 @@ class Experiment(Base):
         created_at: Creation timestamp.
     """
     __tablename__ = "experiments"
+    __table_args__ = (
+        Index("ix_experiments_created_id", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(255), index=True, nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    tags: Mapped[Dict[str, Any]] = mapped_column(JSON, default=list, nullable=False)
-    metadata_json: Mapped[Dict[str, Any]] = mapped_column(JSON, default=dict, nullable=False)
+    tags: Mapped[Dict[str, Any]] = mapped_column(JSONType, server_default=EMPTY_JSON_ARRAY, nullable=False)
+    metadata_json: Mapped[Dict[str, Any]] = mapped_column(JSONType, server_default=EMPTY_JSON_OBJECT, nullable=False)
     owner_id: Mapped[Optional[int]] = mapped_column(ForeignKey("users.id"), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # Relationships
-    owner: Mapped[Optional["User"]] = relationship("User", back_populates="experiments")
-    jobs: Mapped[List["Job"]] = relationship("Job", back_populates="experiment")
+    owner: Mapped[Optional["User"]] = relationship("User", back_populates="experiments", lazy="raise")
+    jobs: Mapped[List["Job"]] = relationship("Job", back_populates="experiment", lazy="raise")
 
     def __repr__(self) -> str:
         return f"<Experiment(id={self.id}, name='{self.name}')>"
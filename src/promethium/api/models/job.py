@@ -1,12 +1,14 @@
 """
 Job model for processing tasks.
 """
+import uuid
 from datetime import datetime
 from typing import Optional, Dict, Any
-from sqlalchemy import String, Integer, DateTime, JSON, ForeignKey, Text
+from sqlalchemy import String, Integer, DateTime, ForeignKey, Text, Index, Uuid, text
+from sqlalchemy.sql import func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from promethium.api.models.base import Base
+from promethium.api.models.base import Base, JSONType, EMPTY_JSON_OBJECT
 
 
 class Job(Base):
@@ -14,7 +16,7 @@ class Job(Base):
     Processing job record.
     
     Attributes:
-        id: Primary key (UUID string).
+        id: Primary key (UUID).
         type: Job type (ingestion, pipeline_run, training, evaluation).
         status: Current status (queued, running, completed, failed, cancelled).
         dataset_id: Foreign key to datasets table.
@@ -32,8 +34,17 @@ class Job(Base):
         completed_at: Completion timestamp.
     """
     __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_jobs_exp_status_created", "experiment_id", "status", "created_at"),
+        # Partial index: only unfinished jobs, which is what dashboards poll.
+        Index(
+            "ix_jobs_active", "status", "created_at",
+            postgresql_where=text("status IN ('queued', 'running')"),
+        ),
+        Index("ix_jobs_created_id", "created_at", "id"),
+    )
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
     type: Mapped[str] = mapped_column(String(100), default="pipeline_run", nullable=False)
     status: Mapped[str] = mapped_column(String(50), default="queued", nullable=False, index=True)
     
@@ -45,26 +56,26 @@ class Job(Base):
     
     # Job configuration
     algorithm: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
-    params: Mapped[Dict[str, Any]] = mapped_column(JSON, default=dict, nullable=False)
+    params: Mapped[Dict[str, Any]] = mapped_column(JSONType, server_default=EMPTY_JSON_OBJECT, nullable=False)
     
     # Results
-    result_path: Mapped[Optional[str]] = mapped_column(String(1024), nullable=True)
-    logs_path: Mapped[Optional[str]] = mapped_column(String(1024), nullable=True)
+    result_path: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    logs_path: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     progress: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
-    metrics: Mapped[Dict[str, Any]] = mapped_column(JSON, default=dict, nullable=False)
+    metrics: Mapped[Dict[str, Any]] = mapped_column(JSONType, server_default=EMPTY_JSON_OBJECT, nullable=False)
     
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
-    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
-    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
     # Relationships
-    dataset: Mapped[Optional["Dataset"]] = relationship("Dataset", back_populates="jobs")
-    pipeline: Mapped[Optional["Pipeline"]] = relationship("Pipeline", back_populates="jobs")
-    model: Mapped[Optional["MLModel"]] = relationship("MLModel", back_populates="jobs")
-    experiment: Mapped[Optional["Experiment"]] = relationship("Experiment", back_populates="jobs")
-    results: Mapped[list["Result"]] = relationship("Result", back_populates="job")
+    dataset: Mapped[Optional["Dataset"]] = relationship("Dataset", back_populates="jobs", lazy="raise")
+    pipeline: Mapped[Optional["Pipeline"]] = relationship("Pipeline", back_populates="jobs", lazy="raise")
+    model: Mapped[Optional["MLModel"]] = relationship("MLModel", back_populates="jobs", lazy="raise")
+    experiment: Mapped[Optional["Experiment"]] = relationship("Experiment", back_populates="jobs", lazy="raise")
+    results: Mapped[list["Result"]] = relationship("Result", back_populates="job", lazy="raise")
 
     def __repr__(self) -> str:
         return f"<Job(id='{self.id}', type='{self.type}', status='{self.status}')>"
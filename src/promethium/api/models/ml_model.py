@@ -3,10 +3,11 @@ MLModel model for machine learning model registry.
 """
 from datetime import datetime
 from typing import Optional, Dict, Any, List
-from sqlalchemy import String, DateTime, JSON
+from sqlalchemy import String, DateTime, Text, Index
+from sqlalchemy.sql import func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from promethium.api.models.base import Base
+from promethium.api.models.base import Base, JSONType, EMPTY_JSON_OBJECT
 
 
 class MLModel(Base):
@@ -25,20 +26,23 @@ class MLModel(Base):
         created_at: Creation timestamp.
     """
     __tablename__ = "models"
+    __table_args__ = (
+        Index("ix_models_created_id", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(255), index=True, nullable=False)
     type: Mapped[str] = mapped_column(String(100), nullable=False)
     version: Mapped[str] = mapped_column(String(50), default="1.0.0", nullable=False)
-    description: Mapped[Optional[str]] = mapped_column(String(1024), nullable=True)
-    artifact_path: Mapped[Optional[str]] = mapped_column(String(1024), nullable=True)
-    config: Mapped[Dict[str, Any]] = mapped_column(JSON, default=dict, nullable=False)
-    metrics: Mapped[Dict[str, Any]] = mapped_column(JSON, default=dict, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    artifact_path: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    config: Mapped[Dict[str, Any]] = mapped_column(JSONType, server_default=EMPTY_JSON_OBJECT, nullable=False)
+    metrics: Mapped[Dict[str, Any]] = mapped_column(JSONType, server_default=EMPTY_JSON_OBJECT, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # Relationships
-    jobs: Mapped[List["Job"]] = relationship("Job", back_populates="model")
-    results: Mapped[List["Result"]] = relationship("Result", back_populates="model")
+    jobs: Mapped[List["Job"]] = relationship("Job", back_populates="model", lazy="raise")
+    results: Mapped[List["Result"]] = relationship("Result", back_populates="model", lazy="raise")
 
     def __repr__(self) -> str:
         return f"<MLModel(id={self.id}, name='{self.name}', type='{self.type}', version='{self.version}')>"
@@ -3,10 +3,11 @@ Pipeline model for processing configurations.
 """
 from datetime import datetime
 from typing import Optional, Dict, Any, List
-from sqlalchemy import String, DateTime, JSON, ForeignKey, Text
+from sqlalchemy import String, DateTime, ForeignKey, Text, Index
+from sqlalchemy.sql import func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from promethium.api.models.base import Base
+from promethium.api.models.base import Base, JSONType, EMPTY_JSON_OBJECT
 
 
 class Pipeline(Base):
@@ -24,19 +25,22 @@ class Pipeline(Base):
         updated_at: Last modification timestamp.
     """
     __tablename__ = "pipelines"
+    __table_args__ = (
+        Index("ix_pipelines_created_id", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(255), index=True, nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    config_json: Mapped[Dict[str, Any]] = mapped_column(JSON, default=dict, nullable=False)
-    config_path: Mapped[Optional[str]] = mapped_column(String(1024), nullable=True)
+    config_json: Mapped[Dict[str, Any]] = mapped_column(JSONType, server_default=EMPTY_JSON_OBJECT, nullable=False)
+    config_path: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     owner_id: Mapped[Optional[int]] = mapped_column(ForeignKey("users.id"), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, onupdate=datetime.utcnow, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=True)
 
     # Relationships
-    owner: Mapped[Optional["User"]] = relationship("User", back_populates="pipelines")
-    jobs: Mapped[List["Job"]] = relationship("Job", back_populates="pipeline")
+    owner: Mapped[Optional["User"]] = relationship("User", back_populates="pipelines", lazy="raise")
+    jobs: Mapped[List["Job"]] = relationship("Job", back_populates="pipeline", lazy="raise")
 
     def __repr__(self) -> str:
         return f"<Pipeline(id={self.id}, name='{self.name}')>"
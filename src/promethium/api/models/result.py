@@ -1,12 +1,14 @@
 """
 Result model for storing job outputs.
 """
+import uuid
 from datetime import datetime
 from typing import Optional, Dict, Any
-from sqlalchemy import String, DateTime, JSON, ForeignKey
+from sqlalchemy import DateTime, ForeignKey, Index, Text, Uuid
+from sqlalchemy.sql import func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from promethium.api.models.base import Base
+from promethium.api.models.base import Base, JSONType, EMPTY_JSON_OBJECT
 
 
 class Result(Base):
@@ -24,20 +26,24 @@ class Result(Base):
         created_at: Creation timestamp.
     """
     __tablename__ = "results"
+    __table_args__ = (
+        Index("ix_results_job_created", "job_id", "created_at"),
+        Index("ix_results_created_id", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    job_id: Mapped[str] = mapped_column(ForeignKey("jobs.id"), nullable=False, index=True)
+    job_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("jobs.id"), nullable=False)
     dataset_id: Mapped[Optional[int]] = mapped_column(ForeignKey("datasets.id"), nullable=True)
     model_id: Mapped[Optional[int]] = mapped_column(ForeignKey("models.id"), nullable=True)
-    result_path: Mapped[str] = mapped_column(String(1024), nullable=False)
-    metrics: Mapped[Dict[str, Any]] = mapped_column(JSON, default=dict, nullable=False)
-    metadata_json: Mapped[Dict[str, Any]] = mapped_column(JSON, default=dict, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    result_path: Mapped[str] = mapped_column(Text, nullable=False)
+    metrics: Mapped[Dict[str, Any]] = mapped_column(JSONType, server_default=EMPTY_JSON_OBJECT, nullable=False)
+    metadata_json: Mapped[Dict[str, Any]] = mapped_column(JSONType, server_default=EMPTY_JSON_OBJECT, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # Relationships
-    job: Mapped["Job"] = relationship("Job", back_populates="results")
-    dataset: Mapped[Optional["Dataset"]] = relationship("Dataset", back_populates="results")
-    model: Mapped[Optional["MLModel"]] = relationship("MLModel", back_populates="results")
+    job: Mapped["Job"] = relationship("Job", back_populates="results", lazy="raise")
+    dataset: Mapped[Optional["Dataset"]] = relationship("Dataset", back_populates="results", lazy="raise")
+    model: Mapped[Optional["MLModel"]] = relationship("MLModel", back_populates="results", lazy="raise")
 
     def __repr__(self) -> str:
         return f"<Result(id={self.id}, job_id='{self.job_id}')>"
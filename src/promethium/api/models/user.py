@@ -3,10 +3,11 @@ User model for authentication and authorization.
 """
 from datetime import datetime
 from typing import Optional, List
-from sqlalchemy import String, Boolean, DateTime
+from sqlalchemy import String, Boolean, DateTime, Index
+from sqlalchemy.sql import func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from promethium.api.models.base import Base
+from promethium.api.models.base import Base, EmailType
 
 
 class User(Base):
@@ -24,20 +25,24 @@ class User(Base):
         updated_at: Last modification timestamp.
     """
     __tablename__ = "users"
+    __table_args__ = (
+        Index("ix_users_created_id", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    email: Mapped[str] = mapped_column(String(255), unique=True, index=True, nullable=False)
+    email: Mapped[str] = mapped_column(EmailType, unique=True, index=True, nullable=False)
     hashed_password: Mapped[str] = mapped_column(String(255), nullable=False)
     full_name: Mapped[str] = mapped_column(String(255), nullable=False)
     role: Mapped[str] = mapped_column(String(50), default="user", nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, onupdate=datetime.utcnow, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=True)
 
-    # Relationships
-    datasets: Mapped[List["Dataset"]] = relationship("Dataset", back_populates="owner")
-    pipelines: Mapped[List["Pipeline"]] = relationship("Pipeline", back_populates="owner")
-    experiments: Mapped[List["Experiment"]] = relationship("Experiment", back_populates="owner")
+    # Relationships. lazy="raise" turns an implicit per-access SELECT (N+1)
+    # into an error; load them explicitly with selectinload() where needed.
+    datasets: Mapped[List["Dataset"]] = relationship("Dataset", back_populates="owner", lazy="raise")
+    pipelines: Mapped[List["Pipeline"]] = relationship("Pipeline", back_populates="owner", lazy="raise")
+    experiments: Mapped[List["Experiment"]] = relationship("Experiment", back_populates="owner", lazy="raise")
 
     def __repr__(self) -> str:
         return f"<User(id={self.id}, email='{self.email}', role='{self.role}')>"
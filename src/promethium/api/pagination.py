@@ -0,0 +1,97 @@
+"""
+Keyset pagination for list endpoints.
+
+Pages are ordered newest first by ``(created_at, id)`` and continue from an
+opaque cursor holding the last row's key, so fetching a deep page costs the
+same index range scan as the first one instead of reading and discarding
+``OFFSET`` rows.
+
+Only the columns the response schema declares are selected, and rows come
+back as plain dicts: no ORM instances, identity-map bookkeeping or
+attribute reflection during response validation.
+"""
+import base64
+import binascii
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+from fastapi import HTTPException
+from pydantic import BaseModel
+from sqlalchemy import Select, literal, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+MAX_PAGE_SIZE = 1000
+
+
+def encode_cursor(created_at: datetime, row_id: Any) -> str:
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, id_type: type) -> Tuple[datetime, Any]:
+    """Parse a cursor from :func:`encode_cursor`; malformed cursors are a 400."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, row_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), id_type(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor") from None
+
+
+def _cursor_timestamp(db: AsyncSession, created_at: datetime) -> Any:
+    # SQLite keeps server-default timestamps as "YYYY-MM-DD HH:MM:SS" text and
+    # compares them as strings; a bound datetime would carry a ".000000"
+    # suffix and sort after the row it came from.
+    if db.get_bind().dialect.name == "sqlite":
+        return literal(created_at.strftime("%Y-%m-%d %H:%M:%S"))
+    return created_at
+
+
+@lru_cache(maxsize=None)
+def _schema_columns(model: Any, schema: type) -> Tuple[Any, ...]:
+    """Mapped attributes of ``model`` that ``schema`` serializes, plus the keyset."""
+    names = set(schema.model_fields) | {"created_at", "id"}
+    return tuple(
+        getattr(model, attr.key)
+        for attr in model.__mapper__.column_attrs
+        if attr.key in names
+    )
+
+
+async def paginate(
+    db: AsyncSession,
+    query: Select,
+    model: Any,
+    schema: type[BaseModel],
+    cursor: Optional[str] = None,
+    limit: int = 100,
+) -> Dict[str, Any]:
+    """
+    Run ``query`` for one page of ``model`` rows after ``cursor``.
+
+    ``query`` is a ``select(model)`` with any filters applied; its columns
+    are narrowed to those ``schema`` needs. Returns the ``Page`` shape:
+    ``items`` (dicts) plus ``next_cursor``, which is None on the last page.
+    One extra row is fetched to tell whether another page exists.
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    if cursor:
+        created_at, row_id = decode_cursor(cursor, model.id.type.python_type)
+        created_at = _cursor_timestamp(db, created_at)
+        query = query.where(tuple_(model.created_at, model.id) < tuple_(created_at, row_id))
+    query = (
+        query.with_only_columns(*_schema_columns(model, schema))
+        .order_by(model.created_at.desc(), model.id.desc())
+        .limit(limit + 1)
+    )
+
+    result = await db.execute(query)
+    items = [dict(row) for row in result.mappings()]
+
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        last = items[-1]
+        next_cursor = encode_cursor(last["created_at"], last["id"])
+    return {"items": items, "next_cursor": next_cursor}
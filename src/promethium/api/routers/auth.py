@@ -17,6 +17,10 @@ from promethium.api.models.user import User
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 settings = get_settings()
+_ACCESS_TOKEN_EXPIRES = timedelta(
+    minutes=getattr(settings, "ACCESS_TOKEN_EXPIRE_MINUTES", 60 * 24 * 8) # 8 days default
+)
+_ACCESS_TOKEN_EXPIRES_IN = int(_ACCESS_TOKEN_EXPIRES.total_seconds())
 
 @router.post("/login", response_model=Token)
 async def login_access_token(
@@ -37,22 +41,18 @@ async def login_access_token(
             headers={"WWW-Authenticate": "Bearer"},
         )
         
-    access_token_expires = timedelta(
-        minutes=getattr(settings, "ACCESS_TOKEN_EXPIRE_MINUTES", 60 * 24 * 8) # 8 days default
-    )
-    
     access_token = AuthService.create_access_token(
-        data={"sub": str(user.id)}, expires_delta=access_token_expires
+        data={"sub": str(user.id)}, expires_delta=_ACCESS_TOKEN_EXPIRES
     )
     
     return {
         "access_token": access_token,
         "token_type": "bearer",
-        "expires_in": int(access_token_expires.total_seconds())
+        "expires_in": _ACCESS_TOKEN_EXPIRES_IN
     }
 
 
-@router.get("/me", response_model=UserRead)
+@router.get("/me", response_model=UserRead, response_model_exclude_unset=True)
 async def read_users_me(
     current_user: User = Depends(get_current_active_user),
 ) -> Any:
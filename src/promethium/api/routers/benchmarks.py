@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, update
 from sqlalchemy.future import select
-from typing import List, Optional
-from datetime import datetime
+from typing import Optional
 
 from promethium.core.database import get_db
 from promethium.api.models.benchmark import Benchmark
@@ -13,13 +13,17 @@ from promethium.api.schemas.benchmark import (
 )
 from promethium.api.deps.auth import get_current_active_user
 from promethium.core.logging import logger
+from promethium.api.cache import cached, invalidate
+from promethium.api.pagination import paginate
+from promethium.api.schemas.pagination import Page
 
 router = APIRouter(prefix="/benchmarks", tags=["benchmarks"])
 
 
-@router.get("/", response_model=List[BenchmarkRead])
+@router.get("/", response_model=Page[BenchmarkRead])
+@cached("benchmarks", Page[BenchmarkRead])
 async def list_benchmarks(
-    skip: int = 0, 
+    cursor: Optional[str] = None,
     limit: int = 100,
     status: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
@@ -33,9 +37,7 @@ async def list_benchmarks(
     if status:
         query = query.where(Benchmark.status == status)
     
-    query = query.offset(skip).limit(limit).order_by(Benchmark.created_at.desc())
-    result = await db.execute(query)
-    return result.scalars().all()
+    return await paginate(db, query, Benchmark, BenchmarkRead, cursor, limit)
 
 
 @router.post("/", response_model=BenchmarkRead, status_code=status.HTTP_201_CREATED)
@@ -59,13 +61,14 @@ async def create_benchmark(
     
     db.add(new_benchmark)
     await db.commit()
-    await db.refresh(new_benchmark)
+    await invalidate("benchmarks")
     
     logger.info(f"Benchmark created: {new_benchmark.id}")
     return new_benchmark
 
 
 @router.get("/{benchmark_id}", response_model=BenchmarkRead)
+@cached("benchmarks", BenchmarkRead)
 async def get_benchmark(
     benchmark_id: int,
     db: AsyncSession = Depends(get_db),
@@ -93,19 +96,28 @@ async def update_benchmark(
     """
     Update a benchmark configuration.
     """
-    benchmark = await db.get(Benchmark, benchmark_id)
+    update_data = benchmark_update.model_dump(exclude_unset=True)
+    if update_data:
+        # Single UPDATE ... RETURNING instead of load, mutate, flush
+        stmt = (
+            update(Benchmark)
+            .where(Benchmark.id == benchmark_id)
+            .values(**update_data)
+            .returning(Benchmark)
+            .execution_options(synchronize_session=False)
+        )
+        benchmark = (await db.execute(stmt)).scalar_one_or_none()
+    else:
+        benchmark = await db.get(Benchmark, benchmark_id)
     if not benchmark:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, 
             detail="Benchmark not found"
         )
     
-    update_data = benchmark_update.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(benchmark, key, value)
-    
     await db.commit()
-    await db.refresh(benchmark)
+    
+    await invalidate("benchmarks")
     return benchmark
 
 
@@ -127,6 +139,7 @@ async def delete_benchmark(
     
     await db.delete(benchmark)
     await db.commit()
+    await invalidate("benchmarks")
     return None
 
 
@@ -140,27 +153,38 @@ async def run_benchmark(
     """
     Execute a benchmark run. Queues the benchmark for execution.
     """
-    benchmark = await db.get(Benchmark, benchmark_id)
-    if not benchmark:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, 
-            detail="Benchmark not found"
+    # Claim the benchmark and stamp the start time (database clock) in one
+    # statement; the status condition also stops two concurrent runs.
+    stmt = (
+        update(Benchmark)
+        .where(
+            Benchmark.id == benchmark_id,
+            Benchmark.status != BenchmarkStatus.RUNNING.value,
         )
-    
-    if benchmark.status == BenchmarkStatus.RUNNING.value:
+        .values(
+            status=BenchmarkStatus.RUNNING.value,
+            started_at=func.now(),
+            completed_at=None,
+            metrics_json=None,
+        )
+        .returning(Benchmark)
+        .execution_options(synchronize_session=False)
+    )
+    benchmark = (await db.execute(stmt)).scalar_one_or_none()
+    if not benchmark:
+        if not await db.get(Benchmark, benchmark_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, 
+                detail="Benchmark not found"
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Benchmark is already running"
         )
     
-    # Update status and start time
-    benchmark.status = BenchmarkStatus.RUNNING.value
-    benchmark.started_at = datetime.utcnow()
-    benchmark.completed_at = None
-    benchmark.metrics_json = None
-    
     await db.commit()
-    await db.refresh(benchmark)
+    
+    await invalidate("benchmarks")
     
     # TODO: Trigger Celery task for actual benchmark execution
     # task = run_benchmark_task.delay(benchmark_id=benchmark_id, params=params)
@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import update
 from sqlalchemy.future import select
-from typing import List
+from typing import Optional
 
 from promethium.core.database import get_db
 from promethium.api.models.experiment import Experiment
@@ -9,6 +10,9 @@ from promethium.api.models.user import User
 from promethium.api.schemas.experiment import ExperimentRead, ExperimentCreate, ExperimentUpdate
 from promethium.api.deps.auth import get_current_active_user
 from promethium.core.logging import logger
+from promethium.api.cache import cached, invalidate
+from promethium.api.pagination import paginate
+from promethium.api.schemas.pagination import Page
 
 router = APIRouter(prefix="/experiments", tags=["experiments"])
 
@@ -27,21 +31,21 @@ async def create_experiment(
     )
     db.add(new_experiment)
     await db.commit()
-    await db.refresh(new_experiment)
+    await invalidate("experiments")
     return new_experiment
 
-@router.get("/", response_model=List[ExperimentRead])
+@router.get("/", response_model=Page[ExperimentRead])
+@cached("experiments", Page[ExperimentRead])
 async def list_experiments(
-    skip: int = 0, 
+    cursor: Optional[str] = None,
     limit: int = 100, 
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(Experiment).offset(skip).limit(limit))
-    experiments = result.scalars().all()
-    return experiments
+    return await paginate(db, select(Experiment), Experiment, ExperimentRead, cursor, limit)
 
 @router.get("/{experiment_id}", response_model=ExperimentRead)
+@cached("experiments", ExperimentRead)
 async def get_experiment(
     experiment_id: int, 
     db: AsyncSession = Depends(get_db),
@@ -59,20 +63,21 @@ async def update_experiment(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    experiment = await db.get(Experiment, experiment_id)
+    update_data = experiment_in.model_dump(exclude_none=True)
+    if update_data:
+        stmt = (
+            update(Experiment)
+            .where(Experiment.id == experiment_id)
+            .values(**update_data)
+            .returning(Experiment)
+            .execution_options(synchronize_session=False)
+        )
+        experiment = (await db.execute(stmt)).scalar_one_or_none()
+    else:
+        experiment = await db.get(Experiment, experiment_id)
     if not experiment:
         raise HTTPException(status_code=404, detail="Experiment not found")
-        
-    if experiment.name:
-        experiment.name = experiment_in.name
-    if experiment_in.description is not None:
-        experiment.description = experiment_in.description
-    if experiment_in.tags is not None:
-        experiment.tags = experiment_in.tags
-    if experiment_in.metadata_json is not None:
-         experiment.metadata_json = experiment_in.metadata_json
 
-    db.add(experiment)
     await db.commit()
-    await db.refresh(experiment)
+    await invalidate("experiments")
     return experiment
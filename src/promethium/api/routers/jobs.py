@@ -1,9 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import insert
 from sqlalchemy.future import select
 from typing import List, Optional
-from datetime import datetime
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 from promethium.core.database import get_db
 from promethium.api.models.job import Job
@@ -12,6 +12,9 @@ from promethium.api.models.user import User
 from promethium.api.schemas.job import JobRead, JobCreate, JobStatus
 from promethium.api.deps.auth import get_current_active_user
 from promethium.core.logging import logger
+from promethium.api.cache import cached, invalidate
+from promethium.api.pagination import paginate
+from promethium.api.schemas.pagination import Page
 
 # Import Celery task (stub for now if not existing)
 # from promethium.workflows.tasks import run_reconstruction_job
@@ -33,21 +36,12 @@ async def create_job(
         if not dataset:
             raise HTTPException(status_code=404, detail="Dataset not found")
 
-    job_id = str(uuid4())
-    new_job = Job(
-        id=job_id,
-        dataset_id=job_in.dataset_id,
-        pipeline_id=job_in.pipeline_id,
-        model_id=job_in.model_id,
-        experiment_id=job_in.experiment_id,
-        status=JobStatus.QUEUED.value,
-        params=job_in.params,
-        created_at=datetime.utcnow()
-    )
+    job_id = uuid4()
+    new_job = Job(**job_in.model_dump(), id=job_id, status=JobStatus.QUEUED.value)
     
     db.add(new_job)
     await db.commit()
-    await db.refresh(new_job)
+    await invalidate("jobs")
     
     # Trigger Celery task (Placeholder for now)
     # task = run_reconstruction_job.delay(job_id=job_id, ...)
@@ -55,9 +49,47 @@ async def create_job(
     
     return new_job
 
+@router.post("/batch", response_model=List[JobRead], status_code=201)
+async def create_jobs_batch(
+    jobs_in: List[JobCreate],
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Submit several processing jobs at once.
+
+    All referenced datasets are checked with one query and the jobs are
+    inserted with one multi-row INSERT; if any dataset is missing, nothing
+    is created.
+    """
+    if not jobs_in:
+        return []
+
+    dataset_ids = {job_in.dataset_id for job_in in jobs_in if job_in.dataset_id}
+    if dataset_ids:
+        result = await db.execute(select(Dataset.id).where(Dataset.id.in_(dataset_ids)))
+        missing = dataset_ids - set(result.scalars().all())
+        if missing:
+            raise HTTPException(
+                status_code=404, detail=f"Dataset not found: {sorted(missing)}"
+            )
+
+    rows = [
+        {**job_in.model_dump(), "id": uuid4(), "status": JobStatus.QUEUED.value}
+        for job_in in jobs_in
+    ]
+    result = await db.scalars(insert(Job).returning(Job, sort_by_parameter_order=True), rows)
+    new_jobs = result.all()
+    await db.commit()
+    await invalidate("jobs")
+
+    logger.info(f"Batch of {len(new_jobs)} jobs submitted to queue")
+    return new_jobs
+
 @router.get("/{job_id}", response_model=JobRead)
+@cached("jobs", JobRead, expire=5)
 async def get_job(
-    job_id: str, 
+    job_id: UUID, 
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
@@ -66,13 +98,12 @@ async def get_job(
         raise HTTPException(status_code=404, detail="Job not found")
     return job
 
-@router.get("/", response_model=List[JobRead])
+@router.get("/", response_model=Page[JobRead])
+@cached("jobs", Page[JobRead], expire=5)
 async def list_jobs(
-    skip: int = 0, 
+    cursor: Optional[str] = None,
     limit: int = 100, 
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(Job).offset(skip).limit(limit))
-    jobs = result.scalars().all()
-    return jobs
+    return await paginate(db, select(Job), Job, JobRead, cursor, limit)
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from typing import List
+from typing import Optional
 
 from promethium.core.database import get_db
 from promethium.api.models.ml_model import MLModel
@@ -9,6 +9,9 @@ from promethium.api.models.user import User
 from promethium.api.schemas.ml_model import MLModelRead, MLModelCreate, MLModelUpdate
 from promethium.api.deps.auth import get_current_active_user
 from promethium.core.logging import logger
+from promethium.api.cache import cached, invalidate
+from promethium.api.pagination import paginate
+from promethium.api.schemas.pagination import Page
 
 router = APIRouter(prefix="/ml/models", tags=["ml-models"])
 
@@ -28,21 +31,21 @@ async def create_model(
     )
     db.add(new_model)
     await db.commit()
-    await db.refresh(new_model)
+    await invalidate("models")
     return new_model
 
-@router.get("/", response_model=List[MLModelRead])
+@router.get("/", response_model=Page[MLModelRead])
+@cached("models", Page[MLModelRead])
 async def list_models(
-    skip: int = 0, 
+    cursor: Optional[str] = None,
     limit: int = 100, 
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(MLModel).offset(skip).limit(limit))
-    models = result.scalars().all()
-    return models
+    return await paginate(db, select(MLModel), MLModel, MLModelRead, cursor, limit)
 
 @router.get("/{model_id}", response_model=MLModelRead)
+@cached("models", MLModelRead)
 async def get_model(
     model_id: int, 
     db: AsyncSession = Depends(get_db),
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from typing import List
+from typing import Optional
 
 from promethium.core.database import get_db
 from promethium.api.models.pipeline import Pipeline
@@ -9,6 +9,9 @@ from promethium.api.models.user import User
 from promethium.api.schemas.pipeline import PipelineRead, PipelineCreate, PipelineUpdate
 from promethium.api.deps.auth import get_current_active_user
 from promethium.core.logging import logger
+from promethium.api.cache import cached, invalidate
+from promethium.api.pagination import paginate
+from promethium.api.schemas.pagination import Page
 
 router = APIRouter(prefix="/pipelines", tags=["pipelines"])
 
@@ -26,21 +29,21 @@ async def create_pipeline(
     )
     db.add(new_pipeline)
     await db.commit()
-    await db.refresh(new_pipeline)
+    await invalidate("pipelines")
     return new_pipeline
 
-@router.get("/", response_model=List[PipelineRead])
+@router.get("/", response_model=Page[PipelineRead])
+@cached("pipelines", Page[PipelineRead])
 async def list_pipelines(
-    skip: int = 0, 
+    cursor: Optional[str] = None,
     limit: int = 100, 
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(Pipeline).offset(skip).limit(limit))
-    pipelines = result.scalars().all()
-    return pipelines
+    return await paginate(db, select(Pipeline), Pipeline, PipelineRead, cursor, limit)
 
 @router.get("/{pipeline_id}", response_model=PipelineRead)
+@cached("pipelines", PipelineRead)
 async def get_pipeline(
     pipeline_id: int, 
     db: AsyncSession = Depends(get_db),
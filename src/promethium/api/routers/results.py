@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import insert
 from sqlalchemy.future import select
-from typing import List
+from typing import List, Optional
 
 from promethium.core.database import get_db
 from promethium.api.models.result import Result
@@ -9,6 +10,9 @@ from promethium.api.models.user import User
 from promethium.api.schemas.result import ResultRead, ResultCreate
 from promethium.api.deps.auth import get_current_active_user
 from promethium.core.logging import logger
+from promethium.api.cache import cached, invalidate
+from promethium.api.pagination import paginate
+from promethium.api.schemas.pagination import Page
 
 router = APIRouter(prefix="/results", tags=["results"])
 
@@ -29,21 +33,44 @@ async def create_result(
     )
     db.add(new_result)
     await db.commit()
-    await db.refresh(new_result)
+    await invalidate("results")
     return new_result
 
-@router.get("/", response_model=List[ResultRead])
+@router.post("/batch", response_model=List[ResultRead], status_code=201)
+async def create_results_batch(
+    results_in: List[ResultCreate],
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Store several results in one executemany INSERT ... RETURNING.
+
+    Workers should accumulate results and post them here rather than
+    calling create_result once per row.
+    """
+    if not results_in:
+        return []
+    result = await db.scalars(
+        insert(Result).returning(Result, sort_by_parameter_order=True),
+        [result_in.model_dump() for result_in in results_in],
+    )
+    new_results = result.all()
+    await db.commit()
+    await invalidate("results")
+    return new_results
+
+@router.get("/", response_model=Page[ResultRead])
+@cached("results", Page[ResultRead])
 async def list_results(
-    skip: int = 0, 
+    cursor: Optional[str] = None,
     limit: int = 100, 
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(Result).offset(skip).limit(limit))
-    results = result.scalars().all()
-    return results
+    return await paginate(db, select(Result), Result, ResultRead, cursor, limit)
 
 @router.get("/{result_id}", response_model=ResultRead)
+@cached("results", ResultRead)
 async def get_result(
     result_id: int, 
     db: AsyncSession = Depends(get_db),
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException
+from cachetools import TTLCache
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text, func, select
 import platform
@@ -17,21 +18,52 @@ from promethium.api.models.experiment import Experiment
 router = APIRouter(prefix="/system", tags=["system"])
 settings = get_settings()
 
+ACTIVE_JOB_STATUSES = ("running", "queued")
+STATS_CACHE_TTL_SECONDS = 10
+HEALTH_CACHE_TTL_SECONDS = 5
+
+
+def _count(model, *criteria):
+    return select(func.count()).select_from(model).where(*criteria).scalar_subquery()
+
+
+# All counters as scalar subqueries of one SELECT: a single round-trip
+_STATS_STMT = select(
+    _count(User).label("total_users"),
+    _count(Dataset).label("total_datasets"),
+    _count(Job).label("total_jobs"),
+    _count(Job, Job.status.in_(ACTIVE_JOB_STATUSES)).label("active_jobs"),
+    _count(Experiment).label("total_experiments"),
+)
+
+_stats_cache: TTLCache = TTLCache(maxsize=1, ttl=STATS_CACHE_TTL_SECONDS)
+_health_cache: TTLCache = TTLCache(maxsize=1, ttl=HEALTH_CACHE_TTL_SECONDS)
+
+
+async def _probe_database() -> str:
+    """Run ``SELECT 1`` at most once per HEALTH_CACHE_TTL_SECONDS per worker."""
+    db_status = _health_cache.get("database")
+    if db_status is None:
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+            db_status = "connected"
+        except Exception as e:
+            logger.error(f"Database health check failed: {e}")
+            db_status = "disconnected"
+        _health_cache["database"] = db_status
+    return db_status
+
 @router.get("/health", response_model=HealthResponse)
 async def health_check():
     """
     Check system health and database connectivity.
-    """
-    status = "ok"
-    db_status = "connected"
     
-    try:
-        async with engine.begin() as conn:
-            await conn.execute(text("SELECT 1"))
-    except Exception as e:
-        logger.error(f"Database health check failed: {e}")
-        db_status = "disconnected"
-        status = "degraded"
+    The database probe result is reused for a few seconds so frequent
+    readiness checks don't each take a pool connection.
+    """
+    db_status = await _probe_database()
+    status = "ok" if db_status == "connected" else "degraded"
         
     return {
         "status": status,
@@ -64,25 +96,12 @@ async def system_stats(
 ):
     """
     Get current system statistics.
-    """
-    # Helper to count table rows
-    async def count(model):
-        result = await db.execute(select(func.count()).select_from(model))
-        return result.scalar()
-
-    total_users = await count(User)
-    total_datasets = await count(Dataset)
-    total_jobs = await count(Job)
-    total_experiments = await count(Experiment)
     
-    # Count active jobs (running or queued)
-    # result = await db.execute(select(func.count()).select_from(Job).where(Job.status.in_(["running", "queued"])))
-    # active_jobs = result.scalar()
-    
-    return {
-        "total_users": total_users,
-        "total_datasets": total_datasets,
-        "total_jobs": total_jobs,
-        "active_jobs": 0, # Placeholder for optimization or complex query
-        "total_experiments": total_experiments
-    }
+    Counts are cached per worker for a few seconds; dashboards poll this.
+    """
+    stats = _stats_cache.get("stats")
+    if stats is None:
+        result = await db.execute(_STATS_STMT)
+        stats = dict(result.one()._mapping)
+        _stats_cache["stats"] = stats
+    return stats
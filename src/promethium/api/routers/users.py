@@ -1,20 +1,45 @@
 """
 User management methods.
 """
-from typing import Any, List
+from typing import Any, Optional
 from fastapi import APIRouter, Body, Depends, HTTPException, status
 from fastapi.encoders import jsonable_encoder
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from promethium.core.database import get_db
-from promethium.core.security import get_password_hash
+from promethium.core.security import get_password_hash_async
 from promethium.api.models.user import User
 from promethium.api.schemas.user import UserCreate, UserRead, UserUpdate
-from promethium.api.deps.auth import get_current_active_user, get_current_admin_user
+from promethium.api.deps.auth import (
+    get_current_active_user,
+    get_current_admin_user,
+    invalidate_cached_user,
+)
+from promethium.api.cache import cached, invalidate
+from promethium.api.pagination import paginate
+from promethium.api.schemas.pagination import Page
 
 router = APIRouter(prefix="/users", tags=["users"])
 
+
+async def _commit_unique_email(db: AsyncSession) -> None:
+    """
+    Commit a user write, relying on the unique email index.
+    
+    Checking for an existing email first costs an extra round-trip and still
+    races with concurrent writes; the constraint decides either way.
+    """
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=400,
+            detail="The user with this user name already exists in the system.",
+        ) from None
+
 @router.post("/", response_model=UserRead, status_code=201)
 async def create_user(
     *,
@@ -24,31 +49,23 @@ async def create_user(
     """
     Create new user.
     """
-    # Check if user with this email already exists
-    result = await db.execute(select(User).where(User.email == user_in.email))
-    existing_user = result.scalars().first()
-    if existing_user:
-        raise HTTPException(
-            status_code=400,
-            detail="The user with this user name already exists in the system.",
-        )
-    
     # Create new user
     db_user = User(
         email=user_in.email,
-        hashed_password=get_password_hash(user_in.password),
+        hashed_password=await get_password_hash_async(user_in.password),
         full_name=user_in.full_name,
         is_active=True,
         role="user" # Default role
     )
     db.add(db_user)
-    await db.commit()
-    await db.refresh(db_user)
+    await _commit_unique_email(db)
+    await invalidate("users")
     return db_user
 
-@router.get("/", response_model=List[UserRead])
+@router.get("/", response_model=Page[UserRead])
+@cached("users", Page[UserRead])
 async def read_users(
-    skip: int = 0,
+    cursor: Optional[str] = None,
     limit: int = 100,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
@@ -56,11 +73,10 @@ async def read_users(
     """
     Retrieve users.
     """
-    result = await db.execute(select(User).offset(skip).limit(limit))
-    users = result.scalars().all()
-    return users
+    return await paginate(db, select(User), User, UserRead, cursor, limit)
 
 @router.get("/{user_id}", response_model=UserRead)
+@cached("users", UserRead)
 async def read_user_by_id(
     user_id: int,
     current_user: User = Depends(get_current_active_user),
@@ -101,23 +117,16 @@ async def update_user(
         )
         
     if user_in.password:
-        user.hashed_password = get_password_hash(user_in.password)
+        user.hashed_password = await get_password_hash_async(user_in.password)
         
     if user_in.full_name:
         user.full_name = user_in.full_name
         
     if user_in.email:
-         # Check if email is taken by another user
-        result = await db.execute(select(User).where(User.email == user_in.email))
-        existing_user = result.scalars().first()
-        if existing_user and existing_user.id != user_id:
-             raise HTTPException(
-                status_code=400,
-                detail="The user with this user name already exists in the system.",
-            )
         user.email = user_in.email
 
     db.add(user)
-    await db.commit()
-    await db.refresh(user)
+    await _commit_unique_email(db)
+    await invalidate("users")
+    invalidate_cached_user(user.id)
     return user
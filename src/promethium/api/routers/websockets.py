@@ -1,38 +1,201 @@
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends
-from typing import List, Dict
+from typing import Dict, List, Optional, Set, Union
+import asyncio
 import json
 
+import orjson
+from pydantic import BaseModel
+
+from promethium.core.config import get_settings
 from promethium.core.logging import logger
+from promethium.workflows.progress import JOB_CHANNEL_PREFIX
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+settings = get_settings()
+
+# Delay before re-subscribing after the Redis connection drops
+SUBSCRIBE_RETRY_SECONDS = 5.0
+# Frames buffered per socket before the oldest are dropped
+SEND_QUEUE_SIZE = 256
+# Client keepalive frame, echoed back unchanged
+HEARTBEAT = b"\x01"
+# Sec-WebSocket-Protocol value selecting binary msgpack frames
+MSGPACK_SUBPROTOCOL = "promethium-msgpack-v1"
+
+if msgpack is not None:
+    _packer = msgpack.Packer()
+    # {"type": "batch", "items": <array>} up to the array header
+    _MSGPACK_BATCH_PREFIX = (
+        _packer.pack_map_header(2)
+        + _packer.pack("type") + _packer.pack("batch")
+        + _packer.pack("items")
+    )
 
 router = APIRouter(prefix="/ws", tags=["websockets"])
 
 class ConnectionManager:
+    """
+    Tracks job progress subscribers.
+
+    Each connection has its own outgoing queue and writer task, so
+    ``broadcast_to_job`` only enqueues. When a writer wakes up it drains
+    everything queued for its socket and sends it as one frame: a lone
+    message as-is, several as ``{"type": "batch", "items": [...]}``. Sends
+    to different sockets therefore run concurrently, and a socket whose
+    send fails is disconnected. Each queue is bounded; once a slow client
+    is ``SEND_QUEUE_SIZE`` messages behind, its oldest are dropped, which
+    is safe because every progress message carries the job's full state.
+
+    Clients that offer the ``promethium-msgpack-v1`` subprotocol get the
+    same messages as binary msgpack frames instead of JSON text. Each
+    message is encoded at most once per format, however many sockets
+    receive it.
+
+    The manager is only touched from the event loop and never awaits while
+    updating its dicts, so it needs no locks; it is not thread-safe.
+    Cross-process delivery goes through Redis, not shared state here.
+    ``disconnect`` stays idempotent because a socket can be dropped both by
+    its writer and by the endpoint.
+
+    While it has any connections, the manager also listens on the Redis job
+    progress channels (see :mod:`promethium.workflows.progress`) and
+    forwards messages for the jobs its own sockets are watching.
+    """
+
     def __init__(self):
-        # job_id -> list of websockets
-        self.active_connections: Dict[str, List[WebSocket]] = {}
+        # job_id -> {websocket: outgoing queue}
+        self.active_connections: Dict[str, Dict[WebSocket, asyncio.Queue]] = {}
+        self._writers: Dict[WebSocket, asyncio.Task] = {}
+        # Sockets that negotiated msgpack frames
+        self._binary: Set[WebSocket] = set()
+        self._listener: Optional[asyncio.Task] = None
 
     async def connect(self, websocket: WebSocket, job_id: str):
-        await websocket.accept()
-        if job_id not in self.active_connections:
-            self.active_connections[job_id] = []
-        self.active_connections[job_id].append(websocket)
-        logger.debug(f"Client connected to job {job_id}")
+        binary = (
+            msgpack is not None
+            and MSGPACK_SUBPROTOCOL in websocket.scope.get("subprotocols", ())
+        )
+        await websocket.accept(subprotocol=MSGPACK_SUBPROTOCOL if binary else None)
+        if binary:
+            self._binary.add(websocket)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SEND_QUEUE_SIZE)
+        self.active_connections.setdefault(job_id, {})[websocket] = queue
+        self._writers[websocket] = asyncio.create_task(
+            self._writer(websocket, job_id, queue, binary)
+        )
+        if self._listener is None and aioredis is not None:
+            self._listener = asyncio.create_task(self._listen())
+        logger.debug("Client connected to job %s", job_id)
 
     def disconnect(self, websocket: WebSocket, job_id: str):
-        if job_id in self.active_connections:
-            if websocket in self.active_connections[job_id]:
-                self.active_connections[job_id].remove(websocket)
-            if not self.active_connections[job_id]:
+        connections = self.active_connections.get(job_id)
+        if connections is not None:
+            connections.pop(websocket, None)
+            if not connections:
                 del self.active_connections[job_id]
-        logger.debug(f"Client disconnected from job {job_id}")
+        self._binary.discard(websocket)
+        writer = self._writers.pop(websocket, None)
+        if writer is not None:
+            writer.cancel()
+        if not self.active_connections and self._listener is not None:
+            self._listener.cancel()
+            self._listener = None
+        logger.debug("Client disconnected from job %s", job_id)
+
+    async def broadcast_to_job(self, job_id: str, message: Union[dict, BaseModel]):
+        connections = self.active_connections.get(job_id)
+        if connections:
+            if isinstance(message, BaseModel):
+                # e.g. JobProgress: serialized by pydantic-core, no dict step
+                encoded = message.model_dump_json()
+            else:
+                encoded = orjson.dumps(message).decode()
+            self._enqueue(connections, encoded)
+
+    def _enqueue(self, connections: Dict[WebSocket, asyncio.Queue], encoded: str):
+        # Encoded once per broadcast, shared by every subscriber; the msgpack
+        # form is only built if some subscriber asked for it. It is packed
+        # from the JSON so both forms carry exactly the same values.
+        packed: Optional[bytes] = None
+        for websocket, queue in connections.items():
+            frame: Union[str, bytes] = encoded
+            if websocket in self._binary:
+                if packed is None:
+                    packed = msgpack.packb(orjson.loads(encoded))
+                frame = packed
+            try:
+                queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                queue.get_nowait()
+                queue.put_nowait(frame)
 
-    async def broadcast_to_job(self, job_id: str, message: dict):
-        if job_id in self.active_connections:
-            for connection in self.active_connections[job_id]:
+    async def _writer(
+        self, websocket: WebSocket, job_id: str, queue: asyncio.Queue, binary: bool
+    ):
+        while True:
+            batch: List = [await queue.get()]
+            while True:
                 try:
-                    await connection.send_json(message)
-                except Exception as e:
-                    logger.warning(f"Failed to send message to client: {e}")
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            if len(batch) == 1:
+                frame = batch[0]
+            elif binary:
+                frame = (
+                    _MSGPACK_BATCH_PREFIX
+                    + _packer.pack_array_header(len(batch))
+                    + b"".join(batch)
+                )
+            else:
+                frame = '{"type":"batch","items":[' + ",".join(batch) + "]}"
+            try:
+                if binary:
+                    await websocket.send_bytes(frame)
+                else:
+                    await websocket.send_text(frame)
+            except Exception as e:
+                logger.warning("Failed to send message to client: %s", e)
+                # Stop queueing for a dead socket; the receive loop in the
+                # endpoint calls disconnect() again when it notices, which
+                # is a no-op by then.
+                self.disconnect(websocket, job_id)
+                return
+
+    async def _listen(self):
+        """Forward Redis job progress messages to local subscribers."""
+        prefix = JOB_CHANNEL_PREFIX.encode()
+        while True:
+            client = aioredis.from_url(settings.REDIS_URL)
+            pubsub = client.pubsub()
+            try:
+                await pubsub.psubscribe(JOB_CHANNEL_PREFIX + "*")
+                async for message in pubsub.listen():
+                    if message["type"] != "pmessage":
+                        continue
+                    job_id = message["channel"][len(prefix):].decode()
+                    connections = self.active_connections.get(job_id)
+                    if connections:
+                        # Already JSON from publish_progress; forward as-is
+                        self._enqueue(connections, message["data"].decode())
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Job progress subscription failed: %s", e)
+                await asyncio.sleep(SUBSCRIBE_RETRY_SECONDS)
+            finally:
+                # redis-py < 5.0.1 only has close()
+                await getattr(pubsub, "aclose", pubsub.close)()
+                await getattr(client, "aclose", client.close)()
 
 manager = ConnectionManager()
 
@@ -40,25 +203,26 @@ manager = ConnectionManager()
 async def websocket_job_progress(websocket: WebSocket, job_id: str):
     """
     WebSocket endpoint for real-time job progress updates.
+
+    Clients mostly listen. A binary ``0x01`` frame is a heartbeat and is
+    echoed back; anything else the client sends is ignored.
     """
     await manager.connect(websocket, job_id)
     try:
         while True:
-            # We keep the connection open.
-            # Clients might send heartbeats or commands, but mostly they listen.
-            data = await websocket.receive_text()
-            # echo or handle commands
-            # await websocket.send_text(f"Message text was: {data}")
+            # Raw ASGI messages: incoming frames are discarded without being
+            # decoded into str.
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+            if message.get("bytes") == HEARTBEAT:
+                await websocket.send_bytes(HEARTBEAT)
     except WebSocketDisconnect:
-        manager.disconnect(websocket, job_id)
+        pass
     except Exception as e:
-        logger.error(f"WebSocket error: {e}")
+        logger.error("WebSocket error: %s", e)
+    finally:
         manager.disconnect(websocket, job_id)
 
-# Helper function to be called by Celery workers or other parts of the app
-# Note: This won't work directly if Celery runs in a separate process/container efficiently
-# without a shared backend (like Redis PubSub).
-# For production, we'd use Redis PubSub to broadcast from Worker -> API -> WebSockets.
-# This simple implementation assumes API can push updates (e.g. if job is running async in API).
-# Since we use Celery, the worker needs to publish to Redis, and the API needs to subscribe.
-# That is a bit more complex. For now, we will leave this structure.
+# Workers publish progress with promethium.workflows.progress.publish_progress;
+# every API process relays it to its own sockets via ConnectionManager._listen.
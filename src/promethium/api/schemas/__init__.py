@@ -33,6 +33,7 @@ from promethium.api.schemas.job import (
     JobUpdate,
     JobRead,
     JobProgress,
+    JobProgressMsg,
 )
 from promethium.api.schemas.ml_model import (
     MLModelCreate,
@@ -53,6 +54,7 @@ from promethium.api.schemas.system import (
     SystemInfo,
     SystemStats,
 )
+from promethium.api.schemas.pagination import Page
 
 __all__ = [
     # Auth
@@ -80,6 +82,7 @@ __all__ = [
     "JobUpdate",
     "JobRead",
     "JobProgress",
+    "JobProgressMsg",
     # MLModel
     "MLModelCreate",
     "MLModelUpdate",
@@ -95,4 +98,6 @@ __all__ = [
     "HealthResponse",
     "SystemInfo",
     "SystemStats",
+    # Pagination
+    "Page",
 ]
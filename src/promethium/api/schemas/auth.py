@@ -2,7 +2,7 @@
 Authentication schemas.
 """
 from typing import Optional
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, ConfigDict
 
 
 class Token(BaseModel):
@@ -11,14 +11,20 @@ class Token(BaseModel):
     token_type: str = "bearer"
     expires_in: int
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
 
 class TokenPayload(BaseModel):
     """JWT token payload."""
     sub: Optional[int] = None
     exp: Optional[int] = None
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
 
 class LoginRequest(BaseModel):
     """Login request payload."""
     email: EmailStr
     password: str
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
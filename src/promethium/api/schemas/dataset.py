@@ -3,7 +3,7 @@ Dataset schemas.
 """
 from datetime import datetime
 from typing import Optional, Dict, Any, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 
 
 class UploadInitRequest(BaseModel):
@@ -31,7 +31,7 @@ class DatasetBase(BaseModel):
     name: str = Field(..., min_length=1, max_length=255)
     description: Optional[str] = Field(None, max_length=1024)
     format: str = Field(..., max_length=50)
-    metadata_json: Dict[str, Any] = {}
+    metadata_json: Dict[str, Any] = Field(default_factory=dict)
 
 
 class DatasetCreate(DatasetBase):
@@ -56,5 +56,4 @@ class DatasetRead(DatasetBase):
     owner_id: Optional[int] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -3,15 +3,15 @@ Experiment schemas.
 """
 from datetime import datetime
 from typing import Optional, Dict, Any, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 
 
 class ExperimentBase(BaseModel):
     """Base experiment schema."""
     name: str = Field(..., min_length=1, max_length=255)
     description: Optional[str] = None
-    tags: List[str] = []
-    metadata_json: Dict[str, Any] = {}
+    tags: List[str] = Field(default_factory=list)
+    metadata_json: Dict[str, Any] = Field(default_factory=dict)
 
 
 class ExperimentCreate(ExperimentBase):
@@ -34,5 +34,4 @@ class ExperimentRead(ExperimentBase):
     created_at: datetime
     # We could include job summaries here if needed
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -1,9 +1,11 @@
 """
 Job schemas.
 """
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, Dict, Any, List
-from pydantic import BaseModel, Field
+from uuid import UUID
+from pydantic import BaseModel, Field, ConfigDict
 
 from enum import Enum
 
@@ -22,7 +24,7 @@ class JobBase(BaseModel):
     model_id: Optional[int] = None
     experiment_id: Optional[int] = None
     algorithm: Optional[str] = None
-    params: Dict[str, Any] = {}
+    params: Dict[str, Any] = Field(default_factory=dict)
 
 
 class JobCreate(JobBase):
@@ -38,19 +40,18 @@ class JobUpdate(BaseModel):
 
 class JobRead(JobBase):
     """Job response schema."""
-    id: str
+    id: UUID
     status: str
     result_path: Optional[str] = None
     logs_path: Optional[str] = None
     error_message: Optional[str] = None
     progress: int = 0
-    metrics: Dict[str, Any] = {}
+    metrics: Dict[str, Any] = Field(default_factory=dict)
     created_at: datetime
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class JobProgress(BaseModel):
@@ -60,3 +61,18 @@ class JobProgress(BaseModel):
     progress: int
     metrics: Optional[Dict[str, Any]] = None
     logs: Optional[List[str]] = None
+
+
+@dataclass(slots=True)
+class JobProgressMsg:
+    """
+    Unvalidated ``JobProgress`` for trusted producers (Celery workers).
+
+    Same fields and JSON shape; orjson serializes it directly, so emitting a
+    progress event costs no validation and no per-instance ``__dict__``.
+    """
+    job_id: str
+    status: str
+    progress: int
+    metrics: Optional[Dict[str, Any]] = None
+    logs: Optional[List[str]] = None
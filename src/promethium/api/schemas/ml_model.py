@@ -3,7 +3,7 @@ MLModel schemas.
 """
 from datetime import datetime
 from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 
 
 class MLModelBase(BaseModel):
@@ -12,8 +12,8 @@ class MLModelBase(BaseModel):
     type: str = Field(..., max_length=100)
     version: str = Field(default="1.0.0", max_length=50)
     description: Optional[str] = None
-    config: Dict[str, Any] = {}
-    metrics: Dict[str, Any] = {}
+    config: Dict[str, Any] = Field(default_factory=dict)
+    metrics: Dict[str, Any] = Field(default_factory=dict)
 
 
 class MLModelCreate(MLModelBase):
@@ -33,5 +33,4 @@ class MLModelRead(MLModelBase):
     artifact_path: Optional[str] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,13 @@
+"""
+Pagination schemas.
+"""
+from typing import Generic, List, Optional, TypeVar
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    """One page of a list endpoint; pass ``next_cursor`` back as ``cursor`` for the next."""
+    items: List[T]
+    next_cursor: Optional[str] = None
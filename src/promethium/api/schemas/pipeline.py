@@ -3,14 +3,14 @@ Pipeline schemas.
 """
 from datetime import datetime
 from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 
 
 class PipelineBase(BaseModel):
     """Base pipeline schema."""
     name: str = Field(..., min_length=1, max_length=255)
     description: Optional[str] = None
-    config_json: Dict[str, Any] = {}
+    config_json: Dict[str, Any] = Field(default_factory=dict)
 
 
 class PipelineCreate(PipelineBase):
@@ -33,5 +33,4 @@ class PipelineRead(PipelineBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -3,17 +3,18 @@ Result schemas.
 """
 from datetime import datetime
 from typing import Optional, Dict, Any
-from pydantic import BaseModel
+from uuid import UUID
+from pydantic import BaseModel, Field, ConfigDict
 
 
 class ResultBase(BaseModel):
     """Base result schema."""
-    job_id: str
+    job_id: UUID
     dataset_id: Optional[int] = None
     model_id: Optional[int] = None
     result_path: str
-    metrics: Dict[str, Any] = {}
-    metadata_json: Dict[str, Any] = {}
+    metrics: Dict[str, Any] = Field(default_factory=dict)
+    metadata_json: Dict[str, Any] = Field(default_factory=dict)
 
 
 class ResultCreate(ResultBase):
@@ -26,5 +27,4 @@ class ResultRead(ResultBase):
     id: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
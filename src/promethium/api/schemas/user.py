@@ -3,7 +3,7 @@ User schemas.
 """
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, EmailStr, Field, ConfigDict
 
 
 class UserBase(BaseModel):
@@ -28,13 +28,24 @@ class UserUpdate(BaseModel):
 
 
 class UserRead(UserBase):
-    """User response schema."""
+    """
+    User response schema.
+
+    Scalar columns only: User's datasets/pipelines/experiments relationships
+    are lazy="raise", so adding a collection field here needs a matching
+    selectinload() in the query that produces the user.
+
+    ``email`` and ``role`` were validated when they were written, so they
+    are read back as plain strings: re-running email-validator on every
+    response costs far more than the rest of the model put together.
+    """
+    email: str
+    role: str = "user"
     id: int
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserInDB(UserRead):
@@ -1,17 +1,25 @@
 """
 Authentication service.
 """
-from datetime import datetime, timedelta
+import time
+from datetime import timedelta
 from typing import Optional
-from jose import jwt
+import jwt
 
 from promethium.core.config import get_settings
-from promethium.core.security import verify_password, get_password_hash
+from promethium.core.security import verify_password_async
 from promethium.api.models.user import User
+from sqlalchemy import bindparam
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 settings = get_settings()
+# Use settings or defaults
+_SECRET_KEY = getattr(settings, "SECRET_KEY", "dev_secret_key_change_me")
+_ALGORITHM = getattr(settings, "ALGORITHM", "HS256")
+
+# Built once; only the bound email changes per login
+_USER_BY_EMAIL_STMT = select(User).where(User.email == bindparam("email"))
 
 class AuthService:
     @staticmethod
@@ -21,13 +29,12 @@ class AuthService:
         """
         Authenticate user by email and password.
         """
-        result = await db.execute(select(User).where(User.email == email))
-        user = result.scalars().first()
+        user = await db.scalar(_USER_BY_EMAIL_STMT, {"email": email})
         
         if not user:
             return None
             
-        if not verify_password(password, user.hashed_password):
+        if not await verify_password_async(password, user.hashed_password):
             return None
             
         return user
@@ -39,16 +46,11 @@ class AuthService:
         """
         to_encode = data.copy()
         
-        if expires_delta:
-            expire = datetime.utcnow() + expires_delta
-        else:
-            expire = datetime.utcnow() + timedelta(minutes=15)
-            
-        to_encode.update({"exp": expire})
-        
-        # Use settings or defaults
-        secret_key = getattr(settings, "SECRET_KEY", "dev_secret_key_change_me")
-        algorithm = getattr(settings, "ALGORITHM", "HS256")
+        if expires_delta is None:
+            expires_delta = timedelta(minutes=15)
+        # NumericDate straight from the clock; PyJWT would otherwise
+        # convert a datetime back to this on every encode
+        to_encode["exp"] = int(time.time() + expires_delta.total_seconds())
         
-        encoded_jwt = jwt.encode(to_encode, secret_key, algorithm=algorithm)
+        encoded_jwt = jwt.encode(to_encode, _SECRET_KEY, algorithm=_ALGORITHM)
         return encoded_jwt
@@ -11,14 +11,14 @@ Usage:
     promethium datasets list
     promethium models list
 """
+import functools
 import sys
 from pathlib import Path
-from typing import Optional, List
+from typing import Any, Dict, Optional, List, Sequence, Tuple, Union
 
 try:
     import typer
     from rich.console import Console
-    from rich.table import Table
 except ImportError:
     print("CLI dependencies not installed. Run: pip install promethium-seismic[cli]")
     sys.exit(1)
@@ -28,7 +28,88 @@ app = typer.Typer(
     help="Promethium: Advanced Seismic Data Recovery and Reconstruction Framework",
     add_completion=False,
 )
-console = Console()
+
+
+@functools.cache
+def _get_console() -> Console:
+    """Build the shared Console on first use."""
+    if sys.stdout.isatty():
+        return Console()
+    # Piped output: skip terminal probing, ANSI styling and line wrapping
+    return Console(force_terminal=False, no_color=True, width=10**6)
+
+
+class _LazyConsole:
+    """Stands in for the Console until a command actually prints."""
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(_get_console(), name)
+
+
+console = _LazyConsole()
+
+
+def _emit_table(title: str, columns: Sequence[Tuple[str, str]], rows: Sequence[Sequence[str]]) -> None:
+    """
+    Print ``rows`` under ``columns`` ((header, style) pairs).
+    
+    On a terminal this is a Rich table; when stdout is piped it is plain
+    TSV with a header line, which is cheaper and easy to parse.
+    """
+    if not sys.stdout.isatty():
+        write = sys.stdout.write
+        write("\t".join(header for header, _ in columns) + "\n")
+        for row in rows:
+            write("\t".join(row) + "\n")
+        return
+    
+    from rich.table import Table
+    
+    table = Table(title=title)
+    for header, style in columns:
+        table.add_column(header, style=style)
+    for row in rows:
+        table.add_row(*row)
+    console.print(table)
+
+
+def _print_json(obj: Any) -> None:
+    """Write ``obj`` to stdout as one line of JSON, bypassing Rich."""
+    from promethium.core.serialization import dumps
+    
+    sys.stdout.write(dumps(obj).decode() + "\n")
+
+# Rows for `promethium datasets`: (name, description, size)
+DATASET_ROWS = (
+    ("synthetic_clean", "Clean synthetic shot gather", "100x500"),
+    ("synthetic_noisy", "Noisy synthetic (SNR ~10dB)", "100x500"),
+    ("synthetic_missing", "30% missing traces", "100x500"),
+    ("marmousi", "Marmousi velocity model gather", "240x1000"),
+)
+
+# Rows for `promethium models`: (name, type, description)
+MODEL_ROWS = (
+    ("matrix_completion", "Classical", "Nuclear norm minimization via ISTA"),
+    ("wiener", "Classical", "Frequency-domain Wiener filter"),
+    ("fista", "Classical", "Fast ISTA for sparse recovery"),
+    ("unet_v1", "Deep Learning", "4-level U-Net for interpolation"),
+    ("autoencoder", "Deep Learning", "Convolutional autoencoder denoising"),
+    ("pinn", "Physics-Informed", "Wave equation constrained NN"),
+)
+
+# Input file types picked up when `ingest` is given a directory
+INGEST_EXTENSIONS = frozenset({".sgy", ".segy", ".mseed", ".sac", ".h5", ".hdf5", ".npy"})
+
+# Per-run fields written by `experiments export`, ahead of the metric columns
+EXPORT_COLUMNS = ("run_id", "experiment_id", "pipeline", "dataset", "timestamp")
+
+# How `evaluate` displays each metric: name -> (label, value format, unit)
+METRIC_DISPLAY = {
+    "snr": ("SNR", "{:.4f}", "dB"),
+    "mse": ("MSE", "{:.6e}", ""),
+    "psnr": ("PSNR", "{:.4f}", "dB"),
+    "ssim": ("SSIM", "{:.6f}", ""),
+}
 
 
 @app.command()
@@ -69,7 +150,7 @@ def run(
         dataset = load_seismic_data(str(input_path))
     except Exception as e:
         console.print(f"[red]Error loading data: {e}[/red]")
-        raise typer.Exit(code=1)
+        raise typer.Exit(code=1) from e
     
     console.print(f"Loaded: {dataset.traces.shape[0]} traces, {dataset.traces.shape[1]} samples")
     
@@ -114,17 +195,11 @@ def evaluate(
     - ssim: Structural Similarity Index
     """
     import numpy as np
-    import json
-    from promethium.evaluation.metrics import (
-        signal_to_noise_ratio,
-        mean_squared_error,
-        peak_signal_to_noise_ratio,
-        structural_similarity_index,
-    )
+    from promethium.evaluation.metrics import error_metrics, structural_similarity_index
     
-    # Load data
-    ref_data = np.load(str(reference))
-    est_data = np.load(str(estimate))
+    # Memory-map rather than load: SNR/MSE/PSNR are streamed over blocks
+    ref_data = np.load(str(reference), mmap_mode="r")
+    est_data = np.load(str(estimate), mmap_mode="r")
     
     if ref_data.shape != est_data.shape:
         console.print("[red]Error: Reference and estimate shapes do not match[/red]")
@@ -134,71 +209,50 @@ def evaluate(
     metric_list = [m.strip().lower() for m in metrics.split(",")]
     results = {}
     
-    table = Table(title="Reconstruction Quality Metrics")
-    table.add_column("Metric", style="cyan")
-    table.add_column("Value", style="green")
-    table.add_column("Unit", style="dim")
-    
-    if "snr" in metric_list:
-        val = signal_to_noise_ratio(ref_data, est_data)
-        results["snr"] = val
-        table.add_row("SNR", f"{val:.4f}", "dB")
-    
-    if "mse" in metric_list:
-        val = mean_squared_error(ref_data, est_data)
-        results["mse"] = val
-        table.add_row("MSE", f"{val:.6e}", "")
-    
-    if "psnr" in metric_list:
-        val = peak_signal_to_noise_ratio(ref_data, est_data)
-        results["psnr"] = val
-        table.add_row("PSNR", f"{val:.4f}", "dB")
-    
+    computed = {}
+    if {"snr", "mse", "psnr"} & set(metric_list):
+        # All three from one pass over the (memory-mapped) arrays
+        computed.update(error_metrics(ref_data, est_data))
     if "ssim" in metric_list:
-        val = structural_similarity_index(ref_data, est_data)
-        results["ssim"] = val
-        table.add_row("SSIM", f"{val:.6f}", "")
-    
-    console.print(table)
+        # Windowed over the whole volume, so this one does load both arrays
+        computed["ssim"] = structural_similarity_index(np.asarray(ref_data), np.asarray(est_data))
+    
+    rows = []
+    for name, (label, value_format, unit) in METRIC_DISPLAY.items():
+        if name in metric_list:
+            results[name] = computed[name]
+            rows.append((label, value_format.format(computed[name]), unit))
+    
+    _emit_table(
+        "Reconstruction Quality Metrics",
+        [("Metric", "cyan"), ("Value", "green"), ("Unit", "dim")],
+        rows,
+    )
     
     if output:
-        with open(output, "w") as f:
-            json.dump(results, f, indent=2)
+        from promethium.core.serialization import dumps
+        output.write_bytes(dumps(results, indent=True))
         console.print(f"Metrics saved to: {output}")
 
 
 @app.command()
 def datasets():
     """List available example datasets."""
-    table = Table(title="Available Datasets")
-    table.add_column("Name", style="cyan")
-    table.add_column("Description", style="white")
-    table.add_column("Size", style="dim")
-    
-    table.add_row("synthetic_clean", "Clean synthetic shot gather", "100x500")
-    table.add_row("synthetic_noisy", "Noisy synthetic (SNR ~10dB)", "100x500")
-    table.add_row("synthetic_missing", "30% missing traces", "100x500")
-    table.add_row("marmousi", "Marmousi velocity model gather", "240x1000")
-    
-    console.print(table)
+    _emit_table(
+        "Available Datasets",
+        [("Name", "cyan"), ("Description", "white"), ("Size", "dim")],
+        DATASET_ROWS,
+    )
 
 
 @app.command()
 def models():
     """List available pipeline presets and models."""
-    table = Table(title="Available Pipeline Presets")
-    table.add_column("Name", style="cyan")
-    table.add_column("Type", style="yellow")
-    table.add_column("Description", style="white")
-    
-    table.add_row("matrix_completion", "Classical", "Nuclear norm minimization via ISTA")
-    table.add_row("wiener", "Classical", "Frequency-domain Wiener filter")
-    table.add_row("fista", "Classical", "Fast ISTA for sparse recovery")
-    table.add_row("unet_v1", "Deep Learning", "4-level U-Net for interpolation")
-    table.add_row("autoencoder", "Deep Learning", "Convolutional autoencoder denoising")
-    table.add_row("pinn", "Physics-Informed", "Wave equation constrained NN")
-    
-    console.print(table)
+    _emit_table(
+        "Available Pipeline Presets",
+        [("Name", "cyan"), ("Type", "yellow"), ("Description", "white")],
+        MODEL_ROWS,
+    )
 
 
 @app.command()
@@ -207,6 +261,8 @@ def ingest(
     output_dir: Path = typer.Argument(..., help="Output directory for processed data"),
     format: str = typer.Option("hdf5", "--format", "-f", help="Output format: hdf5, npy, zarr"),
     normalize: bool = typer.Option(False, "--normalize", "-n", help="Normalize traces"),
+    workers: Optional[int] = typer.Option(None, "--workers", "-w",
+                                          help="Files processed concurrently (default: one per CPU)"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
 ):
     """
@@ -214,10 +270,15 @@ def ingest(
     
     Supported input formats: SEG-Y, miniSEED, SAC, HDF5, NumPy.
     Converts to standardized internal representation for pipeline processing.
+    Files are processed on a thread pool, so one file is read while another
+    is written.
     """
     import os
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    import numpy as np
     from promethium.io.readers import load_seismic_data
     from promethium.io.writers import save_seismic_data
+    from promethium.core._numba_kernels import normalize_rows_inplace
     
     console.print("[bold]Promethium Data Ingestion[/bold]")
     
@@ -226,9 +287,10 @@ def ingest(
     
     # Find input files
     if input_path.is_dir():
-        extensions = [".sgy", ".segy", ".mseed", ".sac", ".h5", ".hdf5", ".npy"]
-        files = [f for f in input_path.iterdir() 
-                 if f.suffix.lower() in extensions]
+        # One directory read; DirEntry answers is_file() from d_type
+        with os.scandir(input_path) as entries:
+            files = [Path(e.path) for e in entries
+                     if os.path.splitext(e.name)[1].lower() in INGEST_EXTENSIONS and e.is_file()]
     else:
         files = [input_path]
     
@@ -238,39 +300,99 @@ def ingest(
     
     console.print(f"Found {len(files)} file(s) to process")
     
-    for file_path in files:
-        if verbose:
-            console.print(f"Processing: {file_path.name}")
+    def process_file(file_path: Path) -> Path:
+        dataset = load_seismic_data(str(file_path))
         
-        try:
-            dataset = load_seismic_data(str(file_path))
-            
-            if normalize:
-                # Normalize each trace
-                traces = dataset.traces
-                traces = traces / (traces.max(axis=1, keepdims=True) + 1e-10)
-                dataset.traces = traces
-            
-            # Generate output filename
-            out_name = file_path.stem
-            if format == "hdf5":
-                out_file = output_dir / f"{out_name}.h5"
-            elif format == "npy":
-                out_file = output_dir / f"{out_name}.npy"
-            elif format == "zarr":
-                out_file = output_dir / f"{out_name}.zarr"
-            else:
-                out_file = output_dir / f"{out_name}.h5"
-            
-            save_seismic_data(dataset, str(out_file))
-            console.print(f"  [green]Saved: {out_file.name}[/green]")
-            
-        except Exception as e:
-            console.print(f"  [red]Error: {e}[/red]")
+        if normalize:
+            # Scale each trace to unit peak amplitude, in place
+            traces = dataset.traces
+            dtype = traces.dtype if np.issubdtype(traces.dtype, np.floating) else np.float32
+            traces = np.ascontiguousarray(traces, dtype=dtype)
+            if not traces.flags.writeable:
+                traces = traces.copy()
+            normalize_rows_inplace(traces)
+            dataset.traces = traces
+        
+        # Generate output filename
+        out_name = file_path.stem
+        if format == "hdf5":
+            out_file = output_dir / f"{out_name}.h5"
+        elif format == "npy":
+            out_file = output_dir / f"{out_name}.npy"
+        elif format == "zarr":
+            out_file = output_dir / f"{out_name}.zarr"
+        else:
+            out_file = output_dir / f"{out_name}.h5"
+        
+        save_seismic_data(dataset, str(out_file))
+        return out_file
+    
+    # Reading and writing release the GIL, so threads overlap the I/O
+    n_workers = workers or min(len(files), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max(1, n_workers)) as executor:
+        futures = {executor.submit(process_file, file_path): file_path for file_path in files}
+        for future in as_completed(futures):
+            file_path = futures[future]
+            if verbose:
+                console.print(f"Processed: {file_path.name}")
+            try:
+                out_file = future.result()
+                console.print(f"  [green]Saved: {out_file.name}[/green]")
+            except Exception as e:
+                console.print(f"  [red]Error: {e}[/red]")
     
     console.print(f"[bold green]Ingestion complete. Output: {output_dir}[/bold green]")
 
 
+def _run_one_config(config_file: Path, verbose: bool = False) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Run a single batch configuration; also the process pool worker.
+    
+    Returns the run record for the batch report and the console lines for
+    it. Lines are returned rather than printed so runs finishing in
+    parallel don't interleave their output.
+    """
+    import yaml
+    from datetime import datetime
+    try:
+        # LibYAML's parser; same safe semantics, far less Python per node
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+    
+    lines = [f"\n[cyan]Running: {config_file.name}[/cyan]"]
+    try:
+        with open(config_file, "rb") as f:
+            config = yaml.load(f, Loader=SafeLoader)
+        
+        # Extract pipeline settings
+        pipeline_name = config.get("pipeline", {}).get("name", "unknown")
+        input_data = config.get("input", {}).get("path", "")
+        
+        if verbose:
+            lines.append(f"  Pipeline: {pipeline_name}")
+            lines.append(f"  Input: {input_data}")
+        
+        # Here we would call the actual pipeline runner
+        # For now, record the config for the batch report
+        run_result = {
+            "config": config_file.name,
+            "pipeline": pipeline_name,
+            "status": "completed",
+            "timestamp": datetime.now().isoformat(),
+        }
+        lines.append("  [green]Completed[/green]")
+        
+    except Exception as e:
+        lines.append(f"  [red]Error: {e}[/red]")
+        run_result = {
+            "config": config_file.name,
+            "status": "failed",
+            "error": str(e),
+        }
+    return run_result, lines
+
+
 @app.command(name="batch-run")
 def batch_run(
     config_dir: Path = typer.Argument(..., help="Directory containing pipeline config files"),
@@ -282,17 +404,24 @@ def batch_run(
     """
     Run multiple pipeline configurations in batch mode.
     
-    Reads all YAML config files from config_dir and executes each pipeline.
-    Results are aggregated into a summary report.
+    Reads all YAML config files from config_dir and executes each pipeline,
+    up to --parallel at a time in separate processes. Results are
+    aggregated into a summary report.
     """
-    import yaml
-    import json
+    import os
+    from concurrent.futures import ProcessPoolExecutor, as_completed
     from datetime import datetime
     
     console.print("[bold]Promethium Batch Pipeline Runner[/bold]")
     
-    # Find config files
-    config_files = list(config_dir.glob("*.yaml")) + list(config_dir.glob("*.yml"))
+    # Find config files, in name order so the report order is stable
+    config_files = []
+    if config_dir.is_dir():
+        with os.scandir(config_dir) as entries:
+            config_files = sorted(
+                Path(e.path) for e in entries
+                if e.name.endswith((".yaml", ".yml")) and not e.name.startswith(".") and e.is_file()
+            )
     
     if not config_files:
         console.print(f"[red]No config files found in {config_dir}[/red]")
@@ -307,55 +436,67 @@ def batch_run(
     results = []
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
-    for config_file in config_files:
-        console.print(f"\n[cyan]Running: {config_file.name}[/cyan]")
-        
-        try:
-            with open(config_file, "r") as f:
-                config = yaml.safe_load(f)
-            
-            # Extract pipeline settings
-            pipeline_name = config.get("pipeline", {}).get("name", "unknown")
-            input_data = config.get("input", {}).get("path", "")
-            
-            if verbose:
-                console.print(f"  Pipeline: {pipeline_name}")
-                console.print(f"  Input: {input_data}")
-            
-            # Here we would call the actual pipeline runner
-            # For now, record the config for the batch report
-            run_result = {
-                "config": config_file.name,
-                "pipeline": pipeline_name,
-                "status": "completed",
-                "timestamp": datetime.now().isoformat(),
+    if parallel > 1 and len(config_files) > 1:
+        # Configs are independent, so run them in separate processes and
+        # report each as it finishes; the report keeps the config order.
+        by_config: Dict[Path, Dict[str, Any]] = {}
+        with ProcessPoolExecutor(max_workers=min(parallel, len(config_files))) as executor:
+            futures = {
+                executor.submit(_run_one_config, config_file, verbose): config_file
+                for config_file in config_files
             }
+            for future in as_completed(futures):
+                run_result, lines = future.result()
+                by_config[futures[future]] = run_result
+                for line in lines:
+                    console.print(line)
+        results = [by_config[config_file] for config_file in config_files]
+    else:
+        for config_file in config_files:
+            run_result, lines = _run_one_config(config_file, verbose)
             results.append(run_result)
-            console.print(f"  [green]Completed[/green]")
-            
-        except Exception as e:
-            console.print(f"  [red]Error: {e}[/red]")
-            results.append({
-                "config": config_file.name,
-                "status": "failed",
-                "error": str(e),
-            })
+            for line in lines:
+                console.print(line)
     
     # Write summary report
     report_file = output_dir / f"batch_report_{timestamp}.json"
-    with open(report_file, "w") as f:
-        json.dump({
-            "experiment_id": experiment_id,
-            "timestamp": timestamp,
-            "total_runs": len(config_files),
-            "successful": sum(1 for r in results if r.get("status") == "completed"),
-            "failed": sum(1 for r in results if r.get("status") == "failed"),
-            "runs": results,
-        }, f, indent=2)
+    from promethium.core.serialization import dumps
+    report_file.write_bytes(dumps({
+        "experiment_id": experiment_id,
+        "timestamp": timestamp,
+        "total_runs": len(config_files),
+        "successful": sum(1 for r in results if r.get("status") == "completed"),
+        "failed": sum(1 for r in results if r.get("status") == "failed"),
+        "runs": results,
+    }, indent=True))
     
     console.print(f"\n[bold green]Batch complete. Report: {report_file}[/bold green]")
 
 
+def _count_lines(path: Union[str, Path]) -> int:
+    """Count lines like iterating the file would, without decoding it."""
+    count = 0
+    last = b"\n"
+    with open(path, "rb") as f:
+        while chunk := f.read(1 << 20):
+            count += chunk.count(b"\n")
+            last = chunk[-1:]
+    # A final line without a trailing newline still counts
+    return count + (last != b"\n")
+
+
+def _read_runs(log_file: Path) -> List[Dict[str, Any]]:
+    """Parse a JSONL experiment log with one read, skipping blank lines."""
+    from promethium.core.serialization import loads
+    
+    return [loads(line) for line in log_file.read_bytes().splitlines() if line.strip()]
+
+
+def _fmt_metric(value: Any, value_format: str) -> str:
+    """Format a numeric metric, or "N/A" if it is missing or not a number."""
+    return value_format.format(value) if isinstance(value, (int, float)) else "N/A"
+
+
 # Experiments subcommand group
 experiments_app = typer.Typer(help="Experiment tracking and management commands")
 app.add_typer(experiments_app, name="experiments")
@@ -364,40 +505,57 @@ app.add_typer(experiments_app, name="experiments")
 @experiments_app.command(name="list")
 def experiments_list(
     logs_dir: Path = typer.Option(Path("experiments/logs"), "--dir", "-d", help="Logs directory"),
+    as_json: bool = typer.Option(False, "--json", help="Print JSON instead of a table"),
 ):
     """List all recorded experiments."""
+    import os
+    from datetime import datetime
+    
     if not logs_dir.exists():
-        console.print(f"[yellow]No experiments directory found at {logs_dir}[/yellow]")
+        if as_json:
+            _print_json([])
+        else:
+            console.print(f"[yellow]No experiments directory found at {logs_dir}[/yellow]")
         return
     
-    log_files = list(logs_dir.glob("*.jsonl")) + list(logs_dir.glob("*.json"))
+    # One directory read; each entry is then stat'ed and read once
+    with os.scandir(logs_dir) as entries:
+        log_files = sorted(
+            (e for e in entries
+             if e.name.endswith((".jsonl", ".json")) and not e.name.startswith(".")),
+            key=lambda e: e.name,
+        )
     
     if not log_files:
-        console.print("[yellow]No experiment logs found.[/yellow]")
+        if as_json:
+            _print_json([])
+        else:
+            console.print("[yellow]No experiment logs found.[/yellow]")
         return
     
-    table = Table(title="Recorded Experiments")
-    table.add_column("Experiment ID", style="cyan")
-    table.add_column("Runs", style="green")
-    table.add_column("Last Modified", style="dim")
-    
-    for log_file in sorted(log_files):
-        import os
-        from datetime import datetime
-        
-        mtime = datetime.fromtimestamp(os.path.getmtime(log_file))
-        
-        # Count lines for JSONL files
-        with open(log_file, "r") as f:
-            run_count = sum(1 for _ in f)
-        
-        table.add_row(
-            log_file.stem,
-            str(run_count),
-            mtime.strftime("%Y-%m-%d %H:%M"),
-        )
+    experiments = []
+    for entry in log_files:
+        experiments.append({
+            "experiment_id": os.path.splitext(entry.name)[0],
+            # Count lines for JSONL files
+            "runs": _count_lines(entry.path),
+            "last_modified": datetime.fromtimestamp(entry.stat().st_mtime),
+        })
+    
+    if as_json:
+        for experiment in experiments:
+            experiment["last_modified"] = experiment["last_modified"].isoformat()
+        _print_json(experiments)
+        return
     
-    console.print(table)
+    _emit_table(
+        "Recorded Experiments",
+        [("Experiment ID", "cyan"), ("Runs", "green"), ("Last Modified", "dim")],
+        [
+            (e["experiment_id"], str(e["runs"]), e["last_modified"].strftime("%Y-%m-%d %H:%M"))
+            for e in experiments
+        ],
+    )
 
 
 @experiments_app.command(name="show")
@@ -405,10 +563,9 @@ def experiments_show(
     experiment_id: str = typer.Argument(..., help="Experiment ID to display"),
     logs_dir: Path = typer.Option(Path("experiments/logs"), "--dir", "-d", help="Logs directory"),
     last_n: int = typer.Option(10, "--last", "-n", help="Show last N runs"),
+    as_json: bool = typer.Option(False, "--json", help="Print the last N run records as JSON"),
 ):
     """Show details of a specific experiment."""
-    import json
-    
     log_file = logs_dir / f"{experiment_id}.jsonl"
     if not log_file.exists():
         log_file = logs_dir / f"{experiment_id}.json"
@@ -417,36 +574,34 @@ def experiments_show(
         console.print(f"[red]Experiment not found: {experiment_id}[/red]")
         raise typer.Exit(code=1)
     
-    console.print(f"[bold]Experiment: {experiment_id}[/bold]\n")
+    runs = _read_runs(log_file)
+    
+    if as_json:
+        _print_json(runs[-last_n:])
+        return
     
-    runs = []
-    with open(log_file, "r") as f:
-        for line in f:
-            if line.strip():
-                runs.append(json.loads(line))
+    console.print(f"[bold]Experiment: {experiment_id}[/bold]\n")
     
     # Show summary
     console.print(f"Total runs: {len(runs)}")
     
     # Show last N runs
-    table = Table(title=f"Last {min(last_n, len(runs))} Runs")
-    table.add_column("Run ID", style="cyan")
-    table.add_column("Pipeline", style="yellow")
-    table.add_column("SNR", style="green")
-    table.add_column("MSE", style="green")
-    table.add_column("Timestamp", style="dim")
-    
-    for run in runs[-last_n:]:
-        metrics = run.get("metrics", {})
-        table.add_row(
+    rows = [
+        (
             run.get("run_id", "N/A"),
             run.get("pipeline", "N/A"),
-            f"{metrics.get('snr', 'N/A'):.2f}" if isinstance(metrics.get('snr'), (int, float)) else "N/A",
-            f"{metrics.get('mse', 'N/A'):.2e}" if isinstance(metrics.get('mse'), (int, float)) else "N/A",
-            run.get("timestamp", "N/A")[:19] if run.get("timestamp") else "N/A",
+            _fmt_metric((run.get("metrics") or {}).get("snr"), "{:.2f}"),
+            _fmt_metric((run.get("metrics") or {}).get("mse"), "{:.2e}"),
+            (run.get("timestamp") or "N/A")[:19],
         )
+        for run in runs[-last_n:]
+    ]
     
-    console.print(table)
+    _emit_table(
+        f"Last {min(last_n, len(runs))} Runs",
+        [("Run ID", "cyan"), ("Pipeline", "yellow"), ("SNR", "green"), ("MSE", "green"), ("Timestamp", "dim")],
+        rows,
+    )
 
 
 @experiments_app.command(name="export")
@@ -457,9 +612,6 @@ def experiments_export(
     logs_dir: Path = typer.Option(Path("experiments/logs"), "--dir", "-d", help="Logs directory"),
 ):
     """Export experiment data to CSV or JSON format."""
-    import json
-    import csv
-    
     log_file = logs_dir / f"{experiment_id}.jsonl"
     if not log_file.exists():
         log_file = logs_dir / f"{experiment_id}.json"
@@ -468,42 +620,86 @@ def experiments_export(
         console.print(f"[red]Experiment not found: {experiment_id}[/red]")
         raise typer.Exit(code=1)
     
-    runs = []
-    with open(log_file, "r") as f:
-        for line in f:
-            if line.strip():
-                runs.append(json.loads(line))
+    runs = _read_runs(log_file)
     
     if format == "json":
-        with open(output, "w") as f:
-            json.dump(runs, f, indent=2)
+        from promethium.core.serialization import dumps
+        output.write_bytes(dumps(runs, indent=True))
     else:
         # CSV export
         if runs:
-            # Flatten metrics into columns
-            fieldnames = ["run_id", "experiment_id", "pipeline", "dataset", "timestamp"]
-            if runs[0].get("metrics"):
-                fieldnames.extend([f"metric_{k}" for k in runs[0]["metrics"].keys()])
+            import pandas as pd
             
-            with open(output, "w", newline="") as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                
-                for run in runs:
-                    row = {
-                        "run_id": run.get("run_id", ""),
-                        "experiment_id": run.get("experiment_id", ""),
-                        "pipeline": run.get("pipeline", ""),
-                        "dataset": run.get("dataset", ""),
-                        "timestamp": run.get("timestamp", ""),
-                    }
-                    for k, v in run.get("metrics", {}).items():
-                        row[f"metric_{k}"] = v
-                    writer.writerow(row)
+            # Flatten metrics into metric_* columns; runs missing a field or
+            # metric get an empty cell
+            columns = pd.DataFrame.from_records(runs, columns=EXPORT_COLUMNS)
+            metrics = pd.DataFrame.from_records([run.get("metrics") or {} for run in runs])
+            frame = pd.concat([columns, metrics.add_prefix("metric_")], axis=1)
+            # CRLF rows, as the csv module wrote them
+            frame.to_csv(output, index=False, lineterminator="\r\n")
     
     console.print(f"[green]Exported to: {output}[/green]")
 
 
+# Database subcommand group
+db_app = typer.Typer(help="API database schema management (Alembic)")
+app.add_typer(db_app, name="db")
+
+
+def _alembic_config():
+    """Build an Alembic config pointing at the bundled migrations package."""
+    try:
+        from alembic.config import Config
+    except ImportError:
+        console.print("[red]Alembic is not installed. Run: pip install alembic[/red]")
+        raise typer.Exit(1) from None
+
+    import promethium.migrations
+
+    config = Config()
+    config.set_main_option("script_location", str(Path(promethium.migrations.__file__).parent))
+    return config
+
+
+@db_app.command(name="upgrade")
+def db_upgrade(
+    revision: str = typer.Argument("head", help="Target revision"),
+    sql: bool = typer.Option(False, "--sql", help="Print SQL instead of executing it"),
+):
+    """Apply schema migrations up to a revision."""
+    config = _alembic_config()
+    from alembic import command
+
+    command.upgrade(config, revision, sql=sql)
+    if not sql:
+        console.print(f"[green]Database upgraded to: {revision}[/green]")
+
+
+@db_app.command(name="downgrade")
+def db_downgrade(
+    revision: str = typer.Argument(..., help="Target revision"),
+):
+    """Revert schema migrations down to a revision."""
+    config = _alembic_config()
+    from alembic import command
+
+    command.downgrade(config, revision)
+    console.print(f"[green]Database downgraded to: {revision}[/green]")
+
+
+@db_app.command(name="revision")
+def db_revision(
+    message: str = typer.Option(..., "--message", "-m", help="Revision message"),
+    autogenerate: bool = typer.Option(True, "--autogenerate/--empty",
+                                      help="Diff models against the database"),
+):
+    """Create a new migration revision."""
+    config = _alembic_config()
+    from alembic import command
+
+    command.revision(config, message=message, autogenerate=autogenerate)
+
+
 @app.command()
 def version():
     """Show Promethium version information."""
@@ -0,0 +1,61 @@
+"""
+Numba kernels for hot array loops, with NumPy fallbacks.
+
+numba is optional: without it each function here runs an equivalent
+vectorized NumPy implementation.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to NumPy
+    njit = None
+
+# Independent accumulators per reduction, so LLVM can keep them in one
+# SIMD register instead of serializing on a single running max
+_LANES = 8
+
+if njit is not None:
+    # Kernels are serial and release the GIL: callers get parallelism from
+    # their own threads (e.g. ingest's per-file pool). parallel=True would
+    # oversubscribe those threads, and launching parallel kernels from
+    # worker threads can hang the TBB threading layer at exit.
+    @njit(nogil=True, fastmath=True, cache=True)
+    def _normalize_rows(x, eps):
+        """Peak-normalize each row in place."""
+        n = x.shape[1]
+        lanes = np.empty(_LANES, dtype=x.dtype)
+        for i in range(x.shape[0]):
+            lanes[:] = 0
+            j = 0
+            while j + _LANES <= n:
+                for k in range(_LANES):
+                    lanes[k] = max(lanes[k], abs(x[i, j + k]))
+                j += _LANES
+            peak = lanes.max()
+            for r in range(j, n):
+                peak = max(peak, abs(x[i, r]))
+            # Scale in x's dtype so float32 rows stay float32
+            inv = x.dtype.type(1.0 / (peak + eps))
+            for j in range(n):
+                x[i, j] *= inv
+else:
+    _normalize_rows = None
+
+
+def normalize_rows_inplace(x: np.ndarray, eps: float = 1e-10) -> None:
+    """
+    Scale each row of the 2-D float array ``x`` by ``1 / (max|row| + eps)``.
+
+    Rows end up with unit peak amplitude. ``x`` is modified in place and
+    should be C-contiguous.
+    """
+    if _normalize_rows is not None:
+        _normalize_rows(x, eps)
+        return
+    # Peak |x| as max(max, -min): two reductions, no |x| temporary
+    peak = x.max(axis=1)
+    np.maximum(peak, -x.min(axis=1), out=peak)
+    peak += eps
+    np.reciprocal(peak, out=peak)
+    x *= peak[:, None]
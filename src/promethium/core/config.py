@@ -36,10 +36,19 @@ if PYDANTIC_SETTINGS_AVAILABLE:
         API_PORT: int = 8000
         API_PREFIX: str = "/api/v1"
         CORS_ORIGINS: List[str] = ["*"]
+        API_DOCS_ENABLED: bool = True  # serve /openapi.json, /docs and /redoc
 
         # Database & Storage
         DATABASE_URL: str = "sqlite+aiosqlite:///./promethium.db"
+        DB_POOL_SIZE: int = 25
+        DB_MAX_OVERFLOW: int = 25
+        DB_POOL_RECYCLE: int = 1800  # seconds
+        DB_POOL_PRE_PING: bool = True
+        DB_POOL_WARM_CONNECTIONS: int = 5  # opened at startup; 0 disables
+        AUTO_CREATE_SCHEMA: bool = False  # dev only; use `promethium db upgrade` otherwise
         REDIS_URL: str = "redis://localhost:6379/0"
+        RESPONSE_CACHE_ENABLED: bool = False  # cache read-only API responses in Redis
+        RESPONSE_CACHE_TTL_SECONDS: int = 30
         DATA_STORAGE_PATH: Path = Path("./data")
         ARTIFACT_STORAGE_PATH: Path = Path("./artifacts")
 
@@ -78,9 +87,18 @@ else:
             self.API_PORT = 8000
             self.API_PREFIX = "/api/v1"
             self.CORS_ORIGINS = ["*"]
+            self.API_DOCS_ENABLED = os.environ.get("API_DOCS_ENABLED", "true").lower() in ("true", "1", "yes")
 
             self.DATABASE_URL = "sqlite+aiosqlite:///./promethium.db"
+            self.DB_POOL_SIZE = 25
+            self.DB_MAX_OVERFLOW = 25
+            self.DB_POOL_RECYCLE = 1800
+            self.DB_POOL_PRE_PING = True
+            self.DB_POOL_WARM_CONNECTIONS = 5
+            self.AUTO_CREATE_SCHEMA = os.environ.get("AUTO_CREATE_SCHEMA", "false").lower() in ("true", "1", "yes")
             self.REDIS_URL = "redis://localhost:6379/0"
+            self.RESPONSE_CACHE_ENABLED = False
+            self.RESPONSE_CACHE_TTL_SECONDS = 30
             self.DATA_STORAGE_PATH = Path("./data")
             self.ARTIFACT_STORAGE_PATH = Path("./artifacts")
 
@@ -92,7 +110,7 @@ else:
             self.CELERY_TASK_ALWAYS_EAGER = True
 
 
-@lru_cache
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     return Settings()
 
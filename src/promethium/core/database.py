@@ -1,4 +1,9 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+import asyncio
+from contextlib import AsyncExitStack
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from promethium.core.config import get_settings
 # Import Base to ensure it's available for users of this module, though technically 
@@ -9,9 +14,65 @@ import promethium.api.models # This triggers registration of all models via __in
 
 settings = get_settings()
 
-engine = create_async_engine(settings.DATABASE_URL, echo=settings.DEBUG)
+
+def _async_database_url(url: str) -> str:
+    """Route bare PostgreSQL URLs through the asyncpg driver."""
+    for prefix in ("postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    return url
+
+
+def _engine_kwargs(url: str) -> dict:
+    """Connection pool settings; SQLite keeps SQLAlchemy's default pool."""
+    if url.startswith("sqlite"):
+        return {}
+    return {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+
+
+DATABASE_URL = _async_database_url(settings.DATABASE_URL)
+
+engine = create_async_engine(DATABASE_URL, echo=settings.DEBUG, **_engine_kwargs(DATABASE_URL))
+
+if DATABASE_URL.startswith("sqlite"):
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """
+        WAL lets readers proceed while a write is in progress, and with WAL
+        synchronous=NORMAL only syncs at checkpoints instead of every commit.
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
 AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
 
+async def warm_pool(n_connections: int = settings.DB_POOL_WARM_CONNECTIONS) -> None:
+    """
+    Open ``n_connections`` pooled connections at once and return them to the pool.
+    
+    SQLAlchemy pools have no minimum size, so without this the first requests
+    after startup each pay the connection handshake.
+    """
+    n_connections = min(n_connections, settings.DB_POOL_SIZE)
+    if n_connections <= 0:
+        return
+    
+    async with AsyncExitStack() as stack:
+        connections = await asyncio.gather(*[
+            stack.enter_async_context(engine.connect()) for _ in range(n_connections)
+        ])
+        for conn in connections:
+            await conn.execute(text("SELECT 1"))
+
+
 async def get_db():
     async with AsyncSessionLocal() as session:
         yield session
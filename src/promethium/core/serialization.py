@@ -0,0 +1,67 @@
+"""
+JSON serialization for results, metrics and experiment logs.
+
+orjson is used when it is installed, but it writes NaN and infinity as
+null, and a perfect reconstruction has an infinite SNR. Documents holding
+non-finite values therefore go through the stdlib encoder, which writes
+NaN/Infinity; :func:`loads` reads those back, so the output is the same
+whether or not orjson is installed.
+"""
+import json
+import math
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib
+    orjson = None
+
+
+def _all_finite(obj: Any) -> bool:
+    """Whether no float in ``obj`` (nested dicts, lists, NumPy values) is NaN or inf."""
+    if isinstance(obj, dict):
+        return all(_all_finite(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return all(_all_finite(v) for v in obj)
+    if isinstance(obj, float):
+        return math.isfinite(obj)
+    if hasattr(obj, "tolist"):  # NumPy scalar or array
+        return _all_finite(obj.tolist())
+    return True
+
+
+def _to_builtin(obj: Any) -> Any:
+    """``json.dumps`` hook for NumPy scalars and arrays."""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize ``obj`` to JSON bytes.
+
+    Args:
+        obj: Value to serialize; NumPy scalars and arrays are accepted.
+        indent: Indent nested values by two spaces.
+
+    Returns:
+        UTF-8 encoded JSON.
+    """
+    if orjson is not None and _all_finite(obj):
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, default=_to_builtin).encode()
+
+
+def loads(data: bytes) -> Any:
+    """Parse one JSON document, including NaN/Infinity literals."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity the stdlib writes
+            pass
+    return json.loads(data)
@@ -11,6 +11,7 @@ from promethium.evaluation.metrics import (
     signal_to_noise_ratio,
     mean_squared_error,
     peak_signal_to_noise_ratio,
+    error_metrics,
     structural_similarity_index,
     frequency_domain_correlation,
     phase_coherence,
@@ -21,6 +22,7 @@ __all__ = [
     "signal_to_noise_ratio",
     "mean_squared_error",
     "peak_signal_to_noise_ratio",
+    "error_metrics",
     "structural_similarity_index",
     "frequency_domain_correlation",
     "phase_coherence",
@@ -0,0 +1,6 @@
+"""
+Alembic migration environment for the Promethium API database.
+
+Run with ``promethium db upgrade``; the CLI points Alembic at this package so
+no ``alembic.ini`` is needed.
+"""
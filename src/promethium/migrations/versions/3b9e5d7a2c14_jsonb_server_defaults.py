@@ -0,0 +1,64 @@
+"""Store JSON columns as JSONB with server-side empty defaults
+
+On PostgreSQL every JSON column becomes JSONB. The non-nullable ones get
+'{}' / '[]' server defaults on every backend, since the models no longer
+fill them in Python.
+
+Revision ID: 3b9e5d7a2c14
+Revises: 4c1e8a2d9b37
+Create Date: 2026-10-15 21:30:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = '3b9e5d7a2c14'
+down_revision: Union[str, None] = '4c1e8a2d9b37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JSON_TYPE = sa.JSON().with_variant(postgresql.JSONB(), "postgresql")
+EMPTY_OBJECT = sa.text("'{}'")
+EMPTY_ARRAY = sa.text("'[]'")
+
+# table -> [(column, server default or None for nullable columns)]
+COLUMNS = {
+    "datasets": [("metadata_json", EMPTY_OBJECT)],
+    "experiments": [("tags", EMPTY_ARRAY), ("metadata_json", EMPTY_OBJECT)],
+    "jobs": [("params", EMPTY_OBJECT), ("metrics", EMPTY_OBJECT)],
+    "models": [("config", EMPTY_OBJECT), ("metrics", EMPTY_OBJECT)],
+    "pipelines": [("config_json", EMPTY_OBJECT)],
+    "results": [("metrics", EMPTY_OBJECT), ("metadata_json", EMPTY_OBJECT)],
+    "benchmarks": [("config_json", None), ("metrics_json", None)],
+}
+
+
+def upgrade() -> None:
+    for table, columns in COLUMNS.items():
+        with op.batch_alter_table(table) as batch_op:
+            for column, default in columns:
+                batch_op.alter_column(
+                    column,
+                    type_=JSON_TYPE,
+                    existing_type=sa.JSON(),
+                    server_default=default,
+                    existing_nullable=default is None,
+                    postgresql_using=f"{column}::jsonb",
+                )
+
+
+def downgrade() -> None:
+    for table, columns in COLUMNS.items():
+        with op.batch_alter_table(table) as batch_op:
+            for column, default in columns:
+                batch_op.alter_column(
+                    column,
+                    type_=sa.JSON(),
+                    existing_type=JSON_TYPE,
+                    server_default=None,
+                    existing_nullable=default is None,
+                    postgresql_using=f"{column}::json",
+                )
@@ -0,0 +1,41 @@
+"""Add (created_at, id) indexes for keyset pagination
+
+List endpoints page newest first by (created_at, id); these indexes let each
+page be a single range scan.
+
+Revision ID: 4c1e8a2d9b37
+Revises: bf792b475fc3
+Create Date: 2026-10-15 22:10:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = '4c1e8a2d9b37'
+down_revision: Union[str, None] = 'bf792b475fc3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = (
+    "benchmarks",
+    "datasets",
+    "experiments",
+    "jobs",
+    "models",
+    "pipelines",
+    "results",
+    "users",
+)
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.create_index(
+            f"ix_{table}_created_id", table, ["created_at", "id"], if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.drop_index(f"ix_{table}_created_id", table_name=table, if_exists=True)
@@ -0,0 +1,46 @@
+"""Add composite and partial indexes for job, result and benchmark listings
+
+Jobs get (experiment_id, status, created_at) and, on PostgreSQL, a partial
+(status, created_at) index over queued/running rows. Results get
+(job_id, created_at), which replaces the single-column job_id index, and
+benchmarks get (status, created_at).
+
+Revision ID: 5f17b2e9a3c8
+Revises: e6a40c8f1d53
+Create Date: 2026-10-15 21:50:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '5f17b2e9a3c8'
+down_revision: Union[str, None] = 'e6a40c8f1d53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_jobs_exp_status_created", "jobs", ["experiment_id", "status", "created_at"],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_jobs_active", "jobs", ["status", "created_at"],
+        postgresql_where=sa.text("status IN ('queued', 'running')"),
+        if_not_exists=True,
+    )
+    op.create_index("ix_results_job_created", "results", ["job_id", "created_at"], if_not_exists=True)
+    op.drop_index("ix_results_job_id", table_name="results", if_exists=True)
+    op.create_index(
+        "ix_benchmarks_status_created", "benchmarks", ["status", "created_at"], if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_benchmarks_status_created", table_name="benchmarks", if_exists=True)
+    op.create_index("ix_results_job_id", "results", ["job_id"], if_not_exists=True)
+    op.drop_index("ix_results_job_created", table_name="results", if_exists=True)
+    op.drop_index("ix_jobs_active", table_name="jobs", if_exists=True)
+    op.drop_index("ix_jobs_exp_status_created", table_name="jobs", if_exists=True)
@@ -0,0 +1,191 @@
+"""Create the base API schema
+
+Every table as the models defined it before schema changes were managed
+with migrations; later revisions build on this one. Databases created by
+the old startup ``create_all`` already have these tables, so existing
+tables are left as they are and only missing ones are created.
+
+Revision ID: 8d2f6a1c4e07
+Revises:
+Create Date: 2026-10-15 21:20:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+revision: str = '8d2f6a1c4e07'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_users() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("email", sa.String(255), nullable=False),
+        sa.Column("hashed_password", sa.String(255), nullable=False),
+        sa.Column("full_name", sa.String(255), nullable=False),
+        sa.Column("role", sa.String(50), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+
+def _create_datasets() -> None:
+    op.create_table(
+        "datasets",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.Column("description", sa.String(1024), nullable=True),
+        sa.Column("file_path", sa.String(1024), nullable=False),
+        sa.Column("format", sa.String(50), nullable=False),
+        sa.Column("size_bytes", sa.Integer(), nullable=True),
+        sa.Column("sample_rate", sa.Float(), nullable=True),
+        sa.Column("channels", sa.Integer(), nullable=True),
+        sa.Column("metadata_json", sa.JSON(), nullable=False),
+        sa.Column("owner_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index("ix_datasets_name", "datasets", ["name"])
+
+
+def _create_pipelines() -> None:
+    op.create_table(
+        "pipelines",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("config_json", sa.JSON(), nullable=False),
+        sa.Column("config_path", sa.String(1024), nullable=True),
+        sa.Column("owner_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_pipelines_name", "pipelines", ["name"])
+
+
+def _create_models() -> None:
+    op.create_table(
+        "models",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.Column("type", sa.String(100), nullable=False),
+        sa.Column("version", sa.String(50), nullable=False),
+        sa.Column("description", sa.String(1024), nullable=True),
+        sa.Column("artifact_path", sa.String(1024), nullable=True),
+        sa.Column("config", sa.JSON(), nullable=False),
+        sa.Column("metrics", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index("ix_models_name", "models", ["name"])
+
+
+def _create_experiments() -> None:
+    op.create_table(
+        "experiments",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("tags", sa.JSON(), nullable=False),
+        sa.Column("metadata_json", sa.JSON(), nullable=False),
+        sa.Column("owner_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index("ix_experiments_name", "experiments", ["name"])
+
+
+def _create_jobs() -> None:
+    op.create_table(
+        "jobs",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("type", sa.String(100), nullable=False),
+        sa.Column("status", sa.String(50), nullable=False),
+        sa.Column("dataset_id", sa.Integer(), sa.ForeignKey("datasets.id"), nullable=True),
+        sa.Column("pipeline_id", sa.Integer(), sa.ForeignKey("pipelines.id"), nullable=True),
+        sa.Column("model_id", sa.Integer(), sa.ForeignKey("models.id"), nullable=True),
+        sa.Column("experiment_id", sa.Integer(), sa.ForeignKey("experiments.id"), nullable=True),
+        sa.Column("algorithm", sa.String(100), nullable=True),
+        sa.Column("params", sa.JSON(), nullable=False),
+        sa.Column("result_path", sa.String(1024), nullable=True),
+        sa.Column("logs_path", sa.String(1024), nullable=True),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column("progress", sa.Integer(), nullable=False),
+        sa.Column("metrics", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("completed_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_jobs_status", "jobs", ["status"])
+
+
+def _create_results() -> None:
+    op.create_table(
+        "results",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        # Named so the job id revision can drop and recreate it by name
+        sa.Column(
+            "job_id", sa.String(36),
+            sa.ForeignKey("jobs.id", name="results_job_id_fkey"), nullable=False,
+        ),
+        sa.Column("dataset_id", sa.Integer(), sa.ForeignKey("datasets.id"), nullable=True),
+        sa.Column("model_id", sa.Integer(), sa.ForeignKey("models.id"), nullable=True),
+        sa.Column("result_path", sa.String(1024), nullable=False),
+        sa.Column("metrics", sa.JSON(), nullable=False),
+        sa.Column("metadata_json", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index("ix_results_job_id", "results", ["job_id"])
+
+
+def _create_benchmarks() -> None:
+    op.create_table(
+        "benchmarks",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("config_json", sa.JSON(), nullable=True),
+        sa.Column("status", sa.String(50), nullable=True),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("duration_seconds", sa.Float(), nullable=True),
+        sa.Column("metrics_json", sa.JSON(), nullable=True),
+        sa.Column("dataset_id", sa.Integer(), sa.ForeignKey("datasets.id"), nullable=True),
+        sa.Column("model_id", sa.Integer(), sa.ForeignKey("models.id"), nullable=True),
+        sa.Column("experiment_id", sa.Integer(), sa.ForeignKey("experiments.id"), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index("ix_benchmarks_id", "benchmarks", ["id"])
+
+
+# Tables in dependency order (referenced tables first)
+TABLES = (
+    ("users", _create_users),
+    ("datasets", _create_datasets),
+    ("pipelines", _create_pipelines),
+    ("models", _create_models),
+    ("experiments", _create_experiments),
+    ("jobs", _create_jobs),
+    ("results", _create_results),
+    ("benchmarks", _create_benchmarks),
+)
+
+
+def upgrade() -> None:
+    # With --sql there is no database to inspect; emit every table
+    existing = set()
+    if not context.is_offline_mode():
+        existing = set(sa.inspect(op.get_bind()).get_table_names())
+    for table, create in TABLES:
+        if table not in existing:
+            create()
+
+
+def downgrade() -> None:
+    for table, _ in reversed(TABLES):
+        op.drop_table(table)
@@ -0,0 +1,72 @@
+"""Store emails case-insensitively and paths/descriptions as TEXT
+
+users.email becomes CITEXT on PostgreSQL (creating the citext extension)
+and gets a NOCASE collation on SQLite, so the unique index matches emails
+regardless of case. VARCHAR(1024) path and description columns become TEXT.
+
+Revision ID: 9c3d8e1f6b42
+Revises: 5f17b2e9a3c8
+Create Date: 2026-10-15 22:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = '9c3d8e1f6b42'
+down_revision: Union[str, None] = '5f17b2e9a3c8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+EMAIL_TYPE = (
+    sa.String(255)
+    .with_variant(postgresql.CITEXT(), "postgresql")
+    .with_variant(sa.String(255, collation="NOCASE"), "sqlite")
+)
+
+# table -> [(column, nullable)]
+TEXT_COLUMNS = {
+    "datasets": [("description", True), ("file_path", False)],
+    "jobs": [("result_path", True), ("logs_path", True)],
+    "models": [("description", True), ("artifact_path", True)],
+    "pipelines": [("config_path", True)],
+    "results": [("result_path", False)],
+}
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS citext")
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.alter_column(
+            "email",
+            type_=EMAIL_TYPE,
+            existing_type=sa.String(255),
+            existing_nullable=False,
+            postgresql_using="email::citext",
+        )
+    for table, columns in TEXT_COLUMNS.items():
+        with op.batch_alter_table(table) as batch_op:
+            for column, nullable in columns:
+                batch_op.alter_column(
+                    column, type_=sa.Text(), existing_type=sa.String(1024), existing_nullable=nullable
+                )
+
+
+def downgrade() -> None:
+    for table, columns in TEXT_COLUMNS.items():
+        with op.batch_alter_table(table) as batch_op:
+            for column, nullable in columns:
+                batch_op.alter_column(
+                    column, type_=sa.String(1024), existing_type=sa.Text(), existing_nullable=nullable
+                )
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.alter_column(
+            "email",
+            type_=sa.String(255),
+            existing_type=EMAIL_TYPE,
+            existing_nullable=False,
+            postgresql_using="email::varchar(255)",
+        )
@@ -0,0 +1,85 @@
+"""Store Job.id and Result.job_id as native UUIDs
+
+Converts the VARCHAR(36) job ids of the base schema. PostgreSQL gets the
+native UUID type. SQLite has none: ``sa.Uuid`` stores 32-character hex
+there, so the dashed ids are rewritten to that form along with the column
+type, or lookups through the models would match nothing.
+
+Revision ID: bf792b475fc3
+Revises: 8d2f6a1c4e07
+Create Date: 2026-10-15 21:25:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+revision: str = 'bf792b475fc3'
+down_revision: Union[str, None] = '8d2f6a1c4e07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FK_NAME = "results_job_id_fkey"
+
+
+# Dashed 8-4-4-4-12 form of a 32-character hex column, for SQLite downgrades
+_DASHED = (
+    "substr({col}, 1, 8) || '-' || substr({col}, 9, 4) || '-' || "
+    "substr({col}, 13, 4) || '-' || substr({col}, 17, 4) || '-' || substr({col}, 21)"
+)
+
+
+def _job_id_type(offline: str) -> Union[str, None]:
+    """
+    Return the jobs.id column type name, or None if there's nothing to convert.
+    
+    With ``--sql`` there is no database to inspect, so ``offline`` (the type
+    the column has before this step) is assumed.
+    """
+    bind = op.get_bind()
+    if bind.dialect.name not in ("postgresql", "sqlite"):
+        return None
+    if context.is_offline_mode():
+        return offline
+    inspector = sa.inspect(bind)
+    if not inspector.has_table("jobs"):
+        return None
+    columns = {col["name"]: col["type"] for col in inspector.get_columns("jobs")}
+    return type(columns["id"]).__name__.upper()
+
+
+def upgrade() -> None:
+    if _job_id_type(offline="VARCHAR") not in ("VARCHAR", "STRING"):
+        return
+    if op.get_bind().dialect.name == "sqlite":
+        op.execute("UPDATE jobs SET id = lower(replace(id, '-', ''))")
+        op.execute("UPDATE results SET job_id = lower(replace(job_id, '-', ''))")
+        with op.batch_alter_table("jobs") as batch_op:
+            batch_op.alter_column("id", type_=sa.Uuid(), existing_nullable=False)
+        with op.batch_alter_table("results") as batch_op:
+            batch_op.alter_column("job_id", type_=sa.Uuid(), existing_nullable=False)
+        return
+    op.drop_constraint(FK_NAME, "results", type_="foreignkey")
+    op.alter_column("jobs", "id", type_=sa.Uuid(), postgresql_using="id::uuid")
+    op.alter_column("results", "job_id", type_=sa.Uuid(), postgresql_using="job_id::uuid")
+    op.create_foreign_key(FK_NAME, "results", "jobs", ["job_id"], ["id"])
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "sqlite":
+        if _job_id_type(offline="CHAR") != "CHAR":
+            return
+        with op.batch_alter_table("jobs") as batch_op:
+            batch_op.alter_column("id", type_=sa.String(36), existing_nullable=False)
+        with op.batch_alter_table("results") as batch_op:
+            batch_op.alter_column("job_id", type_=sa.String(36), existing_nullable=False)
+        op.execute(f"UPDATE jobs SET id = {_DASHED.format(col='id')}")
+        op.execute(f"UPDATE results SET job_id = {_DASHED.format(col='job_id')}")
+        return
+    if _job_id_type(offline="UUID") != "UUID":
+        return
+    op.drop_constraint(FK_NAME, "results", type_="foreignkey")
+    op.alter_column("jobs", "id", type_=sa.String(36), postgresql_using="id::text")
+    op.alter_column("results", "job_id", type_=sa.String(36), postgresql_using="job_id::text")
+    op.create_foreign_key(FK_NAME, "results", "jobs", ["job_id"], ["id"])
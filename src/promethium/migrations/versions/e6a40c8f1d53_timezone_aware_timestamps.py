@@ -0,0 +1,60 @@
+"""Store timestamps with time zone and default them to now()
+
+created_at/updated_at become timezone-aware with a now() server default,
+and job start/completion times become timezone-aware too. Existing naive
+values were written with datetime.utcnow(), so PostgreSQL reads them as
+UTC while converting.
+
+Revision ID: e6a40c8f1d53
+Revises: 3b9e5d7a2c14
+Create Date: 2026-10-15 21:40:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'e6a40c8f1d53'
+down_revision: Union[str, None] = '3b9e5d7a2c14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> [(column, nullable, gets a now() server default)]
+COLUMNS = {
+    "users": [("created_at", False, True), ("updated_at", True, True)],
+    "datasets": [("created_at", False, True)],
+    "pipelines": [("created_at", False, True), ("updated_at", True, True)],
+    "models": [("created_at", False, True)],
+    "experiments": [("created_at", False, True)],
+    "jobs": [("created_at", False, True), ("started_at", True, False), ("completed_at", True, False)],
+    "results": [("created_at", False, True)],
+}
+
+
+def upgrade() -> None:
+    for table, columns in COLUMNS.items():
+        with op.batch_alter_table(table) as batch_op:
+            for column, nullable, now_default in columns:
+                batch_op.alter_column(
+                    column,
+                    type_=sa.DateTime(timezone=True),
+                    existing_type=sa.DateTime(),
+                    server_default=sa.func.now() if now_default else False,
+                    existing_nullable=nullable,
+                    postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+                )
+
+
+def downgrade() -> None:
+    for table, columns in COLUMNS.items():
+        with op.batch_alter_table(table) as batch_op:
+            for column, nullable, _ in columns:
+                batch_op.alter_column(
+                    column,
+                    type_=sa.DateTime(),
+                    existing_type=sa.DateTime(timezone=True),
+                    server_default=None,
+                    existing_nullable=nullable,
+                    postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+                )
@@ -1,4 +1,14 @@
-from promethium.ml.inference import InferenceEngine, load_model, reconstruct
+from promethium.ml.inference import (
+    InferenceEngine,
+    compile_for_inference,
+    configure_cuda_allocator,
+    load_model,
+    predict_tiled,
+    predict_tiled_batch,
+    quantize_for_cpu,
+    reconstruct,
+    report_memory,
+)
 from promethium.ml.train import PromethiumModule, PromethiumTrainer
 from promethium.ml.metrics import compute_snr, compute_ssim
 
@@ -6,6 +16,12 @@ __all__ = [
     "InferenceEngine",
     "load_model", 
     "reconstruct",
+    "predict_tiled",
+    "predict_tiled_batch",
+    "compile_for_inference",
+    "quantize_for_cpu",
+    "configure_cuda_allocator",
+    "report_memory",
     "PromethiumModule", 
     "PromethiumTrainer",
     "compute_snr",
@@ -42,10 +42,12 @@ class SeismicTorchDataset(Dataset):
     def __getitem__(self, idx):
         patch = self.patches[idx]
         
-        # Normalize patch (standardize)
-        mean = patch.mean()
-        std = patch.std() + 1e-6
-        norm_patch = (patch - mean) / std
+        # Normalize patch (standardize): center into a new array, take the
+        # std from it and scale in place, instead of std() re-deriving the
+        # mean and the division allocating a second copy
+        norm_patch = patch - patch.mean()
+        std = np.sqrt(np.vdot(norm_patch, norm_patch) / norm_patch.size) + 1e-6
+        norm_patch *= 1.0 / std
         
         # Create mask
         mask = np.ones_like(norm_patch)
@@ -1,9 +1,15 @@
+import bisect
+import copy
+import math
+import os
+
 import torch
+import torch.nn.functional as F
 import numpy as np
 import xarray as xr
 from pathlib import Path
 from tqdm import tqdm
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, Iterator, List, Optional, Sequence, Tuple, Union
 
 from promethium.core.logging import get_logger
 from promethium.core.config import get_settings
@@ -13,6 +19,370 @@ from promethium.io.zarr_wrapper import load_zarr
 logger = get_logger(__name__)
 settings = get_settings()
 
+# Long tile runs fragment the caching allocator until reserved memory far
+# exceeds allocated memory and a small request OOMs. Expandable segments
+# grow and shrink one mapping instead of caching many split blocks.
+CUDA_ALLOC_CONF = "expandable_segments:True,max_split_size_mb:128,garbage_collection_threshold:0.8"
+
+
+def configure_cuda_allocator(conf: str = CUDA_ALLOC_CONF) -> None:
+    """
+    Apply ``conf`` as the CUDA caching allocator settings, unless the user
+    has set ``PYTORCH_CUDA_ALLOC_CONF`` themselves.
+    
+    The allocator reads the environment variable when CUDA first allocates;
+    if that has already happened the settings are applied in-process.
+    """
+    if "PYTORCH_CUDA_ALLOC_CONF" in os.environ:
+        return
+    os.environ["PYTORCH_CUDA_ALLOC_CONF"] = conf
+    if torch.cuda.is_initialized() and hasattr(torch.cuda.memory, "_set_allocator_settings"):
+        torch.cuda.memory._set_allocator_settings(conf)
+
+
+def report_memory(device: Optional[Union[str, torch.device]] = None) -> Dict[str, int]:
+    """
+    Log and return CUDA allocator usage in bytes (empty off CUDA).
+    
+    A peak ``reserved`` well above peak ``allocated`` means the allocator
+    is fragmented.
+    """
+    if not torch.cuda.is_available() or not torch.cuda.is_initialized():
+        return {}
+    stats = torch.cuda.memory_stats(device)
+    usage = {
+        "allocated": stats.get("allocated_bytes.all.current", 0),
+        "reserved": stats.get("reserved_bytes.all.current", 0),
+        "allocated_peak": stats.get("allocated_bytes.all.peak", 0),
+        "reserved_peak": stats.get("reserved_bytes.all.peak", 0),
+    }
+    logger.info(
+        "CUDA memory (MiB): "
+        + ", ".join(f"{name}={value / 2**20:.1f}" for name, value in usage.items())
+    )
+    return usage
+
+
+def _patch_view(section: torch.Tensor, ph: int, pw: int, sh: int, sw: int) -> torch.Tensor:
+    """
+    Zero-copy (n_h, n_w, ph, pw) view of the patches of a 2D tensor.
+    
+    Patch (i, j) starts at row ``i * sh``, column ``j * sw``; the order
+    matches ``F.unfold``/``F.fold``. ``section`` must already be padded so
+    the strides cover it.
+    """
+    row_stride, col_stride = section.stride()
+    n_h = (section.shape[0] - ph) // sh + 1
+    n_w = (section.shape[1] - pw) // sw + 1
+    return section.as_strided(
+        (n_h, n_w, ph, pw),
+        (sh * row_stride, sw * col_stride, row_stride, col_stride),
+    )
+
+
+# (view index, rows, cols) of the patches of one view within a batch
+_Segment = Tuple[int, torch.Tensor, torch.Tensor]
+
+
+def _device_batches(
+    views: Sequence[torch.Tensor], batch_size: int, device: torch.device
+) -> Iterator[Tuple[List[_Segment], torch.Tensor]]:
+    """
+    Yield ``(segments, batch)`` for consecutive batches of patch views.
+    
+    ``views`` are (n_h, n_w, ph, pw) views from :func:`_patch_view`, all
+    with the same patch shape; their patches are taken in order as one
+    sequence, so a batch can span several views. ``segments`` lists the
+    ``(view, rows, cols)`` of each run of patches in ``batch``, which is
+    (B, 1, ph, pw) on ``device`` in channels_last layout. On CUDA, batches
+    are staged in two pinned host buffers and copied on a side stream, so
+    the copy of batch k+1 overlaps the forward of batch k.
+    """
+    n_cols = [view.shape[1] for view in views]
+    offsets = [0]
+    for view in views:
+        offsets.append(offsets[-1] + view.shape[0] * view.shape[1])
+    n_patches = offsets[-1]
+    starts = range(0, n_patches, batch_size)
+    
+    def index(start: int) -> List[_Segment]:
+        stop = min(start + batch_size, n_patches)
+        segments = []
+        v = bisect.bisect_right(offsets, start) - 1
+        while start < stop:
+            end = min(stop, offsets[v + 1])
+            flat = torch.arange(start - offsets[v], end - offsets[v])
+            segments.append((v, flat // n_cols[v], flat % n_cols[v]))
+            start = end
+            v += 1
+        return segments
+    
+    if device.type != "cuda":
+        for start in starts:
+            segments = index(start)
+            # Gathering the batch is the only copy of the input patches
+            batch = torch.cat([views[v][rows, cols] for v, rows, cols in segments]).unsqueeze(1)
+            yield segments, batch.to(device, memory_format=torch.channels_last)
+        return
+    
+    staging = [torch.empty((batch_size, 1) + views[0].shape[2:], pin_memory=True) for _ in range(2)]
+    copied: List[Optional[torch.cuda.Event]] = [None, None]
+    copy_stream = torch.cuda.Stream(device)
+    compute_stream = torch.cuda.current_stream(device)
+    
+    def upload(start: int, slot: int) -> Tuple[List[_Segment], torch.Tensor]:
+        segments = index(start)
+        if copied[slot] is not None:
+            # The last copy out of this buffer must finish before refilling it
+            copied[slot].synchronize()
+        pos = 0
+        for v, rows, cols in segments:
+            staging[slot][pos:pos + len(rows), 0] = views[v][rows, cols]
+            pos += len(rows)
+        with torch.cuda.stream(copy_stream):
+            batch = staging[slot][:pos].to(device, memory_format=torch.channels_last, non_blocking=True)
+        copied[slot] = copy_stream.record_event()
+        return segments, batch
+    
+    pending = upload(starts[0], 0)
+    for k in range(len(starts)):
+        segments, batch = pending
+        compute_stream.wait_stream(copy_stream)
+        # Allocated on the copy stream, freed after use on the compute stream
+        batch.record_stream(compute_stream)
+        if k + 1 < len(starts):
+            pending = upload(starts[k + 1], (k + 1) % 2)
+        yield segments, batch
+
+
+class _CudaGraphForward:
+    """
+    Replays one captured forward for batches of a fixed shape.
+    
+    Every tile batch has the same shape, so after capture each batch costs
+    one input copy and a graph replay instead of a Python forward with its
+    per-kernel launches. Smaller (final) batches fill the front of the
+    static input; the returned output is a view that the next call
+    overwrites.
+    """
+    
+    def __init__(self, model: torch.nn.Module, example: torch.Tensor, warmup: int = 3):
+        self.static_in = example.clone()
+        current = torch.cuda.current_stream(example.device)
+        # Warm up (cuDNN autotuning, allocator) off the capturing stream
+        side = torch.cuda.Stream(example.device)
+        side.wait_stream(current)
+        with torch.cuda.stream(side):
+            for _ in range(warmup):
+                model(self.static_in)
+        current.wait_stream(side)
+        self.graph = torch.cuda.CUDAGraph()
+        with torch.cuda.graph(self.graph):
+            self.static_out = model(self.static_in)
+    
+    def __call__(self, batch: torch.Tensor) -> torch.Tensor:
+        n = len(batch)
+        self.static_in[:n].copy_(batch)
+        self.graph.replay()
+        return self.static_out[:n]
+
+
+def predict_tiled(
+    model: torch.nn.Module,
+    data: np.ndarray,
+    patch_size: Union[int, Tuple[int, int]] = 128,
+    overlap: float = 0.25,
+    batch_size: int = 8,
+    device: Union[str, torch.device, None] = None,
+    mixed_precision: bool = True,
+    cuda_graph: bool = False,
+) -> np.ndarray:
+    """
+    Run ``model`` over a 2D section in overlapping patches.
+    
+    Only the central ``stride x stride`` crop of each prediction is kept,
+    where the network saw context on every side; the crops tile the output
+    exactly, so no blending weights are needed. The section is padded by
+    half the overlap on the leading edges (and enough on the trailing
+    ones), so the outermost rows and columns are predicted from reflected
+    context too. Patches are read through an ``as_strided`` view and only
+    copied one batch at a time, and at most two batches are ever on
+    ``device``, so sections of any size fit.
+    
+    Batches are fed in channels_last layout, which matches models moved to
+    ``torch.channels_last`` (as the engine and the recovery pipeline do).
+    On CUDA their host-to-device copies overlap the previous forward, and
+    with ``cuda_graph`` the forward is captured once into a CUDA graph and
+    replayed for every batch; the model must then be capturable (static
+    control flow, no host syncs).
+    On GPUs with bfloat16 support the forward runs under bf16 autocast
+    unless ``mixed_precision`` is False.
+    
+    Args:
+        model: Module mapping (B, 1, h, w) to (B, 1, h, w).
+        data: Input section (n_traces, n_samples).
+        patch_size: Patch height and width, or one int for square patches.
+        overlap: Fraction of each patch shared with its neighbour.
+        batch_size: Patches per forward pass.
+        device: Where to run the model; defaults to the model's device.
+        mixed_precision: Allow bf16 autocast on CUDA.
+        cuda_graph: Replay a captured CUDA graph instead of calling the
+            model for each batch (CUDA only).
+        
+    Returns:
+        Reconstructed section, same shape as ``data``.
+    """
+    return predict_tiled_batch(
+        model, [data], patch_size, overlap, batch_size, device, mixed_precision, cuda_graph
+    )[0]
+
+
+def predict_tiled_batch(
+    model: torch.nn.Module,
+    sections: Sequence[np.ndarray],
+    patch_size: Union[int, Tuple[int, int]] = 128,
+    overlap: float = 0.25,
+    batch_size: int = 8,
+    device: Union[str, torch.device, None] = None,
+    mixed_precision: bool = True,
+    cuda_graph: bool = False,
+) -> List[np.ndarray]:
+    """
+    :func:`predict_tiled` over several sections at once.
+    
+    The patches of all sections form one sequence that is cut into full
+    batches, so small sections share forward passes instead of each
+    ending in a part-filled batch of its own. Sections may differ in
+    shape. Returns one reconstruction per section, in order.
+    """
+    ph, pw = (patch_size, patch_size) if isinstance(patch_size, int) else patch_size
+    sh, sw = max(1, int(ph * (1 - overlap))), max(1, int(pw * (1 - overlap)))
+    # Offset of the kept crop inside each patch
+    bh, bw = (ph - sh) // 2, (pw - sw) // 2
+    if device is not None:
+        device = torch.device(device)
+    else:
+        # Quantized FX models have no parameters; they run on the CPU
+        param = next(model.parameters(), None)
+        device = param.device if param is not None else torch.device("cpu")
+    use_bf16 = mixed_precision and device.type == "cuda" and torch.cuda.is_bf16_supported()
+    use_graph = cuda_graph and device.type == "cuda"
+    
+    views, outputs, tiles = [], [], []
+    for data in sections:
+        height, width = data.shape
+        n_rows, n_cols = math.ceil(height / sh), math.ceil(width / sw)
+        pad_top, pad_left = bh, bw
+        pad_bottom = (n_rows - 1) * sh + ph - height - bh
+        pad_right = (n_cols - 1) * sw + pw - width - bw
+        inputs = torch.as_tensor(data, dtype=torch.float32)[None, None]
+        # Reflect where possible; tiny sections fall back to edge replication
+        mode = "reflect" if max(pad_top, pad_bottom) < height and max(pad_left, pad_right) < width else "replicate"
+        section = F.pad(inputs, (pad_left, pad_right, pad_top, pad_bottom), mode=mode)[0, 0]
+        views.append(_patch_view(section, ph, pw, sh, sw))
+        output = torch.empty(n_rows * sh, n_cols * sw)
+        outputs.append(output)
+        # Non-overlapping (n_rows, n_cols, sh, sw) tiles, written in place
+        tiles.append(_patch_view(output, sh, sw, sh, sw))
+    
+    # Predicted crops come back through one reused pinned buffer on CUDA:
+    # a direct DMA copy, and no host allocation per batch
+    host_out = torch.empty((batch_size, sh, sw), pin_memory=True) if device.type == "cuda" else None
+    
+    model.eval()
+    forward = model
+    # Graph capture can't record autocast's weight cache, so it is disabled
+    autocast = torch.autocast(
+        device.type, dtype=torch.bfloat16, enabled=use_bf16, cache_enabled=not use_graph
+    )
+    with torch.inference_mode(), autocast:
+        for segments, batch in _device_batches(views, batch_size, device):
+            if use_graph and forward is model:
+                # The first batch is full-sized unless it is the only one
+                forward = _CudaGraphForward(model, batch)
+            pred = forward(batch)[:, 0, bh:bh + sh, bw:bw + sw]
+            pred = host_out[:len(pred)].copy_(pred) if host_out is not None else pred.float()
+            pos = 0
+            for v, rows, cols in segments:
+                tiles[v][rows, cols] = pred[pos:pos + len(rows)]
+                pos += len(rows)
+    
+    return [output[:data.shape[0], :data.shape[1]].numpy() for output, data in zip(outputs, sections)]
+
+
+def compile_for_inference(
+    model: torch.nn.Module,
+    device: Union[str, torch.device],
+    batch_size: int = 8,
+    patch_size: Union[int, Tuple[int, int]] = 128,
+) -> torch.nn.Module:
+    """
+    ``torch.compile`` an eval-mode model for tiled inference on CUDA.
+    
+    Compilation fuses the Conv/BN/activation chains into fewer kernels. The
+    model is warmed up once with a (batch_size, 1, ph, pw) channels_last
+    batch, so compilation and autotuning happen here rather than on the
+    first real batch. On other devices the model is returned unchanged:
+    on CPU neither TorchScript nor inductor beat the eager channels_last
+    UNet, and inductor took close to a minute to compile it.
+    """
+    device = torch.device(device)
+    if device.type != "cuda":
+        return model
+    ph, pw = (patch_size, patch_size) if isinstance(patch_size, int) else patch_size
+    compiled = torch.compile(model, dynamic=False)
+    example = torch.zeros(batch_size, 1, ph, pw, device=device).to(memory_format=torch.channels_last)
+    with torch.inference_mode():
+        compiled(example)
+    return compiled
+
+
+def quantize_for_cpu(
+    model: torch.nn.Module,
+    calibration: np.ndarray,
+    patch_size: Union[int, Tuple[int, int]] = 128,
+    max_patches: int = 64,
+    batch_size: int = 8,
+) -> torch.nn.Module:
+    """
+    Static int8 post-training quantization of ``model`` for CPU inference.
+    
+    Uses FX graph mode: Conv/BN/activation chains are fused and observers
+    record activation ranges on up to ``max_patches`` non-overlapping
+    patches spread evenly over the ``calibration`` section (ideally the
+    data about to be processed, or a representative section). Returns a
+    quantized copy; ``model`` itself is untouched.
+    
+    ``quantize_dynamic`` is no alternative here: it has no Conv2d kernels,
+    so it leaves a convolutional model unchanged.
+    """
+    from torch.ao.quantization import get_default_qconfig_mapping
+    from torch.ao.quantization.quantize_fx import convert_fx, prepare_fx
+    
+    ph, pw = (patch_size, patch_size) if isinstance(patch_size, int) else patch_size
+    section = torch.as_tensor(calibration, dtype=torch.float32)
+    pad_h, pad_w = max(0, ph - section.shape[0]), max(0, pw - section.shape[1])
+    if pad_h or pad_w:
+        section = F.pad(section[None, None], (0, pad_w, 0, pad_h), mode="replicate")[0, 0]
+    patches = _patch_view(section, ph, pw, ph, pw)
+    n_cols = patches.shape[1]
+    n_patches = patches.shape[0] * n_cols
+    index = torch.linspace(0, n_patches - 1, min(n_patches, max_patches)).long()
+    sample = patches[index // n_cols, index % n_cols].unsqueeze(1)
+    
+    model = copy.deepcopy(model).cpu().eval()
+    for module in model.modules():
+        # Quantized activations have no in-place variants
+        if getattr(module, "inplace", False):
+            module.inplace = False
+    qconfig = get_default_qconfig_mapping(torch.backends.quantized.engine)
+    prepared = prepare_fx(model, qconfig, example_inputs=(sample[:1],))
+    with torch.no_grad():
+        for batch in sample.split(batch_size):
+            prepared(batch)
+    return convert_fx(prepared)
+
+
 class InferenceEngine:
     """
     Batched, Patch-based Inference Engine.
@@ -20,11 +390,12 @@ class InferenceEngine:
     - Loading large volumes
     - Sliding window extraction
     - Batched GPU inference
-    - Window blending (Cosine weighted)
+    - Central-crop stitching
     - Reassembly
     """
-    def __init__(self, model_path: str, device: str = None):
+    def __init__(self, model_path: str, device: str = None, compile_model: bool = False):
         self.device = device or settings.DEFAULT_DEVICE
+        configure_cuda_allocator()
         
         # Load Checkpoint & Config
         # In real scenario: load from .pt file
@@ -33,17 +404,20 @@ class InferenceEngine:
         model_name = "unet" # Mock
         
         self.model = ModelRegistry.create(model_name, self.config)
-        self.model.to(self.device)
+        # NHWC lets conv layers use the faster cuDNN/oneDNN kernels
+        self.model.to(self.device, memory_format=torch.channels_last)
         self.model.eval()
+        if compile_model:
+            self.model = compile_for_inference(self.model, self.device)
         
-    @torch.no_grad()
     def run(
         self, 
         input_path: str, 
         output_path: str,
         patch_size: int = 128,
         overlap: float = 0.25,
-        batch_size: int = 8
+        batch_size: int = 8,
+        cuda_graph: bool = False,
     ):
         input_path = Path(input_path)
         output_path = Path(output_path)
@@ -57,60 +431,24 @@ class InferenceEngine:
             # Fallback or error
             raise ValueError(f"Unsupported format {input_path.suffix}. Convert to Zarr first.")
             
-        n_traces, n_time = data.shape
-        stride = int(patch_size * (1 - overlap))
-        
-        # Output Buffer
-        output = np.zeros_like(data.values)
-        weights = np.zeros_like(data.values)
-        
-        # Cosine Window for blending
-        # 1D window
-        w = np.sin(np.pi * np.arange(0.5, patch_size + 0.5) / patch_size)
-        # 2D window
-        window = np.outer(w, w)
-        
-        # generate patches
-        patches = []
-        coords = []
-        
-        for t in range(0, n_traces - patch_size + 1, stride):
-            for s in range(0, n_time - patch_size + 1, stride):
-                patch = data[t:t+patch_size, s:s+patch_size].values
-                patches.append(patch)
-                coords.append((t, s))
-                
-                if len(patches) == batch_size:
-                    self._process_batch(patches, coords, output, weights, window)
-                    patches = []
-                    coords = []
-                    
-        # Process remaining
-        if patches:
-             self._process_batch(patches, coords, output, weights, window)
-             
-        # Normalize by weights
-        output /= (weights + 1e-8)
+        output = predict_tiled(
+            self.model,
+            np.asarray(data.values),
+            patch_size=patch_size,
+            overlap=overlap,
+            batch_size=batch_size,
+            device=self.device,
+            cuda_graph=cuda_graph,
+        )
+        if str(self.device).startswith("cuda"):
+            report_memory(self.device)
         
         # Save
         # Reuse Zarr wrapper logic or save as specific reconstruction format
         # For now, just logging done
         logger.info("Inference complete. Saving results...")
-        
-    def _process_batch(self, patches, coords, output, weights, window):
-        # Prepare Batch
-        batch = np.array(patches) # B, H, W
-        batch = torch.from_numpy(batch).unsqueeze(1).float().to(self.device) # B, 1, H, W
-        
-        # Infer
-        pred = self.model(batch)
-        pred = pred.cpu().numpy()[:, 0, :, :]
-        
-        # Accumulate
-        for i, (t, s) in enumerate(coords):
-            h, w = pred[i].shape
-            output[t:t+h, s:s+w] += pred[i] * window
-            weights[t:t+h, s:s+w] += window
+        return output
+
 
 # Notebook Helper Functions
 def load_model(name: str) -> torch.nn.Module:
@@ -192,5 +530,6 @@ def reconstruct(
     Returns:
         Reconstructed numpy array.
     """
-    engine = InferenceEngine(model, device=device, patch_size=patch_size, overlap=overlap)
-    return engine.run(data)
+    if device is not None:
+        model.to(device)
+    return predict_tiled(model, data, patch_size=patch_size, overlap=overlap, device=device)
@@ -13,12 +13,23 @@ from typing import Dict, Any, Optional, Union, List
 
 from promethium.core.logging import get_logger
 from promethium.core.config import get_settings
+from promethium.ml.inference import (
+    compile_for_inference,
+    configure_cuda_allocator,
+    predict_tiled,
+    predict_tiled_batch,
+    quantize_for_cpu,
+    report_memory,
+)
 from promethium.ml.models.registry import ModelRegistry
 from promethium.signal.filters import bandpass_filter
 
 logger = get_logger(__name__)
 settings = get_settings()
 
+# torch.load(mmap=...) and load_state_dict(assign=...) arrived in 2.1
+_TORCH_MMAP_LOAD = torch.__version__ >= (2, 1)
+
 
 # Built-in pipeline presets
 PIPELINE_PRESETS: Dict[str, Dict[str, Any]] = {
@@ -104,9 +115,13 @@ class SeismicRecoveryPipeline:
             model_config: Model-specific configuration parameters.
             preprocessing: Preprocessing steps and parameters.
             postprocessing: Postprocessing steps and parameters.
-            inference: Inference parameters (patch_size, overlap, batch_size).
+            inference: Inference parameters (patch_size, overlap, batch_size,
+                      and optionally cuda_graph, compile and quantize).
             device: Device to run inference on ('cuda', 'cpu', or 'auto').
         """
+        # Must precede the first CUDA allocation to take effect from the env
+        configure_cuda_allocator()
+        
         self.model_name = model_name
         self.model_config = model_config or {"n_channels": 1, "n_classes": 1}
         self.preprocessing = preprocessing or {}
@@ -124,6 +139,7 @@ class SeismicRecoveryPipeline:
             self.device = device
             
         self._model: Optional[torch.nn.Module] = None
+        self._quantized = False
         self._normalization_params: Dict[str, float] = {}
         
         logger.info(
@@ -216,27 +232,46 @@ class SeismicRecoveryPipeline:
                            creates a fresh model with random weights.
         """
         self._model = ModelRegistry.create(self.model_name, self.model_config)
+        self._quantized = False
         
         if checkpoint_path is not None:
             checkpoint_path = Path(checkpoint_path)
             if checkpoint_path.exists():
-                state_dict = torch.load(checkpoint_path, map_location=self.device)
-                self._model.load_state_dict(state_dict)
+                # weights_only restricts unpickling to tensors and plain
+                # containers. With mmap the tensors stay file-backed and are
+                # adopted as-is (assign), so the weights are read once, by
+                # the device move below, instead of into a host copy first.
+                if _TORCH_MMAP_LOAD:
+                    state_dict = torch.load(
+                        checkpoint_path, map_location="cpu", mmap=True, weights_only=True
+                    )
+                    self._model.load_state_dict(state_dict, assign=True)
+                else:
+                    state_dict = torch.load(checkpoint_path, map_location="cpu", weights_only=True)
+                    self._model.load_state_dict(state_dict)
                 logger.info(f"Loaded model checkpoint from {checkpoint_path}")
             else:
                 logger.warning(f"Checkpoint not found: {checkpoint_path}")
                 
-        self._model.to(self.device)
+        # NHWC lets conv layers use the faster cuDNN/oneDNN kernels
+        self._model.to(self.device, memory_format=torch.channels_last)
         self._model.eval()
+        if self.inference_config.get("compile", False):
+            self._model = compile_for_inference(
+                self._model,
+                self.device,
+                batch_size=self.inference_config.get("batch_size", 8),
+                patch_size=self.inference_config.get("patch_size", 128),
+            )
         logger.info(f"Model loaded and moved to {self.device}")
     
     def _preprocess(self, data: Union[np.ndarray, xr.DataArray]) -> np.ndarray:
         """Apply preprocessing steps to input data."""
-        # Convert to numpy if xarray
+        # Convert to numpy if xarray; always a private floating-point copy,
+        # so the steps below can work in place
         if isinstance(data, xr.DataArray):
-            arr = data.values.copy()
-        else:
-            arr = data.copy()
+            data = data.values
+        arr = np.array(data, dtype=np.result_type(data.dtype, np.float32))
             
         # Apply bandpass filter if configured
         if "bandpass" in self.preprocessing:
@@ -246,31 +281,31 @@ class SeismicRecoveryPipeline:
             
         # Normalize if configured
         if self.preprocessing.get("normalize", False):
-            self._normalization_params["mean"] = float(np.mean(arr))
-            self._normalization_params["std"] = float(np.std(arr))
-            arr = (arr - self._normalization_params["mean"]) / (
-                self._normalization_params["std"] + 1e-8
-            )
+            # Center in place and take the std from the centered data: three
+            # passes over the array and no temporaries, where np.std alone
+            # would recompute the mean and allocate a squared copy
+            mean = float(arr.mean(dtype=np.float64))
+            arr -= mean
+            std = float(np.sqrt(np.vdot(arr, arr) / max(arr.size, 1)))
+            arr *= 1.0 / (std + 1e-8)
+            self._normalization_params["mean"] = mean
+            self._normalization_params["std"] = std
             logger.debug("Applied normalization")
             
         return arr
     
     def _postprocess(self, data: np.ndarray) -> np.ndarray:
         """Apply postprocessing steps to output data."""
-        arr = data.copy()
-        
         # Denormalize if configured
-        if self.postprocessing.get("denormalize", False):
-            if self._normalization_params:
-                arr = (
-                    arr * (self._normalization_params["std"] + 1e-8)
-                    + self._normalization_params["mean"]
-                )
-                logger.debug("Applied denormalization")
-                
-        return arr
+        if self.postprocessing.get("denormalize", False) and self._normalization_params:
+            # One new array, then shifted in place
+            arr = data * (self._normalization_params["std"] + 1e-8)
+            arr += self._normalization_params["mean"]
+            logger.debug("Applied denormalization")
+            return arr
+        
+        return data.copy()
     
-    @torch.no_grad()
     def run(
         self,
         data: Union[np.ndarray, xr.DataArray],
@@ -307,20 +342,26 @@ class SeismicRecoveryPipeline:
         overlap = self.inference_config.get("overlap", 0.25)
         batch_size = self.inference_config.get("batch_size", 8)
         
-        # For small data that fits in a single patch, do direct inference
-        if processed.shape[0] <= patch_size and processed.shape[1] <= patch_size:
-            # Pad to patch size
-            padded = np.zeros((patch_size, patch_size), dtype=np.float32)
-            padded[:processed.shape[0], :processed.shape[1]] = processed
-            
-            # Run inference
-            inp = torch.from_numpy(padded).float().unsqueeze(0).unsqueeze(0)
-            inp = inp.to(self.device)
-            out = self._model(inp)
-            result = out.cpu().numpy()[0, 0, :processed.shape[0], :processed.shape[1]]
-        else:
-            # Use patch-based inference for larger data
-            result = self._patch_inference(processed, patch_size, overlap, batch_size)
+        if self.inference_config.get("quantize", False) and self.device == "cpu" and not self._quantized:
+            # int8 on CPU, calibrated on the first section processed
+            self._model = quantize_for_cpu(
+                self._model, processed, patch_size=patch_size, batch_size=batch_size
+            )
+            self._quantized = True
+        
+        # Tiled under inference_mode (and bf16 autocast on capable GPUs);
+        # sections smaller than a patch are padded to one
+        result = predict_tiled(
+            self._model,
+            processed,
+            patch_size=patch_size,
+            overlap=overlap,
+            batch_size=batch_size,
+            device=self.device,
+            cuda_graph=self.inference_config.get("cuda_graph", False),
+        )
+        if self.device.startswith("cuda"):
+            report_memory(self.device)
             
         # Postprocess
         result = self._postprocess(result)
@@ -328,70 +369,64 @@ class SeismicRecoveryPipeline:
         logger.info("Pipeline completed successfully")
         return result
     
-    def _patch_inference(
+    def run_batch(
         self,
-        data: np.ndarray,
-        patch_size: int,
-        overlap: float,
-        batch_size: int,
-    ) -> np.ndarray:
-        """Run patch-based inference for large data."""
-        n_traces, n_time = data.shape
-        stride = int(patch_size * (1 - overlap))
+        sections: List[Union[np.ndarray, xr.DataArray]],
+        checkpoint_path: Optional[Union[str, Path]] = None,
+    ) -> List[np.ndarray]:
+        """
+        Run the pipeline on several sections, sharing inference batches.
         
-        # Output buffers
-        output = np.zeros_like(data, dtype=np.float32)
-        weights = np.zeros_like(data, dtype=np.float32)
+        Each section is pre- and postprocessed on its own (with its own
+        normalization), but the model sees the patches of all sections as
+        one stream of full batches, which keeps the device busy when the
+        sections are small.
         
-        # Cosine window for blending
-        w = np.sin(np.pi * np.arange(0.5, patch_size + 0.5) / patch_size)
-        window = np.outer(w, w).astype(np.float32)
+        Args:
+            sections: Input sections, each (n_traces, n_samples); shapes may differ.
+            checkpoint_path: Optional path to model checkpoint.
+            
+        Returns:
+            Reconstructed sections, in input order.
+        """
+        if self._model is None:
+            self.load_model(checkpoint_path)
         
-        # Collect patches
-        patches = []
-        coords = []
+        logger.info(f"Running pipeline on {len(sections)} sections")
         
-        for t in range(0, max(1, n_traces - patch_size + 1), stride):
-            for s in range(0, max(1, n_time - patch_size + 1), stride):
-                t_end = min(t + patch_size, n_traces)
-                s_end = min(s + patch_size, n_time)
-                
-                patch = np.zeros((patch_size, patch_size), dtype=np.float32)
-                patch[:t_end-t, :s_end-s] = data[t:t_end, s:s_end]
-                patches.append(patch)
-                coords.append((t, s, t_end-t, s_end-s))
-                
-                if len(patches) >= batch_size:
-                    self._process_batch(patches, coords, output, weights, window)
-                    patches = []
-                    coords = []
-                    
-        # Process remaining patches
-        if patches:
-            self._process_batch(patches, coords, output, weights, window)
-            
-        # Normalize by weights
-        output = output / (weights + 1e-8)
-        return output
-    
-    def _process_batch(
-        self,
-        patches: List[np.ndarray],
-        coords: List[tuple],
-        output: np.ndarray,
-        weights: np.ndarray,
-        window: np.ndarray,
-    ) -> None:
-        """Process a batch of patches."""
-        batch = np.stack(patches, axis=0)
-        batch_tensor = torch.from_numpy(batch).float().unsqueeze(1).to(self.device)
+        processed, params = [], []
+        for data in sections:
+            processed.append(self._preprocess(data))
+            params.append(dict(self._normalization_params))
         
-        pred = self._model(batch_tensor)
-        pred = pred.cpu().numpy()[:, 0, :, :]
+        patch_size = self.inference_config.get("patch_size", 128)
+        batch_size = self.inference_config.get("batch_size", 8)
+        
+        if self.inference_config.get("quantize", False) and self.device == "cpu" and not self._quantized:
+            self._model = quantize_for_cpu(
+                self._model, processed[0], patch_size=patch_size, batch_size=batch_size
+            )
+            self._quantized = True
         
-        for i, (t, s, h, w_) in enumerate(coords):
-            output[t:t+h, s:s+w_] += pred[i, :h, :w_] * window[:h, :w_]
-            weights[t:t+h, s:s+w_] += window[:h, :w_]
+        results = predict_tiled_batch(
+            self._model,
+            processed,
+            patch_size=patch_size,
+            overlap=self.inference_config.get("overlap", 0.25),
+            batch_size=batch_size,
+            device=self.device,
+            cuda_graph=self.inference_config.get("cuda_graph", False),
+        )
+        if self.device.startswith("cuda"):
+            report_memory(self.device)
+        
+        outputs = []
+        for result, section_params in zip(results, params):
+            self._normalization_params = section_params
+            outputs.append(self._postprocess(result))
+        
+        logger.info("Pipeline completed successfully")
+        return outputs
     
     def __repr__(self) -> str:
         return (
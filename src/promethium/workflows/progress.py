@@ -0,0 +1,56 @@
+"""
+Job progress publishing.
+
+Workers publish progress to a per-job Redis channel. Every API process
+listens on those channels while it has WebSocket clients and forwards each
+message to the sockets watching that job (see
+``promethium.api.routers.websockets``), so progress reaches clients no
+matter which worker process they are connected to.
+"""
+from typing import Any, Optional
+
+import orjson
+import redis
+from pydantic import BaseModel
+
+from promethium.core.config import get_settings
+from promethium.core.logging import get_logger
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+JOB_CHANNEL_PREFIX = "promethium:job:"
+
+_client: Optional[redis.Redis] = None
+
+
+def job_channel(job_id: Any) -> str:
+    """Redis Pub/Sub channel carrying progress for ``job_id``."""
+    return f"{JOB_CHANNEL_PREFIX}{job_id}"
+
+
+def publish_progress(job_id: Any, payload: Any) -> int:
+    """
+    Publish a progress message for ``job_id``.
+
+    ``payload`` is a dict or a
+    :class:`~promethium.api.schemas.job.JobProgressMsg`, both encoded
+    directly by orjson without validation, or an already validated
+    :class:`~promethium.api.schemas.job.JobProgress`, which is serialized
+    by pydantic-core.
+
+    Returns the number of API processes that received it. Progress is
+    best-effort: a Redis failure is logged and reported as 0.
+    """
+    global _client
+    if _client is None:
+        _client = redis.Redis.from_url(settings.REDIS_URL)
+    if isinstance(payload, BaseModel):
+        data = payload.model_dump_json().encode()
+    else:
+        data = orjson.dumps(payload)
+    try:
+        return _client.publish(job_channel(job_id), data)
+    except redis.RedisError as e:
+        logger.warning(f"Failed to publish progress for job {job_id}: {e}")
+        return 0
@@ -49,14 +49,13 @@ def sample_traces():
     
     # Generate synthetic seismic data
     t = np.linspace(0, n_samples / sample_rate, n_samples)
-    traces = np.zeros((n_traces, n_samples))
+    rng = np.random.default_rng(0)
     
-    for i in range(n_traces):
-        # Add synthetic reflections
-        traces[i] = (
-            np.sin(2 * np.pi * 30 * t) * np.exp(-0.5 * t) +
-            0.1 * np.random.randn(n_samples)
-        )
+    # Same synthetic reflection on every trace, plus independent noise
+    reflection = np.sin(2 * np.pi * 30 * t) * np.exp(-0.5 * t)
+    traces = rng.standard_normal((n_traces, n_samples))
+    traces *= 0.1
+    traces += reflection
     
     return {
         "traces": traces,
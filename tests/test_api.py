@@ -0,0 +1,416 @@
+"""
+Promethium API Tests
+
+Tests for the web API: pagination, create handlers, middleware and response caching.
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("aiosqlite")
+
+
+# ============================================================================
+# Pagination
+# ============================================================================
+
+async def _paginate_all(limit: int):
+    """Page through seeded experiments; return each page's ids and cursor."""
+    from sqlalchemy import select, text
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from promethium.api.models import Base, Experiment
+    from promethium.api.pagination import paginate
+    from promethium.api.schemas.experiment import ExperimentRead
+
+    engine = create_async_engine("sqlite+aiosqlite://")
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine) as db:
+            db.add_all([Experiment(name=f"exp{i}") for i in range(1, 6)])
+            await db.commit()
+            # Rows 2 and 3 share a timestamp, so their order comes from the id
+            for row_id, ts in [(1, "01"), (2, "03"), (3, "03"), (4, "02"), (5, "04")]:
+                await db.execute(
+                    text("UPDATE experiments SET created_at = :ts WHERE id = :id"),
+                    {"ts": f"2026-01-01 00:00:{ts}", "id": row_id},
+                )
+            await db.commit()
+
+            pages, cursor = [], None
+            while True:
+                page = await paginate(db, select(Experiment), Experiment, ExperimentRead, cursor, limit)
+                pages.append(([item["id"] for item in page["items"]], page["next_cursor"]))
+                cursor = page["next_cursor"]
+                if cursor is None:
+                    return pages
+    finally:
+        await engine.dispose()
+
+
+def test_paginate_cursor_round_trip():
+    """Test that following cursors visits every row once, newest first."""
+    pages = asyncio.run(_paginate_all(limit=2))
+
+    assert [ids for ids, _ in pages] == [[5, 3], [2, 4], [1]]
+    assert all(cursor for _, cursor in pages[:-1])
+    assert pages[-1][1] is None
+
+
+def test_paginate_limit_covers_all_rows():
+    """Test that a page holding every row has no next cursor."""
+    pages = asyncio.run(_paginate_all(limit=5))
+
+    assert pages == [([5, 3, 2, 4, 1], None)]
+
+
+def test_decode_cursor_rejects_garbage():
+    """Test that a malformed cursor is a 400, not a server error."""
+    from fastapi import HTTPException
+    from promethium.api.pagination import decode_cursor
+
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor("not-a-cursor", int)
+    assert exc_info.value.status_code == 400
+
+
+# ============================================================================
+# Create handlers
+# ============================================================================
+
+async def _post_counting_statements(monkeypatch, path: str, payload):
+    """POST to a router with a seeded user; return the response and the SQL it ran."""
+    import httpx
+    from fastapi import FastAPI
+    from sqlalchemy import event
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from sqlalchemy.pool import StaticPool
+    from promethium.api import cache
+    from promethium.api.deps.auth import get_current_active_user
+    from promethium.api.models import Base, User
+    from promethium.api.routers import experiments, jobs
+    from promethium.core.database import get_db
+
+    monkeypatch.setattr(cache, "get_client", lambda: None)
+
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            user = User(email="a@example.com", hashed_password="x", full_name="A")
+            db.add(user)
+            await db.commit()
+
+        async def override_db():
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                yield session
+
+        app = FastAPI()
+        app.include_router(experiments.router)
+        app.include_router(jobs.router)
+        app.dependency_overrides[get_db] = override_db
+        app.dependency_overrides[get_current_active_user] = lambda: user
+
+        statements = []
+        event.listen(
+            engine.sync_engine, "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post(path, json=payload)
+        return response, statements
+    finally:
+        await engine.dispose()
+
+
+def test_create_runs_a_single_insert(monkeypatch):
+    """Test that a create handler issues one INSERT ... RETURNING and no reload."""
+    pytest.importorskip("httpx")
+
+    response, statements = asyncio.run(
+        _post_counting_statements(monkeypatch, "/experiments/", {"name": "exp"})
+    )
+
+    assert response.status_code == 201
+    assert response.json()["created_at"] is not None
+    verbs = [statement.split()[0].upper() for statement in statements]
+    assert verbs.count("INSERT") == 1
+    assert "SELECT" not in verbs
+    assert "RETURNING" in statements[verbs.index("INSERT")].upper()
+
+
+def test_job_creates_keep_type_and_algorithm(monkeypatch):
+    """Test that single and batch job creates store every JobCreate field."""
+    pytest.importorskip("httpx")
+
+    single, _ = asyncio.run(_post_counting_statements(
+        monkeypatch, "/jobs/", {"type": "training", "algorithm": "unet"},
+    ))
+    batch, _ = asyncio.run(_post_counting_statements(
+        monkeypatch, "/jobs/batch", [{"type": "x", "algorithm": "a"}, {"type": "y"}],
+    ))
+
+    assert single.status_code == 201
+    assert (single.json()["type"], single.json()["algorithm"]) == ("training", "unet")
+    assert batch.status_code == 201
+    assert [(job["type"], job["algorithm"]) for job in batch.json()] == [("x", "a"), ("y", None)]
+
+
+# ============================================================================
+# Middleware
+# ============================================================================
+
+def _inner_app(calls: list):
+    """ASGI app that records each request and answers with a custom header."""
+    async def app(scope, receive, send):
+        calls.append(scope["path"])
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"text/plain"), (b"x-inner", b"1")],
+        })
+        await send({"type": "http.response.body", "body": b"inner"})
+    return app
+
+
+def _request(app, method: str, path: str, headers: dict = None):
+    """Send one request through an ASGI app and return the response."""
+    httpx = pytest.importorskip("httpx")
+
+    async def send():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.request(method, path, headers=headers)
+
+    return asyncio.run(send())
+
+
+def test_cors_answers_allowed_preflight():
+    """Test that a preflight from an allowed origin is answered without the app."""
+    from promethium.api.middleware import FastCORSMiddleware
+
+    calls = []
+    app = FastCORSMiddleware(_inner_app(calls), origins=["https://ui.example"])
+
+    response = _request(app, "OPTIONS", "/jobs", {
+        "origin": "https://ui.example",
+        "access-control-request-method": "POST",
+        "access-control-request-headers": "authorization, content-type",
+    })
+
+    assert response.status_code == 204
+    assert response.headers["access-control-allow-origin"] == "https://ui.example"
+    assert response.headers["access-control-allow-credentials"] == "true"
+    assert "POST" in response.headers["access-control-allow-methods"]
+    assert response.headers["access-control-allow-headers"] == "authorization, content-type"
+    assert calls == []
+
+
+def test_cors_rejects_preflight_from_unknown_origin():
+    """Test that a preflight from an origin not in the list gets a 400."""
+    from promethium.api.middleware import FastCORSMiddleware
+
+    calls = []
+    app = FastCORSMiddleware(_inner_app(calls), origins=["https://ui.example"])
+
+    response = _request(app, "OPTIONS", "/jobs", {
+        "origin": "https://evil.example",
+        "access-control-request-method": "POST",
+    })
+
+    assert response.status_code == 400
+    assert "access-control-allow-origin" not in response.headers
+    assert calls == []
+
+
+def test_cors_adds_headers_for_allowed_origin():
+    """Test that an allowed origin gets CORS headers next to the app's own."""
+    from promethium.api.middleware import FastCORSMiddleware
+
+    calls = []
+    app = FastCORSMiddleware(_inner_app(calls), origins=["https://ui.example"])
+
+    response = _request(app, "GET", "/jobs", {"origin": "https://ui.example"})
+
+    assert response.text == "inner"
+    assert response.headers["x-inner"] == "1"
+    assert response.headers["access-control-allow-origin"] == "https://ui.example"
+    assert response.headers["vary"] == "Origin"
+    assert calls == ["/jobs"]
+
+
+def test_cors_passes_through_other_requests():
+    """Test that unknown origins and same-origin requests get no CORS headers."""
+    from promethium.api.middleware import FastCORSMiddleware
+
+    calls = []
+    app = FastCORSMiddleware(_inner_app(calls), origins=["https://ui.example"])
+
+    denied = _request(app, "GET", "/jobs", {"origin": "https://evil.example"})
+    same_origin = _request(app, "GET", "/jobs")
+
+    for response in (denied, same_origin):
+        assert response.text == "inner"
+        assert response.headers["x-inner"] == "1"
+        assert "access-control-allow-origin" not in response.headers
+    assert calls == ["/jobs", "/jobs"]
+
+
+def test_cors_wildcard_echoes_origin():
+    """Test that the wildcard allows any origin but echoes it, as credentials need."""
+    from promethium.api.middleware import FastCORSMiddleware
+
+    app = FastCORSMiddleware(_inner_app([]))
+
+    response = _request(app, "GET", "/jobs", {"origin": "https://any.example"})
+
+    assert response.headers["access-control-allow-origin"] == "https://any.example"
+
+
+def test_fast_paths_answer_health_and_openapi():
+    """Test that /health and the OpenAPI document skip the app; the schema is built once."""
+    from promethium.api.middleware import FastPathsMiddleware
+
+    calls, builds = [], []
+
+    def openapi():
+        builds.append(1)
+        return {"openapi": "3.1.0", "info": {"title": "Promethium"}}
+
+    app = FastPathsMiddleware(_inner_app(calls), openapi=openapi, openapi_url="/openapi.json")
+
+    health = _request(app, "GET", "/health")
+    first = _request(app, "GET", "/openapi.json")
+    second = _request(app, "GET", "/openapi.json")
+    other = _request(app, "GET", "/jobs")
+
+    assert health.json() == {"status": "ok"}
+    assert first.json()["info"]["title"] == "Promethium"
+    assert second.content == first.content
+    assert first.headers["content-length"] == str(len(first.content))
+    assert builds == [1]
+    assert other.headers["x-inner"] == "1"
+    assert calls == ["/jobs"]
+
+
+# ============================================================================
+# Response cache
+# ============================================================================
+
+@pytest.fixture
+def cache_client(monkeypatch):
+    """Enable the response cache against an in-process fake Redis."""
+    fakeredis = pytest.importorskip("fakeredis")
+    from promethium.api import cache
+
+    client = fakeredis.FakeAsyncRedis()
+    monkeypatch.setattr(cache.settings, "RESPONSE_CACHE_ENABLED", True)
+    monkeypatch.setattr(cache, "_client", client)
+    monkeypatch.setattr(cache, "_down_until", 0.0)
+    return client
+
+
+def _counting_endpoint(namespace: str = "items"):
+    """A cached endpoint that records its calls and echoes its arguments."""
+    from typing import Dict
+    from promethium.api.cache import cached
+
+    calls = []
+
+    @cached(namespace, Dict[str, int])
+    async def list_items(limit: int = 10, current_user=None):
+        calls.append(limit)
+        return {"limit": limit, "user": getattr(current_user, "id", 0)}
+
+    return list_items, calls
+
+
+def test_cache_serves_repeat_requests(cache_client):
+    """Test that the second identical call is served from the cache."""
+    endpoint, calls = _counting_endpoint()
+
+    async def run():
+        return [await endpoint(limit=5), await endpoint(limit=5), await endpoint(limit=6)]
+
+    first, second, other = asyncio.run(run())
+
+    assert first.body == second.body == b'{"limit":5,"user":0}'
+    assert other.body == b'{"limit":6,"user":0}'
+    assert calls == [5, 6]
+
+
+def test_cache_keys_are_per_user(cache_client):
+    """Test that users get separate entries, keyed on the user id."""
+    import hashlib
+    from promethium.api.cache import KEY_PREFIX
+    from promethium.api.models import User
+
+    endpoint, calls = _counting_endpoint()
+    alice, bob = User(id=1, email="alice@example.com"), User(id=2, email="bob@example.com")
+
+    async def run():
+        responses = [
+            await endpoint(limit=5, current_user=alice),
+            await endpoint(limit=5, current_user=bob),
+            await endpoint(limit=5, current_user=User(id=1, email="alice@example.com")),
+        ]
+        return responses, await cache_client.keys("*")
+
+    (for_alice, for_bob, alice_again), keys = asyncio.run(run())
+
+    assert for_alice.body == alice_again.body != for_bob.body
+    assert calls == [5, 5]
+    digest = hashlib.blake2b(b"list_items|current_user=1|limit=5", digest_size=8).hexdigest()
+    assert f"{KEY_PREFIX}:items:{digest}".encode() in keys
+
+
+def test_invalidate_drops_only_its_namespace(cache_client):
+    """Test that invalidate() forces a miss in its namespace and leaves others cached."""
+    from promethium.api.cache import invalidate
+
+    items, item_calls = _counting_endpoint("items")
+    jobs, job_calls = _counting_endpoint("jobs")
+
+    async def run():
+        await items(limit=5)
+        await jobs(limit=5)
+        await invalidate("items")
+        await items(limit=5)
+        await jobs(limit=5)
+
+    asyncio.run(run())
+
+    assert item_calls == [5, 5]
+    assert job_calls == [5]
+
+
+def test_cache_backs_off_while_redis_is_down(cache_client, monkeypatch):
+    """Test that a Redis error degrades to a miss and skips Redis until the retry time."""
+    from promethium.api import cache
+
+    endpoint, calls = _counting_endpoint()
+    redis_calls = []
+
+    async def broken_get(key):
+        redis_calls.append(key)
+        raise ConnectionError("redis is down")
+
+    monkeypatch.setattr(cache_client, "get", broken_get)
+
+    async def run():
+        return [await endpoint(limit=5), await endpoint(limit=5)]
+
+    first, second = asyncio.run(run())
+
+    assert first == second == {"limit": 5, "user": 0}
+    assert calls == [5, 5]
+    assert len(redis_calls) == 1
+    assert cache.get_client() is None
+
+    monkeypatch.setattr(cache, "_down_until", 0.0)
+    assert cache.get_client() is cache_client
@@ -0,0 +1,108 @@
+"""
+Promethium Benchmark Runner Tests
+
+Tests for the benchmark sweep runner in benchmarks/run_all.py.
+"""
+
+import math
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# run_all.py is a script, not a package module
+sys.path.insert(0, str(Path(__file__).parent.parent / "benchmarks"))
+
+import run_all
+
+
+# ============================================================================
+# Result files
+# ============================================================================
+
+def test_results_keep_infinite_metrics(tmp_path: Path):
+    """Test that an inf SNR survives the JSONL round trip and the summary."""
+    results = [
+        {"dataset": "d", "pipeline": "p", "status": "success", "metrics": {"snr": 12.0}},
+        {"dataset": "d", "pipeline": "p", "status": "success", "metrics": {"snr": math.inf}},
+    ]
+    path = tmp_path / "results.jsonl"
+    with run_all._ResultStream(path) as stream:
+        for result in results:
+            stream.write(result)
+
+    reread = run_all.load_results_jsonl(path)
+    summary = run_all.generate_summary(reread, {})
+
+    assert reread[1]["metrics"]["snr"] == math.inf
+    assert summary["p"]["snr"]["max"] == math.inf
+
+
+def test_summary_skips_null_metrics():
+    """Test that null metrics from older result files are left out of the summary."""
+    results = [
+        {"pipeline": "p", "status": "success", "metrics": {"snr": None, "mse": 1.0}},
+        {"pipeline": "p", "status": "success", "metrics": {"snr": 10.0, "mse": 3.0}},
+    ]
+
+    summary = run_all.generate_summary(results, {})
+
+    assert summary["p"]["snr"]["mean"] == 10.0
+    assert summary["p"]["mse"]["mean"] == 2.0
+
+
+# ============================================================================
+# Parallel workers
+# ============================================================================
+
+def _run_shared_job(monkeypatch, dataset, pipeline):
+    """Run ``pipeline`` on ``dataset`` as a parallel worker would; return the shared array after."""
+    monkeypatch.setattr(run_all, "run_single_pipeline", pipeline)
+
+    traces, shell = run_all._split_dataset(dataset)
+    shm, spec = run_all._share_array(traces)
+    try:
+        job = ("d", {"name": "p"}, "unused.sgy", None, Path("."))
+        result = run_all._run_job(job, shared=spec, shell=shell)
+        assert result["status"] == "success"
+        return np.ndarray(spec[1], dtype=spec[2], buffer=shm.buf).copy()
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def test_worker_rebuilds_xarray_dataset(monkeypatch):
+    """Test that a worker sees the same DataArray a sequential run would."""
+    xr = pytest.importorskip("xarray")
+
+    dataset = xr.DataArray(
+        np.arange(12, dtype=np.float32).reshape(3, 4),
+        dims=("trace", "time"),
+        coords={"trace": [10, 11, 12], "time": np.linspace(0.0, 0.3, 4)},
+        name="amplitude",
+        attrs={"sample_rate": 250.0},
+    )
+    seen = {}
+
+    def pipeline(pipeline_config, dataset_path, reference_path, output_dir, dataset=None):
+        seen["dataset"] = dataset
+        return {"pipeline": pipeline_config["name"], "status": "success", "metrics": {}}
+
+    _run_shared_job(monkeypatch, dataset, pipeline)
+
+    assert isinstance(seen["dataset"], xr.DataArray)
+    xr.testing.assert_identical(seen["dataset"], dataset)
+
+
+def test_worker_array_is_private_and_writable(monkeypatch):
+    """Test that a worker can write its dataset without touching the shared copy."""
+    original = np.arange(6, dtype=np.float64).reshape(2, 3)
+
+    def pipeline(pipeline_config, dataset_path, reference_path, output_dir, dataset=None):
+        dataset[...] = -1.0
+        return {"pipeline": pipeline_config["name"], "status": "success", "metrics": {}}
+
+    segment = _run_shared_job(monkeypatch, original, pipeline)
+
+    np.testing.assert_array_equal(segment, original)
@@ -0,0 +1,101 @@
+"""
+Promethium CLI Tests
+
+Tests for helpers behind the ``promethium`` command line.
+"""
+
+import json
+import math
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("typer")
+
+
+def test_cli_read_runs_accepts_non_finite_values(tmp_path: Path):
+    """Test that the experiments CLI parses logs holding Infinity."""
+    from promethium.cli import _read_runs
+
+    log_file = tmp_path / "exp.jsonl"
+    log_file.write_text(
+        json.dumps({"run_id": "a", "metrics": {"snr": 3.0}}) + "\n\n"
+        + json.dumps({"run_id": "b", "metrics": {"snr": float("inf")}}) + "\n"
+    )
+
+    runs = _read_runs(log_file)
+
+    assert [run["run_id"] for run in runs] == ["a", "b"]
+    assert runs[1]["metrics"]["snr"] == math.inf
+
+
+def test_cli_evaluate_writes_infinite_snr(tmp_path: Path):
+    """Test that evaluate --output keeps the infinite SNR of a perfect reconstruction."""
+    np = pytest.importorskip("numpy")
+    from typer.testing import CliRunner
+    from promethium.cli import app
+
+    data = np.random.default_rng(0).standard_normal((8, 32))
+    np.save(tmp_path / "ref.npy", data)
+    np.save(tmp_path / "est.npy", data)
+    output = tmp_path / "metrics.json"
+
+    result = CliRunner().invoke(app, [
+        "evaluate", str(tmp_path / "ref.npy"), str(tmp_path / "est.npy"),
+        "--metrics", "snr,mse", "--output", str(output),
+    ])
+
+    assert result.exit_code == 0, result.output
+    metrics = json.loads(output.read_text())
+    assert metrics["snr"] == math.inf
+    assert metrics["mse"] == 0.0
+
+
+def test_cli_export_json_keeps_infinite_metrics(tmp_path: Path):
+    """Test that experiments export --format json writes back the Infinity it read."""
+    from typer.testing import CliRunner
+    from promethium.cli import app
+
+    (tmp_path / "exp.jsonl").write_text(
+        json.dumps({"run_id": "a", "metrics": {"snr": float("inf")}}) + "\n"
+    )
+    output = tmp_path / "export.json"
+
+    result = CliRunner().invoke(app, [
+        "experiments", "export", "exp", "--format", "json",
+        "--output", str(output), "--dir", str(tmp_path),
+    ])
+
+    assert result.exit_code == 0, result.output
+    assert json.loads(output.read_text())[0]["metrics"]["snr"] == math.inf
+
+
+def test_cli_db_commands_report_missing_alembic(monkeypatch):
+    """Test that db commands print an install hint when alembic is missing."""
+    from typer.testing import CliRunner
+    from promethium.cli import app
+
+    monkeypatch.setitem(sys.modules, "alembic", None)
+
+    result = CliRunner().invoke(app, ["db", "upgrade"])
+
+    assert result.exit_code == 1
+    assert "Alembic is not installed" in result.output
+
+
+def test_cli_db_upgrade_sql_only_prints_sql(monkeypatch):
+    """Test that db upgrade --sql emits SQL without claiming the database was upgraded."""
+    pytest.importorskip("alembic")
+    from typer.testing import CliRunner
+    from promethium import cli
+
+    config = cli._alembic_config()
+    config.set_main_option("sqlalchemy.url", "postgresql://user@localhost/promethium")
+    monkeypatch.setattr(cli, "_alembic_config", lambda: config)
+
+    result = CliRunner().invoke(cli.app, ["db", "upgrade", "--sql"])
+
+    assert result.exit_code == 0, result.output
+    assert "CREATE TABLE users" in result.output
+    assert "Database upgraded" not in result.output
@@ -0,0 +1,150 @@
+"""
+Promethium Migration Tests
+
+Tests for the Alembic revisions that manage the API database schema.
+"""
+
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("alembic")
+pytest.importorskip("aiosqlite")
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    """Return the path of a fresh SQLite database."""
+    return tmp_path / "promethium.db"
+
+
+def _alembic_config(db_path: Path):
+    """Alembic config for the bundled migrations, as ``promethium db`` builds it."""
+    from alembic.config import Config
+    import promethium.migrations
+
+    config = Config()
+    config.set_main_option("script_location", str(Path(promethium.migrations.__file__).parent))
+    config.set_main_option("sqlalchemy.url", f"sqlite+aiosqlite:///{db_path}")
+    return config
+
+
+def test_upgrade_creates_every_table(db_path: Path):
+    """Test that upgrading a fresh database creates every model table."""
+    from alembic import command
+    from sqlalchemy import create_engine, inspect
+    from promethium.api.models import Base
+
+    command.upgrade(_alembic_config(db_path), "heads")
+
+    engine = create_engine(f"sqlite:///{db_path}")
+    try:
+        tables = set(inspect(engine).get_table_names())
+    finally:
+        engine.dispose()
+    assert set(Base.metadata.tables) <= tables
+
+
+def test_upgraded_schema_fills_defaults(db_path: Path):
+    """Test that rows inserted through the models get server-side defaults."""
+    from alembic import command
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+    from promethium.api.models import Dataset, Experiment, Job, User
+
+    command.upgrade(_alembic_config(db_path), "heads")
+
+    engine = create_engine(f"sqlite:///{db_path}")
+    try:
+        with Session(engine) as session:
+            user = User(email="a@example.com", hashed_password="x", full_name="A")
+            session.add(user)
+            session.flush()
+            dataset = Dataset(name="d", file_path="/tmp/d.sgy", format="SEGY", owner_id=user.id)
+            experiment = Experiment(name="e", owner_id=user.id)
+            job = Job()
+            session.add_all([dataset, experiment, job])
+            session.commit()
+
+            assert user.created_at is not None
+            assert dataset.metadata_json == {}
+            assert experiment.tags == []
+            assert job.params == {} and job.metrics == {}
+            assert job.created_at is not None
+    finally:
+        engine.dispose()
+
+
+def test_upgraded_schema_matches_emails_case_insensitively(db_path: Path):
+    """Test that the email unique index ignores case after upgrading."""
+    from alembic import command
+    from sqlalchemy import create_engine, select
+    from sqlalchemy.exc import IntegrityError
+    from sqlalchemy.orm import Session
+    from promethium.api.models import User
+
+    command.upgrade(_alembic_config(db_path), "heads")
+
+    engine = create_engine(f"sqlite:///{db_path}")
+    try:
+        with Session(engine) as session:
+            session.add(User(email="Ada@Example.com", hashed_password="x", full_name="Ada"))
+            session.commit()
+
+            found = session.scalars(select(User).where(User.email == "ada@example.com")).one()
+            assert found.full_name == "Ada"
+
+            session.add(User(email="ADA@EXAMPLE.COM", hashed_password="y", full_name="Ada 2"))
+            with pytest.raises(IntegrityError):
+                session.commit()
+    finally:
+        engine.dispose()
+
+
+def test_upgrade_converts_existing_job_ids(db_path: Path):
+    """Test that jobs created before the UUID revision are still found through the models."""
+    import uuid
+    from alembic import command
+    from alembic.autogenerate import compare_metadata
+    from alembic.migration import MigrationContext
+    from sqlalchemy import create_engine, select, text
+    from sqlalchemy.orm import Session
+    from promethium.api.models import Base, Job, Result
+
+    job_id = uuid.uuid4()
+    config = _alembic_config(db_path)
+    command.upgrade(config, "8d2f6a1c4e07")
+
+    engine = create_engine(f"sqlite:///{db_path}")
+    try:
+        with engine.begin() as conn:
+            conn.execute(text(
+                "INSERT INTO jobs (id, type, status, params, progress, metrics, created_at) "
+                "VALUES (:id, 'pipeline_run', 'completed', '{}', 100, '{}', '2026-01-01 00:00:00')"
+            ), {"id": str(job_id)})
+            conn.execute(text(
+                "INSERT INTO results (job_id, result_path, metrics, metadata_json, created_at) "
+                "VALUES (:id, '/tmp/out.npy', '{}', '{}', '2026-01-01 00:00:00')"
+            ), {"id": str(job_id)})
+
+        command.upgrade(config, "heads")
+
+        with Session(engine) as session:
+            assert session.get(Job, job_id).status == "completed"
+            result = session.scalars(select(Result).where(Result.job_id == job_id)).one()
+            assert result.result_path == "/tmp/out.npy"
+
+        with engine.connect() as conn:
+            diffs = compare_metadata(MigrationContext.configure(conn), Base.metadata)
+        # Column changes come back as lists of ("modify_...", ...) tuples
+        changes = [change for diff in diffs if isinstance(diff, list) for change in diff]
+        retyped = {(change[2], change[3]) for change in changes if change[0] == "modify_type"}
+        assert not retyped & {("jobs", "id"), ("results", "job_id")}
+
+        command.downgrade(config, "8d2f6a1c4e07")
+
+        with engine.connect() as conn:
+            assert conn.execute(text("SELECT id FROM jobs")).scalar() == str(job_id)
+            assert conn.execute(text("SELECT job_id FROM results")).scalar() == str(job_id)
+    finally:
+        engine.dispose()
@@ -54,3 +54,14 @@ def test_numpy_to_tensor_conversion():
     
     back_to_numpy = tensor.numpy()
     np.testing.assert_array_almost_equal(data, back_to_numpy)
+
+
+def test_predict_tiled_without_parameters():
+    """Test that tiled inference runs a parameterless model, as a quantized one is, on the CPU."""
+    from promethium.ml.inference import predict_tiled
+    
+    data = np.random.randn(40, 56).astype(np.float32)
+    
+    result = predict_tiled(torch.nn.Identity(), data, patch_size=16, batch_size=4)
+    
+    np.testing.assert_allclose(result, data, rtol=1e-5, atol=1e-5)
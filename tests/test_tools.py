@@ -0,0 +1,85 @@
+"""
+Promethium Tools Tests
+
+Tests for the standalone scripts under tools/.
+"""
+
+import json
+import math
+import sys
+from pathlib import Path
+
+# tools/ lives at the project root, next to src/
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+# ============================================================================
+# Pipeline runner
+# ============================================================================
+
+def test_pipeline_runner_saves_infinite_snr(tmp_path: Path):
+    """Test that save_results writes an infinite SNR as Infinity, not null."""
+    from tools.pipeline_runner import save_results
+
+    config = {
+        "pipeline": {"name": "p"},
+        "output": {"path": str(tmp_path), "save_reconstructed": False},
+    }
+
+    output_dir = save_results(None, {"snr": float("inf"), "mse": 0.0}, config)
+
+    (metrics_file,) = output_dir.glob("metrics_*.json")
+    assert json.loads(metrics_file.read_text())["metrics"]["snr"] == math.inf
+
+
+# ============================================================================
+# Experiment logger
+# ============================================================================
+
+def test_experiment_logger_reads_non_finite_legacy_log(tmp_path: Path):
+    """Test that logs holding NaN/Infinity, as the stdlib writes them, still load."""
+    from tools.experiment_logger import ExperimentLogger
+
+    legacy = {"run_id": "old", "metrics": {"snr": float("inf"), "mse": float("nan")}}
+    (tmp_path / "exp.jsonl").write_text(json.dumps(legacy) + "\n")
+
+    runs = ExperimentLogger("exp", logs_dir=tmp_path).get_runs()
+
+    assert runs[0]["metrics"]["snr"] == math.inf
+    assert math.isnan(runs[0]["metrics"]["mse"])
+
+
+def test_experiment_logger_keeps_infinite_metrics(tmp_path: Path):
+    """Test that an inf SNR survives a round trip and ranks as the best run."""
+    from tools.experiment_logger import ExperimentLogger
+
+    logger = ExperimentLogger("exp", logs_dir=tmp_path)
+    logger.start_run()
+    logger.log_metrics({"snr": 12.0})
+    logger.end_run()
+    perfect = logger.start_run()
+    logger.log_metrics({"snr": float("inf")})
+    logger.end_run()
+    logger.close()
+
+    reread = ExperimentLogger("exp", logs_dir=tmp_path)
+    assert reread.get_runs()[1]["metrics"]["snr"] == math.inf
+    assert reread.get_best_run("snr")["run_id"] == perfect
+
+
+def test_experiment_logger_writes_each_run_when_it_ends(tmp_path: Path):
+    """Test that runs reach the log file on end_run unless batching is enabled."""
+    from tools.experiment_logger import ExperimentLogger
+
+    logger = ExperimentLogger("exp", logs_dir=tmp_path)
+    logger.start_run()
+    logger.end_run()
+    assert len((tmp_path / "exp.jsonl").read_bytes().splitlines()) == 1
+    logger.close()
+
+    batched = ExperimentLogger("batched", logs_dir=tmp_path, flush_on_end_run=False, flush_interval=60.0)
+    batched.start_run()
+    batched.end_run()
+    assert not (tmp_path / "batched.jsonl").exists()
+    batched.close()
+    assert len((tmp_path / "batched.jsonl").read_bytes().splitlines()) == 1
@@ -13,24 +13,116 @@ Usage:
     logger.log_metrics({"snr": 18.5, "mse": 0.002})
     logger.end_run()
 """
+import atexit
 import json
+import math
 import os
-import uuid
+import secrets
+import time
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, BinaryIO, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib
+    orjson = None
+
+
+def _all_finite(obj: Any) -> bool:
+    """Whether no float in ``obj`` (nested dicts, lists, NumPy values) is NaN or inf."""
+    if isinstance(obj, dict):
+        return all(_all_finite(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return all(_all_finite(v) for v in obj)
+    if isinstance(obj, float):
+        return math.isfinite(obj)
+    if hasattr(obj, "tolist"):  # NumPy scalar or array
+        return _all_finite(obj.tolist())
+    return True
+
+
+def _to_builtin(obj: Any) -> Any:
+    """``json.dumps`` hook for NumPy scalars and arrays."""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj: Any) -> bytes:
+    """
+    Serialize ``obj`` to JSON bytes, with orjson when it is installed.
+    
+    NumPy values are accepted. orjson would write NaN and inf as null, so
+    runs holding them (an inf SNR for a perfect reconstruction) go through
+    the stdlib, which writes NaN/Infinity as the log always has.
+    """
+    if orjson is not None and _all_finite(obj):
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=_to_builtin).encode()
+
+
+def _loads(data: bytes) -> Any:
+    """Parse one JSON document from bytes, including NaN/Infinity literals."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity the stdlib writes
+            pass
+    return json.loads(data)
+
+
+_NEG_INF = float("-inf")
+_POS_INF = float("inf")
+
+# With batching enabled, finished runs are written when this many are pending...
+DEFAULT_BATCH_SIZE = 64
+# ...or when a run ends this many seconds after the last write
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+
+def _append_point(
+    run_metrics: Dict[str, Any], key: str, step: int, value: float, timestamp: str
+) -> None:
+    """Append one point to the ``key`` time series of ``run_metrics``."""
+    series = run_metrics.setdefault(key, {"step": [], "value": [], "timestamp": []})
+    series["step"].append(step)
+    series["value"].append(value)
+    series["timestamp"].append(timestamp)
 
 
 class ExperimentLogger:
-    """Lightweight experiment logger using JSON-lines format."""
+    """
+    Lightweight experiment logger using JSON-lines format.
+    
+    Each run is appended through one open file as soon as it ends. Pass
+    ``flush_on_end_run=False`` to buffer finished runs and write them in
+    batches instead; pending runs are then written by :meth:`flush`,
+    :meth:`close`, any read of the log, and at interpreter exit, so a
+    crash can lose the runs of the last batch.
+    """
     
     DEFAULT_LOGS_DIR = Path("experiments/logs")
     
+    __slots__ = (
+        "experiment_id", "logs_dir", "log_file",
+        "batch_size", "flush_interval", "flush_on_end_run",
+        "_current_run", "_run_id", "_run_t0",
+        "_pending", "_fh", "_last_flush", "_at_exit",
+        "_runs_cache", "_cache_offset", "_cache_key",
+        "__weakref__",
+    )
+    
     def __init__(
         self,
         experiment_id: str,
         logs_dir: Optional[Path] = None,
         auto_create: bool = True,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        flush_on_end_run: bool = True,
     ):
         """
         Initialize experiment logger.
@@ -39,6 +131,11 @@ class ExperimentLogger:
             experiment_id: Unique identifier for this experiment.
             logs_dir: Directory for log files. Defaults to experiments/logs.
             auto_create: Whether to create logs directory if it doesn't exist.
+            batch_size: Pending runs that trigger a write when batching.
+            flush_interval: Seconds after the last write at which ending a
+                run triggers a write when batching.
+            flush_on_end_run: Write each run as soon as it ends. Set to
+                False to batch writes.
         """
         self.experiment_id = experiment_id
         self.logs_dir = logs_dir or self.DEFAULT_LOGS_DIR
@@ -48,9 +145,28 @@ class ExperimentLogger:
         
         self.log_file = self.logs_dir / f"{experiment_id}.jsonl"
         
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.flush_on_end_run = flush_on_end_run
+        
         # Current run state
         self._current_run: Optional[Dict[str, Any]] = None
         self._run_id: Optional[str] = None
+        # Monotonic clock at start_run, for the run's duration
+        self._run_t0 = 0.0
+        
+        # Serialized runs not yet written, and the log's append handle
+        self._pending: List[bytes] = []
+        self._fh: Optional[BinaryIO] = None
+        self._last_flush = time.monotonic()
+        # Whether close() is registered to run at interpreter exit
+        self._at_exit = False
+        
+        # Runs parsed so far, the log offset parsed up to, and the log's
+        # (inode, mtime) when last read
+        self._runs_cache: List[Dict[str, Any]] = []
+        self._cache_offset = 0
+        self._cache_key: Optional[tuple] = None
     
     def start_run(
         self,
@@ -71,7 +187,8 @@ class ExperimentLogger:
         Returns:
             Unique run ID.
         """
-        self._run_id = str(uuid.uuid4())[:8]
+        # 8 hex chars, as before, without formatting a whole UUID
+        self._run_id = secrets.token_hex(4)
         
         self._current_run = {
             "run_id": self._run_id,
@@ -88,6 +205,7 @@ class ExperimentLogger:
             "status": "running",
             "error": None,
         }
+        self._run_t0 = time.monotonic()
         
         return self._run_id
     
@@ -111,7 +229,10 @@ class ExperimentLogger:
             key: Parameter name.
             value: Parameter value.
         """
-        self.log_params({key: value})
+        if self._current_run is None:
+            raise RuntimeError("No active run. Call start_run() first.")
+        
+        self._current_run["parameters"][key] = value
     
     def log_metrics(self, metrics: Dict[str, float], step: Optional[int] = None) -> None:
         """
@@ -125,15 +246,12 @@ class ExperimentLogger:
             raise RuntimeError("No active run. Call start_run() first.")
         
         if step is not None:
-            # Store as time series
+            # Store as time series, one column per field; all points of one
+            # call share a timestamp
+            timestamp = datetime.now().isoformat()
+            run_metrics = self._current_run["metrics"]
             for key, value in metrics.items():
-                if key not in self._current_run["metrics"]:
-                    self._current_run["metrics"][key] = []
-                self._current_run["metrics"][key].append({
-                    "step": step,
-                    "value": value,
-                    "timestamp": datetime.now().isoformat(),
-                })
+                _append_point(run_metrics, key, step, value, timestamp)
         else:
             # Store as final metrics
             self._current_run["metrics"].update(metrics)
@@ -147,7 +265,15 @@ class ExperimentLogger:
             value: Metric value.
             step: Optional step number.
         """
-        self.log_metrics({key: value}, step=step)
+        if self._current_run is None:
+            raise RuntimeError("No active run. Call start_run() first.")
+        
+        if step is not None:
+            _append_point(
+                self._current_run["metrics"], key, step, value, datetime.now().isoformat()
+            )
+        else:
+            self._current_run["metrics"][key] = value
     
     def log_artifact(self, path: str, artifact_type: str = "file") -> None:
         """
@@ -168,7 +294,7 @@ class ExperimentLogger:
     
     def end_run(self, status: str = "completed", error: Optional[str] = None) -> None:
         """
-        End the current run and write to log file.
+        End the current run and queue it for the log file.
         
         Args:
             status: Run status (completed, failed, cancelled).
@@ -180,34 +306,82 @@ class ExperimentLogger:
         self._current_run["end_time"] = datetime.now().isoformat()
         self._current_run["status"] = status
         self._current_run["error"] = error
+        # Monotonic, so wall-clock adjustments during the run don't skew it
+        self._current_run["duration_seconds"] = time.monotonic() - self._run_t0
         
-        # Calculate duration
-        start = datetime.fromisoformat(self._current_run["start_time"])
-        end = datetime.fromisoformat(self._current_run["end_time"])
-        self._current_run["duration_seconds"] = (end - start).total_seconds()
-        
-        # Write to log file
-        with open(self.log_file, "a") as f:
-            f.write(json.dumps(self._current_run) + "\n")
+        # Queue for the log file
+        self._pending.append(_dumps(self._current_run) + b"\n")
+        if not self._at_exit:
+            atexit.register(self.close)
+            self._at_exit = True
         
         # Reset state
         self._current_run = None
         self._run_id = None
+        
+        if (
+            self.flush_on_end_run
+            or len(self._pending) >= self.batch_size
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.flush()
+    
+    def flush(self) -> None:
+        """Write pending runs to the log file."""
+        self._last_flush = time.monotonic()
+        if not self._pending:
+            return
+        if self._fh is None:
+            self._fh = open(self.log_file, "ab")
+        self._fh.write(b"".join(self._pending))
+        self._fh.flush()
+        self._pending.clear()
+    
+    def close(self) -> None:
+        """Write pending runs and close the log file."""
+        self.flush()
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+        if self._at_exit:
+            atexit.unregister(self.close)
+            self._at_exit = False
     
     def get_runs(self) -> list:
         """
         Get all runs for this experiment.
         
+        Parsed runs are cached: later calls parse only lines appended since
+        the last one, and re-read the log from the start only if it was
+        replaced or truncated. The run dicts are shared with the cache, so
+        treat them as read-only.
+        
         Returns:
             List of run dictionaries.
         """
-        runs = []
-        if self.log_file.exists():
-            with open(self.log_file, "r") as f:
-                for line in f:
-                    if line.strip():
-                        runs.append(json.loads(line))
-        return runs
+        self.flush()
+        try:
+            st = self.log_file.stat()
+        except FileNotFoundError:
+            self._runs_cache, self._cache_offset, self._cache_key = [], 0, None
+            return []
+        
+        key = (st.st_ino, st.st_mtime_ns)
+        if key == self._cache_key and st.st_size == self._cache_offset:
+            return list(self._runs_cache)
+        if self._cache_key is None or st.st_ino != self._cache_key[0] or st.st_size < self._cache_offset:
+            # First read, or the log was replaced or truncated
+            self._runs_cache, self._cache_offset = [], 0
+        
+        with open(self.log_file, "rb") as f:
+            f.seek(self._cache_offset)
+            data = f.read()
+        # A trailing partial line is left for the next call
+        end = data.rfind(b"\n") + 1
+        self._runs_cache.extend(_loads(line) for line in data[:end].splitlines() if line.strip())
+        self._cache_offset += end
+        self._cache_key = key
+        return list(self._runs_cache)
     
     def get_best_run(self, metric: str, maximize: bool = True) -> Optional[Dict]:
         """
@@ -220,18 +394,22 @@ class ExperimentLogger:
         Returns:
             Best run dictionary or None if no runs found.
         """
-        runs = self.get_runs()
-        if not runs:
-            return None
-        
-        def get_metric_value(run: Dict) -> float:
+        # Runs without the metric rank last; on ties the earliest run wins
+        missing = _NEG_INF if maximize else _POS_INF
+        best_run, best_val = None, missing
+        for run in self.get_runs():
             val = run.get("metrics", {}).get(metric)
-            if isinstance(val, list):
+            if type(val) is dict:
                 # Time series - get last value
-                return val[-1]["value"] if val else float('-inf' if maximize else 'inf')
-            return val if val is not None else float('-inf' if maximize else 'inf')
-        
-        return max(runs, key=get_metric_value) if maximize else min(runs, key=get_metric_value)
+                val = val["value"][-1] if val["value"] else missing
+            elif type(val) is list:
+                # Time series in the older list-of-points format
+                val = val[-1]["value"] if val else missing
+            elif val is None:
+                val = missing
+            if best_run is None or (val > best_val if maximize else val < best_val):
+                best_run, best_val = run, val
+        return best_run
     
     def get_summary(self) -> Dict[str, Any]:
         """
@@ -254,24 +432,25 @@ class ExperimentLogger:
         failed = [r for r in runs if r.get("status") == "failed"]
         
         # Aggregate metrics across completed runs
-        metric_values = {}
+        metric_values = defaultdict(list)
         for run in completed:
             for key, value in run.get("metrics", {}).items():
                 if isinstance(value, (int, float)):
-                    if key not in metric_values:
-                        metric_values[key] = []
                     metric_values[key].append(value)
         
-        # Calculate statistics
+        # Calculate statistics, in C when NumPy is available
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
         metric_stats = {}
         for key, values in metric_values.items():
-            if values:
-                metric_stats[key] = {
-                    "mean": sum(values) / len(values),
-                    "min": min(values),
-                    "max": max(values),
-                    "count": len(values),
-                }
+            if np is not None:
+                arr = np.fromiter(values, dtype=np.float64, count=len(values))
+                mean, lo, hi = float(arr.mean()), float(arr.min()), float(arr.max())
+            else:
+                mean, lo, hi = sum(values) / len(values), min(values), max(values)
+            metric_stats[key] = {"mean": mean, "min": lo, "max": hi, "count": len(values)}
         
         return {
             "experiment_id": self.experiment_id,
@@ -288,6 +467,8 @@ class ExperimentLogger:
 class ExperimentRun:
     """Context manager for experiment runs."""
     
+    __slots__ = ("logger", "kwargs", "run_id")
+    
     def __init__(self, logger: ExperimentLogger, **kwargs):
         self.logger = logger
         self.kwargs = kwargs
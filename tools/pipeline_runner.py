@@ -9,16 +9,73 @@ Usage:
     
     result = run_pipeline_from_config("configs/pipelines/unet_denoising.yaml")
 """
+import copy
+import importlib
+import os
+import time
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 import yaml
 from pathlib import Path
+from types import ModuleType
 from typing import Any, Dict, Optional, Tuple
-from datetime import datetime
+
+try:
+    # LibYAML's parser; same safe semantics, far less Python per node
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# promethium modules, imported on first use: they pull in torch, which
+# would make importing the tools package slow
+_module_cache: Dict[str, ModuleType] = {}
+
+# Evaluation references by absolute path, with the mtime_ns they were
+# mapped at; shared read-only between runs
+_reference_cache: Dict[str, Tuple[int, np.ndarray]] = {}
+
+# Validated configs by path, with the (mtime_ns, size) they were parsed at
+_config_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
+# Supported evaluation metrics, in output order
+EVALUATION_METRICS = ("snr", "mse", "psnr", "ssim")
+# Computed together by one error_metrics pass
+ERROR_METRICS = frozenset({"snr", "mse", "psnr"})
+
+
+def _as_ndarray(data: Any) -> np.ndarray:
+    """
+    Array view of reconstructed data: an ndarray as-is, a dataset's
+    ``traces`` or an xarray's ``values``, or ``np.asarray`` of anything else.
+    """
+    if isinstance(data, np.ndarray):
+        return data
+    traces = getattr(data, "traces", None)
+    if traces is not None:
+        return traces
+    values = getattr(data, "values", None)
+    if values is not None:
+        return values
+    return np.asarray(data)
+
+
+def _lazy_import(name: str) -> ModuleType:
+    """Import a module once and serve later lookups from a module-level cache."""
+    module = _module_cache.get(name)
+    if module is None:
+        module = importlib.import_module(name)
+        _module_cache[name] = module
+    return module
 
 
 def load_config(config_path: Path) -> Dict[str, Any]:
     """
     Load and validate a pipeline configuration file.
     
+    Parsed configs are cached until the file's mtime or size changes;
+    callers get a deep copy, so they may modify it freely.
+    
     Args:
         config_path: Path to YAML configuration file.
         
@@ -28,8 +85,14 @@ def load_config(config_path: Path) -> Dict[str, Any]:
     Raises:
         ValueError: If configuration is invalid.
     """
-    with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
+    st = Path(config_path).stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _config_cache.get(str(config_path))
+    if cached is not None and cached[0] == stamp:
+        return copy.deepcopy(cached[1])
+    
+    with open(config_path, "rb") as f:
+        config = yaml.load(f, Loader=SafeLoader)
     
     # Validate required sections
     required = ["pipeline", "input", "model", "output"]
@@ -37,7 +100,30 @@ def load_config(config_path: Path) -> Dict[str, Any]:
     if missing:
         raise ValueError(f"Missing required config sections: {missing}")
     
-    return config
+    _config_cache[str(config_path)] = (stamp, config)
+    return copy.deepcopy(config)
+
+
+def clear_reference_cache() -> None:
+    """Drop the evaluation references cached by :func:`run_evaluation`."""
+    _reference_cache.clear()
+
+
+def _load_reference(ref_path: str) -> np.ndarray:
+    """
+    Memory-map a reference array, reusing the mapping from an earlier run
+    while the file is unchanged. The array is read-only.
+    """
+    path = os.path.abspath(ref_path)
+    mtime = os.stat(path).st_mtime_ns
+    cached = _reference_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    # Memory-mapped: the metrics are reductions that stream through it, so
+    # the reference never needs to be resident in full
+    reference = np.load(path, mmap_mode="r")
+    _reference_cache[path] = (mtime, reference)
+    return reference
 
 
 def build_pipeline(config: Dict[str, Any]):
@@ -50,7 +136,7 @@ def build_pipeline(config: Dict[str, Any]):
     Returns:
         Configured pipeline object.
     """
-    from promethium.pipelines.recovery import SeismicRecoveryPipeline
+    SeismicRecoveryPipeline = _lazy_import("promethium.pipelines.recovery").SeismicRecoveryPipeline
     
     pipeline_name = config["pipeline"]["name"]
     pipeline_type = config["pipeline"].get("type", "classical")
@@ -78,7 +164,7 @@ def load_data(config: Dict[str, Any]):
     Returns:
         SeismicDataset object.
     """
-    from promethium.io.readers import load_seismic_data
+    load_seismic_data = _lazy_import("promethium.io.readers").load_seismic_data
     
     input_config = config["input"]
     input_path = input_config["path"]
@@ -102,13 +188,7 @@ def run_evaluation(
     Returns:
         Dictionary of metric names to values.
     """
-    import numpy as np
-    from promethium.evaluation.metrics import (
-        signal_to_noise_ratio,
-        mean_squared_error,
-        peak_signal_to_noise_ratio,
-        structural_similarity_index,
-    )
+    metrics_module = _lazy_import("promethium.evaluation.metrics")
     
     eval_config = config.get("evaluation", {})
     ref_path = eval_config.get("reference_path")
@@ -116,34 +196,33 @@ def run_evaluation(
     if not ref_path:
         return {}
     
-    # Load reference data
-    reference = np.load(ref_path)
-    
-    # Get data as numpy array
-    if hasattr(reconstructed, "traces"):
-        recon_data = reconstructed.traces
-    elif hasattr(reconstructed, "values"):
-        recon_data = reconstructed.values
+    # Load reference data (cached across runs; treat as read-only)
+    reference = _load_reference(ref_path)
+    
+    recon_data = _as_ndarray(reconstructed)
+    
+    # Compute metrics: SNR/MSE/PSNR share one pass over the arrays, SSIM
+    # is independent of it. Unknown names are ignored.
+    wanted = frozenset(eval_config.get("metrics", ("snr", "mse")))
+    tasks = []
+    if wanted & ERROR_METRICS:
+        tasks.append(lambda: metrics_module.error_metrics(reference, recon_data))
+    if "ssim" in wanted:
+        tasks.append(lambda: {
+            "ssim": metrics_module.structural_similarity_index(reference, recon_data)
+        })
+    
+    if len(tasks) > 1:
+        # NumPy and torch release the GIL in their kernels, so the passes overlap
+        with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
+            results = [future.result() for future in [pool.submit(task) for task in tasks]]
     else:
-        recon_data = np.array(reconstructed)
+        results = [task() for task in tasks]
     
-    # Compute metrics
-    metrics = {}
-    metric_list = eval_config.get("metrics", ["snr", "mse"])
-    
-    if "snr" in metric_list:
-        metrics["snr"] = float(signal_to_noise_ratio(reference, recon_data))
-    
-    if "mse" in metric_list:
-        metrics["mse"] = float(mean_squared_error(reference, recon_data))
-    
-    if "psnr" in metric_list:
-        metrics["psnr"] = float(peak_signal_to_noise_ratio(reference, recon_data))
-    
-    if "ssim" in metric_list:
-        metrics["ssim"] = float(structural_similarity_index(reference, recon_data))
-    
-    return metrics
+    computed = {}
+    for result in results:
+        computed.update(result)
+    return {name: float(computed[name]) for name in EVALUATION_METRICS if name in wanted}
 
 
 def save_results(
@@ -162,35 +241,30 @@ def save_results(
     Returns:
         Path to output directory.
     """
-    import json
-    import numpy as np
-    from promethium.io.writers import save_seismic_data
-    
     output_config = config["output"]
     output_dir = Path(output_config["path"])
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
     
     # Save reconstructed data
     if output_config.get("save_reconstructed", True):
         output_format = output_config.get("format", "npy")
         if output_format == "npy":
-            if hasattr(reconstructed, "traces"):
-                np.save(output_dir / f"reconstructed_{timestamp}.npy", reconstructed.traces)
-            else:
-                np.save(output_dir / f"reconstructed_{timestamp}.npy", reconstructed)
+            np.save(output_dir / f"reconstructed_{timestamp}.npy", _as_ndarray(reconstructed))
         else:
+            save_seismic_data = _lazy_import("promethium.io.writers").save_seismic_data
             save_seismic_data(reconstructed, str(output_dir / f"reconstructed_{timestamp}.{output_format}"))
     
     # Save metrics
     if output_config.get("save_metrics", True) and metrics:
-        with open(output_dir / f"metrics_{timestamp}.json", "w") as f:
-            json.dump({
-                "timestamp": timestamp,
-                "pipeline": config["pipeline"]["name"],
-                "metrics": metrics,
-            }, f, indent=2)
+        # Same encoder as the CLI: an infinite SNR is written as Infinity
+        dumps = _lazy_import("promethium.core.serialization").dumps
+        (output_dir / f"metrics_{timestamp}.json").write_bytes(dumps({
+            "timestamp": timestamp,
+            "pipeline": config["pipeline"]["name"],
+            "metrics": metrics,
+        }, indent=True))
     
     return output_dir
 